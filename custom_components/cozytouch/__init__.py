@@ -12,7 +12,15 @@ from homeassistant.exceptions import ConfigEntryNotReady
 import homeassistant.helpers.config_validation as cv
 
 from . import hub
-from .const import CONF_DUMPJSON, DOMAIN
+from .const import (
+    CONF_DUMPJSON,
+    CONF_POLL_INTERVAL_MAX,
+    CONF_STALE_THRESHOLD,
+    DATA_HUBS,
+    DOMAIN,
+    POLL_INTERVAL_MAX,
+    STALE_THRESHOLD,
+)
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
@@ -35,31 +43,78 @@ SCAN_INTERVAL = timedelta(seconds=10)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Atlantic Cozytouch from a config entry."""
-    theHub = hub.Hub(
-        hass, entry.data["username"], entry.data["password"], entry.data["deviceId"]
+    # All devices of an account share the same hub
+    hubs = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_HUBS, {})
+    hubKey = entry.data["username"].lower()
+    theHub = hubs.get(hubKey)
+    if theHub is None:
+        theHub = hub.Hub(hass, entry.data["username"], entry.data["password"])
+        hubs[hubKey] = theHub
+
+    # Options of the options flow override the ones chosen with the device,
+    # account options are set by the last configured device of the account
+    options = {**entry.data, **entry.options}
+    theHub.set_dump_json(options.get("dump_json", False))
+    theHub.set_poll_interval_max(
+        options.get(CONF_POLL_INTERVAL_MAX, POLL_INTERVAL_MAX)
     )
-
-    if "dump_json" in entry.data:
-        theHub.set_dump_json(entry.data["dump_json"])
-
-    await theHub.connect()
-    if not theHub.online:
-        # tells HA to retry setup with exponential backoff until the network is available
-        raise ConfigEntryNotReady("Cannot connect to Atlantic Cozytouch API")
-
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = theHub
-
-    theHub.set_create_entities_for_unknown_entities(entry.data["create_unknown"])
-    await theHub.async_config_entry_first_refresh()
+    theHub.set_stale_threshold(options.get(CONF_STALE_THRESHOLD, STALE_THRESHOLD))
+
+    # Entities are created from the topology of the last run if it is known,
+    # the API is only waited for when the device is not cached
+    await theHub.async_load_topology()
+    cached = theHub.has_device(entry.data["deviceId"])
+    if not cached:
+        await theHub.connect()
+        if not theHub.online:
+            # tells HA to retry setup with exponential backoff until the network is available
+            raise ConfigEntryNotReady("Cannot connect to Atlantic Cozytouch API")
+
+    device = theHub.get_device(entry.data["deviceId"])
+    hass.data[DOMAIN][entry.entry_id] = device
+
+    device.set_create_entities_for_unknown_entities(options["create_unknown"])
+    if cached:
+        device.async_set_updated_data(theHub.data)
+        entry.async_create_background_task(
+            hass, theHub.async_request_refresh(), "cozytouch_refresh"
+        )
+    else:
+        await device.async_config_entry_first_refresh()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        device = hass.data[DOMAIN].pop(entry.entry_id)
+        theHub = device.hub
+
+        # Close the account hub with its last device
+        if theHub.remove_device(device.device_id):
+            hass.data[DOMAIN][DATA_HUBS].pop(entry.data["username"].lower(), None)
+            await theHub.close()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data stored for the account with its last config entry."""
+    username = entry.data["username"].lower()
+    for otherEntry in hass.config_entries.async_entries(DOMAIN):
+        if (
+            otherEntry.entry_id != entry.entry_id
+            and otherEntry.data["username"].lower() == username
+        ):
+            return
+
+    await hub.async_remove_account_data(hass, entry.data["username"])
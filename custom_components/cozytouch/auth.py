@@ -0,0 +1,262 @@
+"""Atlantic Cozytouch authentication."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime
+import logging
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, ContentTypeError, FormData
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.util import slugify
+
+from .breaker import CircuitBreaker
+from .const import COZYTOUCH_ATLANTIC_API, COZYTOUCH_CLIENT_ID, DOMAIN
+from .scheduler import PRIORITY_USER, RequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+LOGIN_TIMEOUT = ClientTimeout(total=30)
+
+# A token is no longer used TOKEN_EXPIRY_MARGIN seconds before it expires,
+# and is renewed in the background TOKEN_REFRESH_MARGIN seconds before
+TOKEN_EXPIRY_MARGIN = 60
+TOKEN_REFRESH_MARGIN = 300
+
+# Lifetime of a token if the server doesn't tell (in seconds)
+TOKEN_DEFAULT_LIFETIME = 3600
+
+TOKEN_STORAGE_VERSION = 1
+
+
+class LoginError(ClientError):
+    """Request not sent because no access token could be obtained."""
+
+
+def get_token_store(hass: HomeAssistant, username: str) -> Store:
+    """Get the store of the tokens of an account."""
+    return Store(
+        hass,
+        TOKEN_STORAGE_VERSION,
+        f"{DOMAIN}.token.{slugify(username.lower())}",
+        private=True,
+    )
+
+
+class TokenManager:
+    """Keep a valid access token for an account.
+
+    Logins are single-flight : concurrent callers wait for the same request
+    instead of sending their own. The token is renewed in the background
+    shortly before it expires, so polls and writes rarely wait for a login.
+    Renewals use the refresh token, the password is only sent when there is
+    none or it was rejected. Tokens are stored to be reused after a restart.
+    Token requests go through the scheduler and the circuit breaker of the
+    account, like the other requests.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: ClientSession,
+        username: str,
+        password: str,
+        breaker: CircuitBreaker,
+        scheduler: RequestScheduler,
+        accountId: str,
+    ) -> None:
+        """Init token manager."""
+        self._hass = hass
+        self._session = session
+        self._breaker = breaker
+        self._scheduler = scheduler
+        self._accountId = accountId
+        self._username = username
+        self._password = password
+        self._access_token: str | None = None
+        self._refresh_token: str | None = None
+        self._expiry: float = 0  # Unix timestamp
+        self._login_task: asyncio.Task | None = None
+        self._unsub_refresh: Callable[[], None] | None = None
+        self._store = get_token_store(hass, username)
+        self._loaded = False
+
+    @property
+    def access_token(self) -> str | None:
+        """Current access token, None if not logged in."""
+        return self._access_token
+
+    def is_valid(self) -> bool:
+        """Return True if the current token can still be used."""
+        return (
+            self._access_token is not None
+            and datetime.now(UTC).timestamp() < self._expiry - TOKEN_EXPIRY_MARGIN
+        )
+
+    async def async_get_token(self) -> str | None:
+        """Get a valid access token, login if needed, None on failure."""
+        if not self._loaded:
+            await self._async_load()
+
+        if self.is_valid():
+            return self._access_token
+
+        if await self.async_login():
+            return self._access_token
+
+        return None
+
+    async def async_renew(self, rejectedToken: str) -> str | None:
+        """Get a new access token after a request rejected rejectedToken."""
+        if self._access_token != rejectedToken and self.is_valid():
+            # Already renewed for another request
+            return self._access_token
+
+        if await self.async_login():
+            return self._access_token
+
+        return None
+
+    async def async_login(self) -> bool:
+        """Login, or wait for the login already in progress."""
+        if self._login_task is None or self._login_task.done():
+            self._login_task = self._hass.async_create_task(self._async_login())
+
+        # A cancelled caller must not cancel the login shared with others
+        return await asyncio.shield(self._login_task)
+
+    async def _async_load(self) -> None:
+        """Load the token stored before the last restart."""
+        self._loaded = True
+        data = await self._store.async_load()
+        if not isinstance(data, dict) or self._access_token is not None:
+            return
+
+        self._access_token = data.get("access_token", None)
+        self._refresh_token = data.get("refresh_token", None)
+        self._expiry = data.get("expiry", 0)
+        if self.is_valid():
+            _LOGGER.debug("Reusing stored token")
+            self._schedule_refresh()
+        else:
+            self._access_token = None
+
+    async def _async_login(self) -> bool:
+        token = None
+        if self._refresh_token is not None:
+            token = await self._async_request_token(
+                {"grant_type": "refresh_token", "refresh_token": self._refresh_token}
+            )
+            if token is None:
+                _LOGGER.info("Token refresh failed, login with password")
+                self._refresh_token = None
+
+        if token is None:
+            token = await self._async_request_token(
+                {
+                    "grant_type": "password",
+                    "scope": "openid",
+                    "username": "GA-PRIVATEPERSON/" + self._username,
+                    "password": self._password,
+                }
+            )
+
+        if token is None:
+            self._access_token = None
+            return False
+
+        self._access_token = token["access_token"]
+        # Keep the previous refresh token if the server doesn't rotate it
+        self._refresh_token = token.get("refresh_token", self._refresh_token)
+        self._expiry = datetime.now(UTC).timestamp() + token.get(
+            "expires_in", TOKEN_DEFAULT_LIFETIME
+        )
+        self._schedule_refresh()
+        await self._store.async_save(
+            {
+                "access_token": self._access_token,
+                "refresh_token": self._refresh_token,
+                "expiry": self._expiry,
+            }
+        )
+        return True
+
+    async def _async_request_token(self, data: dict[str, str]) -> dict | None:
+        """Request a token with a grant, None on failure."""
+        if self._breaker.get_retry_delay() > 0:
+            _LOGGER.debug("Login: circuit open, API considered down")
+            return None
+
+        # Every request waits for the login, it goes before queued polls
+        await self._scheduler.async_acquire(self._accountId, PRIORITY_USER)
+        try:
+            async with self._session.post(
+                COZYTOUCH_ATLANTIC_API + "/users/token",
+                data=FormData(data),
+                headers={
+                    "Authorization": f"Basic {COZYTOUCH_CLIENT_ID}",
+                    "Content-Type": "application/x-www-form-urlencoded",
+                },
+                timeout=LOGIN_TIMEOUT,
+            ) as response:
+                # A rejected grant is recorded once the error is known
+                rejected = 400 <= response.status < 500 and response.status != 429
+                if not rejected:
+                    self._breaker.record_response(response.status, response.headers)
+                token = await response.json()
+
+        except ContentTypeError as err:
+            _LOGGER.warning("Login: unexpected response: %s", err)
+            return None
+        except (ClientError, asyncio.TimeoutError) as err:
+            self._breaker.record_failure()
+            _LOGGER.warning("Login: network error: %s", err)
+            return None
+
+        if (
+            not isinstance(token, dict)
+            or "token_type" not in token
+            or "access_token" not in token
+        ):
+            if isinstance(token, dict) and token.get("error", "") == "invalid_grant":
+                _LOGGER.warning("Login: %s grant rejected", data["grant_type"])
+            else:
+                _LOGGER.warning("Login: unexpected response")
+
+            if rejected and data["grant_type"] == "password":
+                # Wrong credentials, logins back off like requests to a down API
+                self._breaker.record_failure()
+            return None
+
+        return token
+
+    def _schedule_refresh(self) -> None:
+        """Renew the token in the background before it expires."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+
+        lifetime = self._expiry - datetime.now(UTC).timestamp()
+        self._unsub_refresh = async_call_later(
+            self._hass,
+            max(lifetime - TOKEN_REFRESH_MARGIN, lifetime / 2, 0),
+            self._async_refresh,
+        )
+
+    async def _async_refresh(self, _now: datetime) -> None:
+        self._unsub_refresh = None
+        if not await self.async_login():
+            _LOGGER.info("Background token refresh failed, retrying on next request")
+
+    def close(self) -> None:
+        """Stop renewing the token."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+        if self._login_task is not None and not self._login_task.done():
+            self._login_task.cancel()
+        self._login_task = None
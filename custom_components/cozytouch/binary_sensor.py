@@ -13,8 +13,9 @@ from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .breaker import BREAKER_CLOSED
 from .const import DOMAIN
-from .hub import Hub
+from .hub import CozytouchDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,7 +38,12 @@ async def async_setup_entry(
         return
 
     async_add_entities(
-        [CloudConnectivity(coordinator, config_entry.title, config_entry.entry_id)],
+        [
+            CloudConnectivity(coordinator, config_entry.title, config_entry.entry_id),
+            CircuitBreakerProblem(
+                coordinator, config_entry.title, config_entry.entry_id
+            ),
+        ],
         True,
     )
 
@@ -50,7 +56,7 @@ class CloudConnectivity(CoordinatorEntity, BinarySensorEntity):
     _attr_name = "Cozytouch"
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
 
-    def __init__(self, coordinator: Hub, title: str, uniq_id: str) -> None:
+    def __init__(self, coordinator: CozytouchDevice, title: str, uniq_id: str) -> None:
         """Initialize the Cloud connectivity binary sensor."""
         super().__init__(coordinator)
         self._title = title
@@ -60,17 +66,53 @@ class CloudConnectivity(CoordinatorEntity, BinarySensorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device info."""
-        modelInfos = self.coordinator.get_model_infos()
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_uniq_id)},
-            manufacturer="Atlantic",
-            name=self._title,
-            model=modelInfos["name"],
-            serial_number=self.coordinator.get_serial_number(),
+            **{**self.coordinator.get_device_info(), "name": self._title},
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the hub and show the current state."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Polling diagnostics change on every poll, they are in the diagnostics
+        # of the config entry to not write a state each time
+        attributes = self.coordinator.get_staleness_attributes()
+        if (
+            self._attr_is_on != self.coordinator.online
+            or self.extra_state_attributes != attributes
+        ):
+            self._attr_is_on = self.coordinator.online
+            self._attr_extra_state_attributes = attributes
+            self.async_write_ha_state()
+
+
+class CircuitBreakerProblem(CloudConnectivity):
+    """Circuit breaker of the account, on while requests to the API are stopped."""
+
+    _attr_name = "Cozytouch circuit breaker"
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+    def __init__(self, coordinator: CozytouchDevice, title: str, uniq_id: str) -> None:
+        """Initialize the circuit breaker binary sensor."""
+        super().__init__(coordinator, title, uniq_id)
+        self._attr_unique_id = f"{DOMAIN}_{uniq_id}_circuit_breaker"
+
+    @property
+    def available(self) -> bool:
+        """Return True, the breaker state is known even when the API is down."""
+        return True
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_is_on = self.coordinator.online
-        self.async_write_ha_state()
+        attributes = self.coordinator.get_circuit_breaker_diagnostics()
+        isOn = attributes["state"] != BREAKER_CLOSED
+        if self._attr_is_on != isOn or self.extra_state_attributes != attributes:
+            self._attr_is_on = isOn
+            self._attr_extra_state_attributes = attributes
+            self.async_write_ha_state()
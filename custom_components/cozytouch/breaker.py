@@ -0,0 +1,157 @@
+"""Atlantic Cozytouch circuit breaker."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+import logging
+import random
+from time import monotonic
+
+from aiohttp import ClientError
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Consecutive failures opening the circuit
+BREAKER_FAILURE_THRESHOLD = 3
+
+# Delay before probing the API again, doubled at each failed probe (in seconds)
+BREAKER_BACKOFF_MIN = 30
+BREAKER_BACKOFF_MAX = 1800
+
+# Let another probe through if the previous one never completed (in seconds)
+BREAKER_PROBE_TIMEOUT = 60
+
+
+class CircuitOpenError(ClientError):
+    """Request not sent because the API is considered down."""
+
+
+def get_retry_after(headers) -> float | None:
+    """Get the delay requested by a Retry-After header, in seconds."""
+    value = headers.get("Retry-After", None)
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retryAt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max((retryAt - dt_util.utcnow()).total_seconds(), 0.0)
+
+
+class CircuitBreaker:
+    """Stop sending requests to an API which keeps failing.
+
+    After a few consecutive failures the circuit opens and requests are
+    rejected without being sent. Once the backoff delay is over a single
+    probe request is let through : its success closes the circuit, its
+    failure opens it again for twice as long. Delays are jittered so that
+    accounts don't all probe the API at the same time.
+    """
+
+    def __init__(self) -> None:
+        """Init breaker, closed."""
+        self._state = BREAKER_CLOSED
+        self._failures = 0
+        self._openings = 0
+        self._open_until: float = 0
+        self._retry_at: datetime | None = None
+
+    @property
+    def state(self) -> str:
+        """State of the circuit."""
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a request can be sent."""
+        if self._state == BREAKER_CLOSED:
+            return True
+
+        now = monotonic()
+        if self._state == BREAKER_OPEN and now >= self._open_until:
+            # Let a single probe through
+            self._state = BREAKER_HALF_OPEN
+            self._open_until = now + BREAKER_PROBE_TIMEOUT
+            return True
+
+        if self._state == BREAKER_HALF_OPEN and now >= self._open_until:
+            # The probe was cancelled, send another one
+            self._open_until = now + BREAKER_PROBE_TIMEOUT
+            return True
+
+        return False
+
+    def get_retry_delay(self) -> float:
+        """Get seconds before requests are allowed again, 0 if they are."""
+        if self._state != BREAKER_OPEN:
+            return 0.0
+
+        return max(self._open_until - monotonic(), 0.0)
+
+    def record_success(self) -> None:
+        """Record a request which reached the API."""
+        if self._state != BREAKER_CLOSED:
+            _LOGGER.info("API reachable again, closing circuit")
+
+        self._state = BREAKER_CLOSED
+        self._failures = 0
+        self._openings = 0
+        self._retry_at = None
+
+    def record_failure(self, retryAfter: float | None = None) -> None:
+        """Record a failed request, retryAfter is the delay asked by the API."""
+        if self._state == BREAKER_OPEN:
+            # Request sent before the circuit opened
+            if retryAfter is not None and retryAfter > self.get_retry_delay():
+                self._open_until = monotonic() + retryAfter
+                self._retry_at = dt_util.utcnow() + timedelta(seconds=retryAfter)
+            return
+
+        self._failures += 1
+        if (
+            self._state == BREAKER_CLOSED
+            and self._failures < BREAKER_FAILURE_THRESHOLD
+            and retryAfter is None
+        ):
+            return
+
+        backoff = min(BREAKER_BACKOFF_MIN * 2**self._openings, BREAKER_BACKOFF_MAX)
+        delay = random.uniform(backoff / 2, backoff)
+        if retryAfter is not None:
+            delay = max(delay, retryAfter)
+
+        _LOGGER.warning("API unavailable, retrying in %d s", delay)
+        self._state = BREAKER_OPEN
+        self._openings += 1
+        self._open_until = monotonic() + delay
+        self._retry_at = dt_util.utcnow() + timedelta(seconds=delay)
+
+    def record_response(self, status: int, headers) -> None:
+        """Record a request answered by the API with status."""
+        if status in (429, 503):
+            self.record_failure(get_retry_after(headers))
+        elif status >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def get_diagnostics(self) -> dict:
+        """Get state of the circuit."""
+        return {
+            "state": self._state,
+            "failures": self._failures,
+            "retry_at": None if self._retry_at is None else self._retry_at.isoformat(),
+        }
@@ -1,767 +1,730 @@
-"""Atlantic Cozytouch capabilility mapping."""
+"""Atlantic Cozytouch capabilility mapping.
+
+Capabilities are described by CAPABILITIES, keyed by capability ID. Entries
+of CAPABILITY_TYPE_OVERRIDES replace some infos for a device type, or ignore
+the capability for it (None). CAPABILITY_MODEL_FLAGS ignore a capability
+when an optional model info is False. Climate capabilities depend on many
+model infos and are built by a function.
+
+Infos only depend on the model, they are computed once per model and
+capability and shared read-only. The outside temperature is the only
+capability depending on its value, it is checked on each call.
+"""  # noqa: D205
+
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from homeassistant.const import UnitOfEnergy, UnitOfPressure
 
 from .const import CozytouchCapabilityVariableType
 from .model import CozytouchDeviceType
 
+CAPABILITIES: dict[int, dict] = {
+    19: {"name": "temperature_setpoint", "type": "temperature", "category": "sensor"},
+    22: {
+        "name": "target_temperature_dhw",
+        "type": "temperature_adjustment_number",
+        "category": "sensor",
+        "lowestValueCapabilityId": 160,
+        "highestValueCapabilityId": 161,
+    },
+    25: {
+        "name": "number_of_starts_ch_pump",
+        "type": "int",
+        "category": "diag",
+        "icon": "mdi:water-pump",
+    },
+    26: {
+        "name": "number_of_starts_dhw_pump",
+        "type": "int",
+        "category": "diag",
+        "icon": "mdi:water-pump",
+    },
+    28: {
+        "name": "number_of_hours_ch_pump",
+        "type": "int",
+        "category": "diag",
+        "icon": "mdi:water-pump",
+    },
+    29: {
+        "name": "number_of_hours_dhw_pump",
+        "type": "int",
+        "category": "diag",
+        "icon": "mdi:water-pump",
+    },
+    40: {
+        "name": "target_temperature",
+        "type": "temperature_adjustment_number",
+        "category": "sensor",
+        "lowestValueCapabilityId": 160,
+        "highestValueCapabilityId": 161,
+    },
+    41: {
+        "name": "target_temperature_eco_z1",
+        "type": "temperature_adjustment_number",
+        "category": "sensor",
+        "lowestValueCapabilityId": 160,
+        "highestValueCapabilityId": 161,
+    },
+    42: {
+        "name": "target_temperature_eco_z2",
+        "type": "temperature_adjustment_number",
+        "category": "sensor",
+        "lowestValueCapabilityId": 160,
+        "highestValueCapabilityId": 161,
+    },
+    44: {
+        "name": "ch_power_consumption",
+        "type": "energy",
+        "displayed_unit_of_measurement": UnitOfEnergy.KILO_WATT_HOUR,
+        "category": "sensor",
+        "icon": "mdi:radiator",
+    },
+    45: {
+        "name": "dhw_power_consumption",
+        "type": "energy",
+        "displayed_unit_of_measurement": UnitOfEnergy.KILO_WATT_HOUR,
+        "category": "sensor",
+        "icon": "mdi:faucet",
+    },
+    46: {
+        "name": "total_power_consumption",
+        "type": "energy",
+        "displayed_unit_of_measurement": UnitOfEnergy.KILO_WATT_HOUR,
+        "category": "sensor",
+        "icon": "mdi:water-boiler",
+    },
+    57: {
+        "name": "power_consumption",
+        "type": "energy",
+        "displayed_unit_of_measurement": UnitOfEnergy.KILO_WATT_HOUR,
+        "category": "sensor",
+    },
+    59: {
+        "name": "power_consumption",
+        "type": "energy",
+        "displayed_unit_of_measurement": UnitOfEnergy.KILO_WATT_HOUR,
+        "category": "sensor",
+    },
+    86: {
+        "name": "domestic_hot_water",
+        "type": "switch",
+        "category": "sensor",
+        "icon": "mdi:faucet",
+    },
+    87: {
+        "name": "heating_mode",
+        "type": "select",
+        "category": "sensor",
+        "icon": "mdi:water-boiler",
+        "modelList": "HeatingModes",
+    },
+    88: {"name": "model_name", "type": "string", "category": "diag", "icon": "mdi:tag"},
+    94: {
+        "name": "product_number",
+        "type": "string",
+        "category": "diag",
+        "icon": "mdi:tag",
+    },
+    98: {
+        "name": "product_number",
+        "type": "string",
+        "category": "diag",
+        "icon": "mdi:tag",
+    },
+    99: {
+        "name": "dhw_pump",
+        "icon": "mdi:faucet",
+        "type": "binary",
+        "category": "sensor",
+    },
+    100: {
+        "name": "water_pressure",
+        "type": "pressure",
+        "category": "sensor",
+        "icon": "mdi:gauge",
+        "displayed_unit_of_measurement": UnitOfPressure.BAR,
+    },
+    101: {
+        "name": "Capability_101",
+        "type": "string",
+        "value_type": CozytouchCapabilityVariableType.ARRAY,
+        "category": "sensor",
+    },
+    102: {
+        "name": "Capability_102",
+        "type": "string",
+        "value_type": CozytouchCapabilityVariableType.ARRAY,
+        "category": "sensor",
+    },
+    103: {
+        "name": "Capability_103",
+        "type": "string",
+        "value_type": CozytouchCapabilityVariableType.ARRAY,
+        "category": "sensor",
+    },
+    104: {
+        "name": "Capability_104",
+        "type": "string",
+        "value_type": CozytouchCapabilityVariableType.ARRAY,
+        "category": "sensor",
+    },
+    109: {
+        "name": "boiler_water_temperature",
+        "type": "temperature",
+        "category": "sensor",
+    },
+    111: {"name": "dhw_temperature", "type": "temperature", "category": "sensor"},
+    116: {"name": "exhaust_temperature", "type": "temperature", "category": "sensor"},
+    117: {
+        "name": "thermostat_temperature_z1",
+        "type": "temperature",
+        "category": "sensor",
+    },
+    118: {
+        "name": "thermostat_temperature_z2",
+        "type": "temperature",
+        "category": "sensor",
+    },
+    # Outside temperature is invalid when value is -327.68
+    119: {"name": "outside_temperature", "type": "temperature", "category": "sensor"},
+    121: {"name": "version", "type": "string", "category": "diag", "icon": "mdi:tag"},
+    152: {
+        "name": "away_mode",
+        "type": "away_mode_switch",
+        "category": "sensor",
+        "icon": "mdi:airplane",
+        "value_off": "0",
+        "value_on": "1",
+        "value_pending": "2",
+        "timestampsCapabilityId": 222,
+    },
+    153: {
+        "name": "flame",
+        "icon": "mdi:fire",
+        "type": "binary",
+        "category": "sensor",
+    },
+    154: {
+        "name": "zone_1",
+        "type": "string",
+        "category": "diag",
+        "icon": "mdi:home-floor-1",
+    },
+    155: {
+        "name": "zone_2",
+        "type": "string",
+        "category": "diag",
+        "icon": "mdi:home-floor-2",
+    },
+    158: {
+        "name": "override_total_time_z1",
+        "type": "hours_adjustment_number",
+        "category": "sensor",
+        "icon": "mdi:clock-outline",
+        "lowest_value": 1,
+        "highest_value": 24,
+    },
+    159: {
+        "name": "override_remain_time_z1",
+        "type": "time",
+        "category": "sensor",
+        "icon": "mdi:clock-outline",
+    },
+    # Target temperature adjustment min limit
+    160: {
+        "name": "temperature_adjustment_min",
+        "type": "temperature",
+        "category": "diag",
+        "icon": "mdi:thermometer-chevron-down",
+    },
+    # Target temperature adjustment max limit
+    161: {
+        "name": "temperature_adjustment_max",
+        "type": "temperature_adjustment_number",
+        "category": "diag",
+        "icon": "mdi:thermometer-chevron-up",
+        "lowest_value": 19,
+        "highest_value": 28,
+        "step": 0.5,
+    },
+    165: {
+        "name": "boost_mode",
+        "type": "switch",
+        "category": "sensor",
+        "icon": "mdi:water-boiler",
+    },
+    169: {
+        "name": "radio_signal",
+        "type": "percentage",
+        "category": "diag",
+        "icon": "mdi:radio-tower",
+    },
+    172: {
+        "name": "away_mode_temperature",
+        "type": "temperature_adjustment_number",
+        "category": "sensor",
+        "lowestValueCapabilityId": 160,
+        "highestValueCapabilityId": 161,
+    },
+    177: {
+        "name": "target_cool_temperature",
+        "type": "temperature_adjustment_number",
+        "category": "sensor",
+        "lowestValueCapabilityId": 162,
+        "highestValueCapabilityId": 163,
+    },
+    179: {
+        "name": "wifi_signal",
+        "type": "signal",
+        "category": "diag",
+        "icon": "mdi:wifi",
+    },
+    # Ignore, same as heat sensor (7, 8)
+    181: {},
+    184: {
+        "name": "prog_mode",
+        "type": "switch",
+        "category": "sensor",
+        "icon": "mdi:clock-outline",
+    },
+    196: {"name": "prog_01_z1", "type": "prog", "category": "diag"},
+    197: {"name": "prog_02_z1", "type": "prog", "category": "diag"},
+    198: {"name": "prog_03_z1", "type": "prog", "category": "diag"},
+    199: {"name": "prog_04_z1", "type": "prog", "category": "diag"},
+    200: {"name": "prog_05_z1", "type": "prog", "category": "diag"},
+    201: {"name": "prog_06_z1", "type": "prog", "category": "diag"},
+    202: {"name": "prog_07_z1", "type": "prog", "category": "diag"},
+    203: {"name": "prog_08_z2", "type": "prog", "category": "diag"},
+    204: {"name": "prog_09_z2", "type": "prog", "category": "diag"},
+    205: {"name": "prog_10_z2", "type": "prog", "category": "diag"},
+    206: {"name": "prog_11_z2", "type": "prog", "category": "diag"},
+    207: {"name": "prog_12_z2", "type": "prog", "category": "diag"},
+    208: {"name": "prog_13_z2", "type": "prog", "category": "diag"},
+    209: {"name": "prog_14_z2", "type": "prog", "category": "diag"},
+    219: {
+        "name": "wifi_ssid",
+        "type": "string",
+        "category": "diag",
+        "icon": "mdi:wifi",
+    },
+    222: {
+        "name": "away_mode",
+        "name_0": "away_mode_start",
+        "name_1": "away_mode_stop",
+        "type": "away_mode_timestamps",
+        "category": "sensor",
+        "icon_0": "mdi:airplane-takeoff",
+        "icon_1": "mdi:airplane-landing",
+        "timezoneCapabilityId": 315,
+        "capabilityDuplicate": 226,
+    },
+    226: {
+        "name": "away_mode",
+        "name_0": "away_mode_start",
+        "name_1": "away_mode_stop",
+        "type": "away_mode_timestamps",
+        "category": "sensor",
+        "icon_0": "mdi:airplane-takeoff",
+        "icon_1": "mdi:airplane-landing",
+        "timezoneCapabilityId": 315,
+        "capabilityDuplicate": 222,
+    },
+    227: {
+        "name": "away_mode",
+        "type": "away_mode_switch",
+        "category": "sensor",
+        "icon": "mdi:airplane",
+        "value_off": "0",
+        "value_on": "1",
+        "value_pending": "2",
+        "timestampsCapabilityId": 226,
+    },
+    231: {
+        "name": "target_temperature",
+        "type": "temperature_adjustment_number",
+        "category": "sensor",
+        "lowestValueCapabilityId": 105301,
+        "highestValueCapabilityId": 105304,
+    },
+    232: {
+        "name": "boost_total_time",
+        "type": "time",
+        "category": "diagnostic",
+        "icon": "mdi:clock-outline",
+    },
+    233: {
+        "name": "boost_remaining_time",
+        "type": "time",
+        "category": "diagnostic",
+        "icon": "mdi:clock-outline",
+    },
+    245: {"name": "prog_01", "type": "progtime", "category": "diag"},
+    246: {"name": "prog_02", "type": "progtime", "category": "diag"},
+    247: {"name": "prog_03", "type": "progtime", "category": "diag"},
+    248: {"name": "prog_04", "type": "progtime", "category": "diag"},
+    249: {"name": "prog_05", "type": "progtime", "category": "diag"},
+    250: {"name": "prog_06", "type": "progtime", "category": "diag"},
+    251: {"name": "prog_07", "type": "progtime", "category": "diag"},
+    258: {"name": "tank_capacity", "type": "volume", "category": "sensor"},
+    264: {
+        "name": "condenser_temperature",
+        "type": "temperature",
+        "category": "sensor",
+    },
+    265: {
+        "name": "tank_middle_temperature",
+        "type": "temperature",
+        "category": "sensor",
+    },
+    266: {
+        "name": "tank_top_temperature",
+        "type": "temperature",
+        "category": "sensor",
+    },
+    267: {
+        "name": "tank_bottom_temperature",
+        "type": "temperature",
+        "category": "sensor",
+    },
+    268: {
+        "name": "v40_water_available",
+        "type": "volume",
+        "category": "sensor",
+        "icon": "mdi:water-thermometer",
+    },
+    269: {
+        "name": "water_consumption",
+        "type": "water_consumption",
+        "category": "sensor",
+        "icon": "mdi:water-pump",
+    },
+    270: {
+        "name": "v40_water_capacity",
+        "type": "volume",
+        "category": "sensor",
+        "icon": "mdi:water-thermometer",
+    },
+    271: {"name": "hot_water_available", "type": "percentage", "category": "sensor"},
+    283: {
+        "name": "off_peak_hours",
+        "type": "binary",
+        "category": "sensor",
+        "icon": "mdi:clock-outline",
+    },
+    # For test
+    312: {
+        "name": "Temp_312",
+        "type": "temperature_adjustment_number",
+        "category": "sensor",
+    },
+    315: {
+        "name": "timezone",
+        "type": "timezone",
+        "category": "diag",
+        "icon": "mdi:map-clock-outline",
+    },
+    316: {"name": "interface_fw", "type": "string", "category": "diag", "icon": "mdi:tag"},
+    335: {
+        "name": "serial_number",
+        "type": "string",
+        "category": "diag",
+        "icon": "mdi:tag",
+    },
+    100320: {"name": "prog_heat_monday", "type": "prog", "category": "diag"},
+    100321: {"name": "prog_heat_tuesday", "type": "prog", "category": "diag"},
+    100322: {"name": "prog_heat_wednesday", "type": "prog", "category": "diag"},
+    100323: {"name": "prog_heat_thursday", "type": "prog", "category": "diag"},
+    100324: {"name": "prog_heat_friday", "type": "prog", "category": "diag"},
+    100325: {"name": "prog_heat_saturday", "type": "prog", "category": "diag"},
+    100326: {"name": "prog_heat_sunday", "type": "prog", "category": "diag"},
+    100327: {"name": "prog_cool_monday", "type": "prog", "category": "diag"},
+    100328: {"name": "prog_cool_tuesday", "type": "prog", "category": "diag"},
+    100329: {"name": "prog_cool_wednesday", "type": "prog", "category": "diag"},
+    100330: {"name": "prog_cool_thursday", "type": "prog", "category": "diag"},
+    100331: {"name": "prog_cool_friday", "type": "prog", "category": "diag"},
+    100332: {"name": "prog_cool_saturday", "type": "prog", "category": "diag"},
+    100333: {"name": "prog_cool_sunday", "type": "prog", "category": "diag"},
+    100402: {
+        "name": "number_of_hours_burner",
+        "type": "int",
+        "category": "diag",
+        "icon": "mdi:fire",
+    },
+    100406: {
+        "name": "number_of_starts_burner",
+        "type": "int",
+        "category": "diag",
+        "icon": "mdi:fire",
+    },
+    100505: {
+        "name": "powerful_mode",
+        "type": "switch",
+        "category": "sensor",
+        "icon": "mdi:wind-power",
+    },
+    100506: {
+        "name": "presence_mode",
+        "type": "switch",
+        "category": "sensor",
+        "icon": "mdi:account",
+    },
+    100507: {
+        "name": "eco_mode",
+        "type": "switch",
+        "category": "sensor",
+        "icon": "mdi:flower-outline",
+    },
+    100802: {
+        "name": "quiet_mode",
+        "type": "switch",
+        "category": "sensor",
+        "icon": "mdi:fan-minus",
+    },
+    100804: {
+        "name": "swing_mode",
+        "type": "switch",
+        "category": "sensor",
+        "icon": "mdi:arrow-oscillating",
+    },
+    104044: {
+        "name": "boost_mode",
+        "type": "switch",
+        "category": "sensor",
+        "icon": "mdi:heat-wave",
+    },
+    # Boost timeout max. in minutes
+    104047: {
+        "name": "boost_timeout_max",
+        "type": "minutes_adjustment_number",
+        "category": "diag",
+        "icon": "mdi:clock-outline",
+        "lowest_value": 5,
+        "highest_value": 60,
+        "step": 5,
+    },
+    105906: {
+        "name": "Target 105906",
+        "type": "temperature_percent_adjustment_number",
+        "category": "sensor",
+        "temperatureMin": 15.0,
+        "temperatureMax": 65.0,
+    },
+    105907: {
+        "name": "Target 105907",
+        "type": "temperature_percent_adjustment_number",
+        "category": "sensor",
+        "temperatureMin": 15.0,
+        "temperatureMax": 65.0,
+    },
+}
+
+CAPABILITY_TYPE_OVERRIDES: dict[int, dict[CozytouchDeviceType, dict | None]] = {
+    99: {
+        CozytouchDeviceType.WATER_HEATER: {
+            "name": "resistance",
+            "icon": "mdi:radiator",
+        },
+    },
+    153: {
+        CozytouchDeviceType.TOWEL_RACK: {
+            "name": "resistance",
+            "icon": "mdi:radiator",
+        },
+    },
+    158: {CozytouchDeviceType.TOWEL_RACK: {"name": "override_total_time"}},
+    159: {CozytouchDeviceType.TOWEL_RACK: {"name": "override_remain_time"}},
+    165: {CozytouchDeviceType.HEAT_PUMP: {"value_off": "false", "value_on": "true"}},
+    177: {CozytouchDeviceType.GAZ_BOILER: None},
+    100506: {CozytouchDeviceType.TOWEL_RACK: None},
+}
+
+# Optional model info enabling a capability, with its default
+CAPABILITY_MODEL_FLAGS: dict[int, tuple[str, bool]] = {
+    116: ("exhaustTemperatureAvailable", True),
+}
+
+# Capability IDs which may be the HVAC mode of a climate
+CLIMATE_CAPABILITIES = frozenset({1, 2, 7, 8})
+
+# Infos of an ignored capability
+IGNORED_CAPABILITY: Mapping = MappingProxyType({})
+
+# Infos by capability ID, by model ID
+_capability_infos_cache: dict[int, dict[int, Mapping | None]] = {}
+
+
+def get_capability_infos(
+    modelInfos: Mapping, capabilityId: int, capabilityValue: str
+) -> Mapping | None:
+    """Get capabilities for a device.
+
+    Return None for an unknown capability, an empty mapping for an ignored one.
+    The infos are read-only, they are shared by all devices of the model.
+    """
+    if capabilityId == 119 and float(capabilityValue) <= -327.68:
+        # Outside temperature is invalid when value is -327.68
+        return IGNORED_CAPABILITY
+
+    cache = _get_model_cache(modelInfos)
+    try:
+        return cache[capabilityId]
+    except KeyError:
+        return _cache_capability_infos(modelInfos, cache, capabilityId)
+
+
+def get_device_capability_infos(
+    modelInfos: Mapping, capabilities: list[dict]
+) -> list[Mapping | None]:
+    """Get infos of the capabilities of a device, as get_capability_infos."""
+    cache = _get_model_cache(modelInfos)
+    infos = []
+    for capability in capabilities:
+        capabilityId = capability["capabilityId"]
+        if capabilityId == 119 and float(capability["value"]) <= -327.68:
+            infos.append(IGNORED_CAPABILITY)
+            continue
+
+        try:
+            infos.append(cache[capabilityId])
+        except KeyError:
+            infos.append(_cache_capability_infos(modelInfos, cache, capabilityId))
+
+    return infos
+
+
+def _get_model_cache(modelInfos: Mapping) -> dict[int, Mapping | None]:
+    """Get the infos computed for a model, by capability ID."""
+    cache = _capability_infos_cache.get(modelInfos["modelId"], None)
+    if cache is None:
+        cache = _capability_infos_cache[modelInfos["modelId"]] = {}
+    return cache
+
+
+def _cache_capability_infos(
+    modelInfos: Mapping, cache: dict[int, Mapping | None], capabilityId: int
+) -> Mapping | None:
+    """Build the infos of a capability for a model and keep them."""
+    capability = _build_capability_infos(modelInfos, capabilityId)
+    if capability is not None:
+        capability = MappingProxyType(capability) if capability else IGNORED_CAPABILITY
+    cache[capabilityId] = capability
+    return capability
 
-def get_capability_infos(modelInfos: dict, capabilityId: int, capabilityValue: str):  # noqa: C901
-    """Get capabilities for a device."""
-    modelId = modelInfos["modelId"]
-
-    capability = {"modelId": modelId, "capabilityId": capabilityId}
-
-    if (
-        capabilityId in (1, 2, 7, 8)
-        and capabilityId in modelInfos["HVACModesCapabilityId"]
-    ):
-        # Default Ids
-        capability["targetCapabilityId"] = 40
-        capability["lowestValueCapabilityId"] = 160
-        capability["highestValueCapabilityId"] = 161
-
-        if modelInfos.get("currentTemperatureAvailable", True):
-            capability["currentValueCapabilityId"] = 117
-
-        if modelInfos["type"] == CozytouchDeviceType.GAZ_BOILER:
-            capability["name"] = "central_heating"
-            capability["icon"] = "mdi:radiator"
-            capability["progCapabilityId"] = 184
-            capability["progOverrideCapabilityId"] = 157
-            capability["progOverrideTotalTimeCapabilityId"] = 158
-            capability["progOverrideTimeCapabilityId"] = 159
-        elif modelInfos["type"] == CozytouchDeviceType.TOWEL_RACK:
-            capability["name"] = "heat"
-            capability["icon"] = "mdi:heating-coil"
-            capability["progCapabilityId"] = 184
-            capability["progOverrideCapabilityId"] = 157
-            capability["progOverrideTotalTimeCapabilityId"] = 158
-            capability["progOverrideTimeCapabilityId"] = 159
-        elif modelInfos["type"] == CozytouchDeviceType.AC:
-            capability["name"] = "air_conditioner"
-            capability["icon"] = "mdi:air-conditioner"
-            capability["targetCoolCapabilityId"] = 177
-            capability["lowestCoolValueCapabilityId"] = 162
-            capability["highestCoolValueCapabilityId"] = 163
-            capability["activityCapabilityId"] = 100506
-            capability["ecoCapabilityId"] = 100507
-            capability["boostCapabilityId"] = 100505
-        elif modelInfos["type"] == CozytouchDeviceType.HEAT_PUMP:
-            if capabilityId in (1, 7):
-                capability["name"] = "heat_pump_z1"
-                capability["targetCapabilityId"] = 17
-                if modelInfos.get("currentTemperatureAvailableZ1", True):
-                    capability["currentValueCapabilityId"] = 117
-                else:
-                    capability["currentValueCapabilityId"] = None
-            else:
-                capability["name"] = "heat_pump_z2"
-                capability["targetCapabilityId"] = 18
-                if modelInfos.get("currentTemperatureAvailableZ2", True):
-                    capability["currentValueCapabilityId"] = 118
-                else:
-                    capability["currentValueCapabilityId"] = None
-
-            # capability["lowestValueCapabilityId"] = 172
-            # capability["highestValueCapabilityId"] = 171
-            capability.pop("lowestValueCapabilityId")
-            capability.pop("highestValueCapabilityId")
-            capability["icon"] = "mdi:heat-pump"
-        else:
-            capability["name"] = "heat"
-
-        capability["type"] = "climate"
-        capability["category"] = "sensor"
-
-        if "fanModes" in modelInfos:
-            capability["fanModeCapabilityId"] = 100801
-
-        if modelInfos.get("quietModeAvailable", False):
-            capability["quietModeCapabilityId"] = 100802
-
-        if modelInfos.get("overrideModeAvailable", True):
-            capability["progCapabilityId"] = 184
-            capability["progOverrideCapabilityId"] = 157
-            capability["progOverrideTotalTimeCapabilityId"] = 158
-            capability["progOverrideTimeCapabilityId"] = 159
-
-        if "swingModes" in modelInfos:
-            capability["swingModeCapabilityId"] = 100803
-            capability["swingOnCapabilityId"] = 100804
-
-    elif capabilityId == 19:
-        capability["name"] = "temperature_setpoint"
-        capability["type"] = "temperature"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 22:
-        capability["name"] = "target_temperature_dhw"
-        capability["type"] = "temperature_adjustment_number"
-        capability["category"] = "sensor"
-        capability["lowestValueCapabilityId"] = 160
-        capability["highestValueCapabilityId"] = 161
-
-    elif capabilityId == 25:
-        capability["name"] = "number_of_starts_ch_pump"
-        capability["type"] = "int"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:water-pump"
-
-    elif capabilityId == 26:
-        capability["name"] = "number_of_starts_dhw_pump"
-        capability["type"] = "int"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:water-pump"
-
-    elif capabilityId == 28:
-        capability["name"] = "number_of_hours_ch_pump"
-        capability["type"] = "int"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:water-pump"
-
-    elif capabilityId == 29:
-        capability["name"] = "number_of_hours_dhw_pump"
-        capability["type"] = "int"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:water-pump"
-
-    elif capabilityId == 40:
-        capability["name"] = "target_temperature"
-        capability["type"] = "temperature_adjustment_number"
-        capability["category"] = "sensor"
-        capability["lowestValueCapabilityId"] = 160
-        capability["highestValueCapabilityId"] = 161
-
-    elif capabilityId == 41:
-        capability["name"] = "target_temperature_eco_z1"
-        capability["type"] = "temperature_adjustment_number"
-        capability["category"] = "sensor"
-        capability["lowestValueCapabilityId"] = 160
-        capability["highestValueCapabilityId"] = 161
-
-    elif capabilityId == 42:
-        capability["name"] = "target_temperature_eco_z2"
-        capability["type"] = "temperature_adjustment_number"
-        capability["category"] = "sensor"
-        capability["lowestValueCapabilityId"] = 160
-        capability["highestValueCapabilityId"] = 161
-
-    elif capabilityId == 44:
-        capability["name"] = "ch_power_consumption"
-        capability["type"] = "energy"
-        capability["displayed_unit_of_measurement"] = UnitOfEnergy.KILO_WATT_HOUR
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:radiator"
 
-    elif capabilityId == 45:
-        capability["name"] = "dhw_power_consumption"
-        capability["type"] = "energy"
-        capability["displayed_unit_of_measurement"] = UnitOfEnergy.KILO_WATT_HOUR
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:faucet"
-
-    elif capabilityId == 46:
-        capability["name"] = "total_power_consumption"
-        capability["type"] = "energy"
-        capability["displayed_unit_of_measurement"] = UnitOfEnergy.KILO_WATT_HOUR
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:water-boiler"
-
-    elif capabilityId in (57, 59):
-        capability["name"] = "power_consumption"
-        capability["type"] = "energy"
-        capability["displayed_unit_of_measurement"] = UnitOfEnergy.KILO_WATT_HOUR
-        capability["category"] = "sensor"
-
-    elif capabilityId == 86:
-        capability["name"] = "domestic_hot_water"
-        capability["type"] = "switch"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:faucet"
-
-    elif capabilityId == 87:
-        capability["name"] = "heating_mode"
-        capability["type"] = "select"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:water-boiler"
-        capability["modelList"] = "HeatingModes"
-
-    elif capabilityId == 88:
-        capability["name"] = "model_name"
-        capability["type"] = "string"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:tag"
-
-    elif capabilityId in (94, 98):
-        capability["name"] = "product_number"
-        capability["type"] = "string"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:tag"
-
-    elif capabilityId == 99:
-        if modelInfos["type"] == CozytouchDeviceType.WATER_HEATER:
-            capability["name"] = "resistance"
-            capability["icon"] = "mdi:radiator"
-        else:
-            capability["name"] = "dhw_pump"
-            capability["icon"] = "mdi:faucet"
-
-        capability["type"] = "binary"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 100:
-        capability["name"] = "water_pressure"
-        capability["type"] = "pressure"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:gauge"
-        capability["displayed_unit_of_measurement"] = UnitOfPressure.BAR
-
-    elif capabilityId in (101, 102, 103, 104):
-        capability["name"] = "Capability_" + str(capabilityId)
-        capability["type"] = "string"
-        capability["value_type"] = CozytouchCapabilityVariableType.ARRAY
-        capability["category"] = "sensor"
-
-    elif capabilityId == 109:
-        capability["name"] = "boiler_water_temperature"
-        capability["type"] = "temperature"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 111:
-        capability["name"] = "dhw_temperature"
-        capability["type"] = "temperature"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 116:
-        if modelInfos.get("exhaustTemperatureAvailable", True):
-            capability["name"] = "exhaust_temperature"
-            capability["type"] = "temperature"
-            capability["category"] = "sensor"
-        else:
-            return {}
+def _build_capability_infos(modelInfos: dict, capabilityId: int) -> dict | None:
+    """Build the infos of a capability for a model."""
+    if capabilityId in CLIMATE_CAPABILITIES:
+        if capabilityId in modelInfos["HVACModesCapabilityId"]:
+            return _build_climate_infos(modelInfos, capabilityId)
+        return None
 
-    elif capabilityId == 117:
-        capability["name"] = "thermostat_temperature_z1"
-        capability["type"] = "temperature"
-        capability["category"] = "sensor"
+    infos = CAPABILITIES.get(capabilityId, None)
+    if infos is None:
+        return None
 
-    elif capabilityId == 118:
-        capability["name"] = "thermostat_temperature_z2"
-        capability["type"] = "temperature"
-        capability["category"] = "sensor"
+    if len(infos) == 0:
+        return {}
 
-    elif capabilityId == 119:
-        # Outside temperature is invalid when value is -327.68
-        if float(capabilityValue) > -327.68:
-            capability["name"] = "outside_temperature"
-            capability["type"] = "temperature"
-            capability["category"] = "sensor"
-        else:
+    flag = CAPABILITY_MODEL_FLAGS.get(capabilityId, None)
+    if flag is not None and not modelInfos.get(flag[0], flag[1]):
+        return {}
+
+    overrides = CAPABILITY_TYPE_OVERRIDES.get(capabilityId, {})
+    if modelInfos["type"] in overrides:
+        if overrides[modelInfos["type"]] is None:
             return {}
+        infos = {**infos, **overrides[modelInfos["type"]]}
 
-    elif capabilityId == 121:
-        capability["name"] = "version"
-        capability["type"] = "string"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:tag"
-
-    elif capabilityId in (152, 227):
-        capability["name"] = "away_mode"
-        capability["type"] = "away_mode_switch"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:airplane"
-        capability["value_off"] = "0"
-        capability["value_on"] = "1"
-        capability["value_pending"] = "2"
-        if capabilityId == 152:
-            capability["timestampsCapabilityId"] = 222
-        elif capabilityId == 227:
-            capability["timestampsCapabilityId"] = 226
-
-    elif capabilityId == 153:
-        if modelInfos["type"] == CozytouchDeviceType.TOWEL_RACK:
-            capability["name"] = "resistance"
-            capability["icon"] = "mdi:radiator"
-        else:
-            capability["name"] = "flame"
-            capability["icon"] = "mdi:fire"
-
-        capability["type"] = "binary"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 154:
-        capability["name"] = "zone_1"
-        capability["type"] = "string"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:home-floor-1"
-
-    elif capabilityId == 155:
-        capability["name"] = "zone_2"
-        capability["type"] = "string"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:home-floor-2"
-
-    # elif capabilityId == 157:
-    #    # Prog override flag
-    #    return {}
-
-    elif capabilityId == 158:
-        if modelInfos["type"] == CozytouchDeviceType.TOWEL_RACK:
-            capability["name"] = "override_total_time"
-        else:
-            capability["name"] = "override_total_time_z1"
+    return {"modelId": modelInfos["modelId"], "capabilityId": capabilityId, **infos}
+
+
+def _build_climate_infos(modelInfos: dict, capabilityId: int) -> dict:  # noqa: C901
+    """Build the infos of the HVAC mode capability of a climate."""
+    capability = {"modelId": modelInfos["modelId"], "capabilityId": capabilityId}
+
+    # Default Ids
+    capability["targetCapabilityId"] = 40
+    capability["lowestValueCapabilityId"] = 160
+    capability["highestValueCapabilityId"] = 161
 
-        capability["type"] = "hours_adjustment_number"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:clock-outline"
-        capability["lowest_value"] = 1
-        capability["highest_value"] = 24
+    if modelInfos.get("currentTemperatureAvailable", True):
+        capability["currentValueCapabilityId"] = 117
 
-    elif capabilityId == 159:
-        if modelInfos["type"] == CozytouchDeviceType.TOWEL_RACK:
-            capability["name"] = "override_remain_time"
+    if modelInfos["type"] == CozytouchDeviceType.GAZ_BOILER:
+        capability["name"] = "central_heating"
+        capability["icon"] = "mdi:radiator"
+        capability["progCapabilityId"] = 184
+        capability["progOverrideCapabilityId"] = 157
+        capability["progOverrideTotalTimeCapabilityId"] = 158
+        capability["progOverrideTimeCapabilityId"] = 159
+    elif modelInfos["type"] == CozytouchDeviceType.TOWEL_RACK:
+        capability["name"] = "heat"
+        capability["icon"] = "mdi:heating-coil"
+        capability["progCapabilityId"] = 184
+        capability["progOverrideCapabilityId"] = 157
+        capability["progOverrideTotalTimeCapabilityId"] = 158
+        capability["progOverrideTimeCapabilityId"] = 159
+    elif modelInfos["type"] == CozytouchDeviceType.AC:
+        capability["name"] = "air_conditioner"
+        capability["icon"] = "mdi:air-conditioner"
+        capability["targetCoolCapabilityId"] = 177
+        capability["lowestCoolValueCapabilityId"] = 162
+        capability["highestCoolValueCapabilityId"] = 163
+        capability["activityCapabilityId"] = 100506
+        capability["ecoCapabilityId"] = 100507
+        capability["boostCapabilityId"] = 100505
+    elif modelInfos["type"] == CozytouchDeviceType.HEAT_PUMP:
+        if capabilityId in (1, 7):
+            capability["name"] = "heat_pump_z1"
+            capability["targetCapabilityId"] = 17
+            if modelInfos.get("currentTemperatureAvailableZ1", True):
+                capability["currentValueCapabilityId"] = 117
+            else:
+                capability["currentValueCapabilityId"] = None
         else:
-            capability["name"] = "override_remain_time_z1"
-
-        capability["type"] = "time"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:clock-outline"
-
-    elif capabilityId == 160:
-        # Target temperature adjustment min limit
-        capability["name"] = "temperature_adjustment_min"
-        capability["type"] = "temperature"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:thermometer-chevron-down"
-
-    elif capabilityId == 161:
-        # Target temperature adjustment max limit
-        capability["name"] = "temperature_adjustment_max"
-        capability["type"] = "temperature_adjustment_number"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:thermometer-chevron-up"
-        capability["lowest_value"] = 19
-        capability["highest_value"] = 28
-        capability["step"] = 0.5
-
-    elif capabilityId == 165:
-        capability["name"] = "boost_mode"
-        capability["type"] = "switch"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:water-boiler"
-
-        if modelInfos["type"] == CozytouchDeviceType.HEAT_PUMP:
-            capability["value_off"] = "false"
-            capability["value_on"] = "true"
-
-    elif capabilityId == 169:
-        capability["name"] = "radio_signal"
-        capability["type"] = "percentage"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:radio-tower"
-
-    elif capabilityId == 172:
-        capability["name"] = "away_mode_temperature"
-        capability["type"] = "temperature_adjustment_number"
-        capability["category"] = "sensor"
-        capability["lowestValueCapabilityId"] = 160
-        capability["highestValueCapabilityId"] = 161
-
-    elif capabilityId == 177:
-        if modelInfos["type"] == CozytouchDeviceType.GAZ_BOILER:
-            return {}
+            capability["name"] = "heat_pump_z2"
+            capability["targetCapabilityId"] = 18
+            if modelInfos.get("currentTemperatureAvailableZ2", True):
+                capability["currentValueCapabilityId"] = 118
+            else:
+                capability["currentValueCapabilityId"] = None
 
-        capability["name"] = "target_cool_temperature"
-        capability["type"] = "temperature_adjustment_number"
-        capability["category"] = "sensor"
-        capability["lowestValueCapabilityId"] = 162
-        capability["highestValueCapabilityId"] = 163
+        # capability["lowestValueCapabilityId"] = 172
+        # capability["highestValueCapabilityId"] = 171
+        capability.pop("lowestValueCapabilityId")
+        capability.pop("highestValueCapabilityId")
+        capability["icon"] = "mdi:heat-pump"
+    else:
+        capability["name"] = "heat"
 
-    elif capabilityId == 179:
-        capability["name"] = "wifi_signal"
-        capability["type"] = "signal"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:wifi"
+    capability["type"] = "climate"
+    capability["category"] = "sensor"
 
-    elif capabilityId == 181:
-        # Ignore, same as heat sensor (7, 8)
-        return {}
+    if "fanModes" in modelInfos:
+        capability["fanModeCapabilityId"] = 100801
 
-    elif capabilityId == 184:
-        capability["name"] = "prog_mode"
-        capability["type"] = "switch"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:clock-outline"
-
-    elif capabilityId == 196:
-        capability["name"] = "prog_01_z1"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 197:
-        capability["name"] = "prog_02_z1"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 198:
-        capability["name"] = "prog_03_z1"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 199:
-        capability["name"] = "prog_04_z1"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 200:
-        capability["name"] = "prog_05_z1"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 201:
-        capability["name"] = "prog_06_z1"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 202:
-        capability["name"] = "prog_07_z1"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 203:
-        capability["name"] = "prog_08_z2"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 204:
-        capability["name"] = "prog_09_z2"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 205:
-        capability["name"] = "prog_10_z2"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 206:
-        capability["name"] = "prog_11_z2"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 207:
-        capability["name"] = "prog_12_z2"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 208:
-        capability["name"] = "prog_13_z2"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 209:
-        capability["name"] = "prog_14_z2"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 219:
-        capability["name"] = "wifi_ssid"
-        capability["type"] = "string"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:wifi"
-
-    elif capabilityId in (222, 226):
-        capability["name"] = "away_mode"
-        capability["name_0"] = "away_mode_start"
-        capability["name_1"] = "away_mode_stop"
-        capability["type"] = "away_mode_timestamps"
-        capability["category"] = "sensor"
-        capability["icon_0"] = "mdi:airplane-takeoff"
-        capability["icon_1"] = "mdi:airplane-landing"
-        capability["timezoneCapabilityId"] = 315
-        if capabilityId == 222:
-            capability["capabilityDuplicate"] = 226
-        else:
-            capability["capabilityDuplicate"] = 222
-
-    elif capabilityId == 231:
-        capability["name"] = "target_temperature"
-        capability["type"] = "temperature_adjustment_number"
-        capability["category"] = "sensor"
-        capability["lowestValueCapabilityId"] = 105301
-        capability["highestValueCapabilityId"] = 105304
-
-    elif capabilityId == 232:
-        capability["name"] = "boost_total_time"
-        capability["type"] = "time"
-        capability["category"] = "diagnostic"
-        capability["icon"] = "mdi:clock-outline"
-
-    elif capabilityId == 233:
-        capability["name"] = "boost_remaining_time"
-        capability["type"] = "time"
-        capability["category"] = "diagnostic"
-        capability["icon"] = "mdi:clock-outline"
-
-    elif capabilityId == 245:
-        capability["name"] = "prog_01"
-        capability["type"] = "progtime"
-        capability["category"] = "diag"
-
-    elif capabilityId == 246:
-        capability["name"] = "prog_02"
-        capability["type"] = "progtime"
-        capability["category"] = "diag"
-
-    elif capabilityId == 247:
-        capability["name"] = "prog_03"
-        capability["type"] = "progtime"
-        capability["category"] = "diag"
-
-    elif capabilityId == 248:
-        capability["name"] = "prog_04"
-        capability["type"] = "progtime"
-        capability["category"] = "diag"
-
-    elif capabilityId == 249:
-        capability["name"] = "prog_05"
-        capability["type"] = "progtime"
-        capability["category"] = "diag"
-
-    elif capabilityId == 250:
-        capability["name"] = "prog_06"
-        capability["type"] = "progtime"
-        capability["category"] = "diag"
-
-    elif capabilityId == 251:
-        capability["name"] = "prog_07"
-        capability["type"] = "progtime"
-        capability["category"] = "diag"
-
-    elif capabilityId == 258:
-        capability["name"] = "tank_capacity"
-        capability["type"] = "volume"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 264:
-        capability["name"] = "condenser_temperature"
-        capability["type"] = "temperature"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 265:
-        capability["name"] = "tank_middle_temperature"
-        capability["type"] = "temperature"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 266:
-        capability["name"] = "tank_top_temperature"
-        capability["type"] = "temperature"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 267:
-        capability["name"] = "tank_bottom_temperature"
-        capability["type"] = "temperature"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 268:
-        capability["name"] = "v40_water_available"
-        capability["type"] = "volume"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:water-thermometer"
-
-    elif capabilityId == 269:
-        capability["name"] = "water_consumption"
-        capability["type"] = "water_consumption"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:water-pump"
-
-    elif capabilityId == 270:
-        capability["name"] = "v40_water_capacity"
-        capability["type"] = "volume"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:water-thermometer"
-
-    elif capabilityId == 271:
-        capability["name"] = "hot_water_available"
-        capability["type"] = "percentage"
-        capability["category"] = "sensor"
-
-    elif capabilityId == 283:
-        capability["name"] = "off_peak_hours"
-        capability["type"] = "binary"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:clock-outline"
-
-    elif capabilityId == 315:
-        capability["name"] = "timezone"
-        capability["type"] = "timezone"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:map-clock-outline"
-
-    elif capabilityId == 316:
-        capability["name"] = "interface_fw"
-        capability["type"] = "string"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:tag"
-
-    elif capabilityId == 335:
-        capability["name"] = "serial_number"
-        capability["type"] = "string"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:tag"
-
-    elif capabilityId == 100402:
-        capability["name"] = "number_of_hours_burner"
-        capability["type"] = "int"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:fire"
-
-    elif capabilityId == 100406:
-        capability["name"] = "number_of_starts_burner"
-        capability["type"] = "int"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:fire"
-
-    elif capabilityId == 100505:
-        capability["name"] = "powerful_mode"
-        capability["type"] = "switch"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:wind-power"
-
-    elif capabilityId == 100506:
-        if modelInfos["type"] == CozytouchDeviceType.TOWEL_RACK:
-            capability = {}
-        else:
-            capability["name"] = "presence_mode"
-            capability["type"] = "switch"
-            capability["category"] = "sensor"
-            capability["icon"] = "mdi:account"
-
-    elif capabilityId == 100507:
-        capability["name"] = "eco_mode"
-        capability["type"] = "switch"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:flower-outline"
-
-    elif capabilityId == 100320:
-        capability["name"] = "prog_heat_monday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100321:
-        capability["name"] = "prog_heat_tuesday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100322:
-        capability["name"] = "prog_heat_wednesday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100323:
-        capability["name"] = "prog_heat_thursday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100324:
-        capability["name"] = "prog_heat_friday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100325:
-        capability["name"] = "prog_heat_saturday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100326:
-        capability["name"] = "prog_heat_sunday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100327:
-        capability["name"] = "prog_cool_monday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100328:
-        capability["name"] = "prog_cool_tuesday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100329:
-        capability["name"] = "prog_cool_wednesday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100330:
-        capability["name"] = "prog_cool_thursday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100331:
-        capability["name"] = "prog_cool_friday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100332:
-        capability["name"] = "prog_cool_saturday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100333:
-        capability["name"] = "prog_cool_sunday"
-        capability["type"] = "prog"
-        capability["category"] = "diag"
-
-    elif capabilityId == 100802:
-        capability["name"] = "quiet_mode"
-        capability["type"] = "switch"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:fan-minus"
-
-    elif capabilityId == 100804:
-        capability["name"] = "swing_mode"
-        capability["type"] = "switch"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:arrow-oscillating"
-
-    elif capabilityId == 104044:
-        capability["name"] = "boost_mode"
-        capability["type"] = "switch"
-        capability["category"] = "sensor"
-        capability["icon"] = "mdi:heat-wave"
-
-    elif capabilityId == 104047:
-        # Boost timeout max. in minutes
-        capability["name"] = "boost_timeout_max"
-        capability["type"] = "minutes_adjustment_number"
-        capability["category"] = "diag"
-        capability["icon"] = "mdi:clock-outline"
-        capability["lowest_value"] = 5
-        capability["highest_value"] = 60
-        capability["step"] = 5
-
-    elif capabilityId == 105906:
-        capability["name"] = "Target 105906"
-        capability["type"] = "temperature_percent_adjustment_number"
-        capability["category"] = "sensor"
-        capability["temperatureMin"] = 15.0
-        capability["temperatureMax"] = 65.0
-
-    elif capabilityId == 105907:
-        capability["name"] = "Target 105907"
-        capability["type"] = "temperature_percent_adjustment_number"
-        capability["category"] = "sensor"
-        capability["temperatureMin"] = 15.0
-        capability["temperatureMax"] = 65.0
+    if modelInfos.get("quietModeAvailable", False):
+        capability["quietModeCapabilityId"] = 100802
 
-    # For test
-    elif capabilityId == 312:
-        capability["name"] = "Temp_" + str(capabilityId)
-        capability["type"] = "temperature_adjustment_number"
-        capability["category"] = "sensor"
+    if modelInfos.get("overrideModeAvailable", True):
+        capability["progCapabilityId"] = 184
+        capability["progOverrideCapabilityId"] = 157
+        capability["progOverrideTotalTimeCapabilityId"] = 158
+        capability["progOverrideTimeCapabilityId"] = 159
 
-    else:
-        return None
+    if "swingModes" in modelInfos:
+        capability["swingModeCapabilityId"] = 100803
+        capability["swingOnCapabilityId"] = 100804
 
     return capability
+
+
+def get_capability_dependencies(capability: dict) -> frozenset[int]:
+    """Get IDs of the capabilities an entity of this capability depends on."""
+    return frozenset(
+        value
+        for key, value in capability.items()
+        if (key == "capabilityId" or key.endswith("CapabilityId"))
+        and isinstance(value, int)
+    )
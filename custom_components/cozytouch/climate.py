@@ -22,7 +22,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .hub import Hub
+from .hub import CozytouchDevice
 from .sensor import CozytouchSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -53,7 +53,7 @@ async def async_setup_entry(
 
     # Init climate entities
     climates = []
-    capabilities = hub.get_capabilities_for_device()
+    capabilities = hub.get_capabilities_for_device(("climate",))
     for capability in capabilities:
         if capability["type"] == "climate":
             climates.append(
@@ -78,7 +78,7 @@ class CozytouchClimate(ClimateEntity, CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         name: str | None = None,
     ) -> None:
         """Initialize a climate entity."""
@@ -184,6 +184,10 @@ class CozytouchClimate(ClimateEntity, CozytouchSensor):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update the values from the hub."""
+        # Nothing to show until the device values were read once
+        if not self.coordinator.available:
+            self.async_write_ha_state_if_changed()
+            return
 
         # HVAC Mode
         HVACModes = self._modelInfos["HVACModes"]
@@ -352,7 +356,16 @@ class CozytouchClimate(ClimateEntity, CozytouchSensor):
             else:
                 self._attr_preset_mode = PRESET_PROG
 
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed(
+            self._attr_hvac_mode,
+            self._native_value,
+            self._current_value,
+            self._attr_min_temp,
+            self._attr_max_temp,
+            getattr(self, "_attr_fan_mode", None),
+            getattr(self, "_attr_swing_mode", None),
+            getattr(self, "_attr_preset_mode", None),
+        )
 
     @property
     def current_temperature(self):
@@ -407,52 +420,50 @@ class CozytouchClimate(ClimateEntity, CozytouchSensor):
 
     async def async_set_fan_mode(self, fan_mode) -> None:
         """Set new target fan mode."""
+        writes = []
+        dependencies = {}
         if fan_mode == FAN_QUIET and "quietModeCapabilityId" in self._capability:
-            await self.coordinator.set_capability_value(
-                self._capability["quietModeCapabilityId"],
-                "1",
-            )
+            writes.append((self._capability["quietModeCapabilityId"], "1"))
         elif "fanModeCapabilityId" in self._capability:
+            fanModeCapabilityId = self._capability["fanModeCapabilityId"]
             if "quietModeCapabilityId" in self._capability:
-                await self.coordinator.set_capability_value(
+                # Leave quiet mode before changing the fan mode
+                writes.append((self._capability["quietModeCapabilityId"], "0"))
+                dependencies[fanModeCapabilityId] = (
                     self._capability["quietModeCapabilityId"],
-                    "0",
                 )
 
             FANModes = self._modelInfos["fanModes"]
             for mode in FANModes:
                 if FANModes[mode] == fan_mode:
-                    await self.coordinator.set_capability_value(
-                        self._capability["fanModeCapabilityId"],
-                        str(mode),
-                    )
+                    writes.append((fanModeCapabilityId, str(mode)))
                     break
 
+        await self.coordinator.set_capability_values(writes, dependencies)
         await self.coordinator.async_request_refresh()
 
     async def async_set_swing_mode(self, swing_mode):
         """Set new target swing operation."""
+        writes = []
+        dependencies = {}
         if swing_mode == SWING_ON and "swingOnCapabilityId" in self._capability:
-            await self.coordinator.set_capability_value(
-                self._capability["swingOnCapabilityId"],
-                "1",
-            )
+            writes.append((self._capability["swingOnCapabilityId"], "1"))
         elif "swingModeCapabilityId" in self._capability:
+            swingModeCapabilityId = self._capability["swingModeCapabilityId"]
             if "swingOnCapabilityId" in self._capability:
-                await self.coordinator.set_capability_value(
+                # Leave swing before changing the swing mode
+                writes.append((self._capability["swingOnCapabilityId"], "0"))
+                dependencies[swingModeCapabilityId] = (
                     self._capability["swingOnCapabilityId"],
-                    "0",
                 )
 
             SwingModes = self._modelInfos["swingModes"]
             for mode in SwingModes:
                 if SwingModes[mode] == swing_mode:
-                    await self.coordinator.set_capability_value(
-                        self._capability["swingModeCapabilityId"],
-                        str(mode),
-                    )
+                    writes.append((swingModeCapabilityId, str(mode)))
                     break
 
+        await self.coordinator.set_capability_values(writes, dependencies)
         await self.coordinator.async_request_refresh()
 
     async def async_set_preset_mode(self, preset_mode):
@@ -465,32 +476,35 @@ class CozytouchClimate(ClimateEntity, CozytouchSensor):
             "progOverrideCapabilityId", None
         )
 
+        # Activity, eco, boost and prog are independent and written concurrently
+        writes = []
+        dependencies = {}
         if activityCapabilityId:
             if preset_mode == PRESET_ACTIVITY:
-                await self.coordinator.set_capability_value(activityCapabilityId, "1")
+                writes.append((activityCapabilityId, "1"))
             elif preset_mode == PRESET_NONE:
-                await self.coordinator.set_capability_value(activityCapabilityId, "0")
+                writes.append((activityCapabilityId, "0"))
 
         if ecoCapabilityId:
             if preset_mode == PRESET_ECO:
-                await self.coordinator.set_capability_value(ecoCapabilityId, "1")
+                writes.append((ecoCapabilityId, "1"))
             elif preset_mode in (PRESET_ACTIVITY, PRESET_NONE):
-                await self.coordinator.set_capability_value(ecoCapabilityId, "0")
+                writes.append((ecoCapabilityId, "0"))
                 # NOTE: PRESET_BOOST mode automatically disable PRESET_ECO mode
 
         if boostCapabilityId:
             if preset_mode == PRESET_BOOST:
-                await self.coordinator.set_capability_value(boostCapabilityId, "1")
+                writes.append((boostCapabilityId, "1"))
             elif preset_mode in (PRESET_ACTIVITY, PRESET_NONE):
-                await self.coordinator.set_capability_value(boostCapabilityId, "0")
+                writes.append((boostCapabilityId, "0"))
                 # NOTE: PRESET_ECO mode automatically disable PRESET_BOOST mode
 
         if progCapabilityId:
             if preset_mode == PRESET_BASIC:
-                await self.coordinator.set_capability_value(progCapabilityId, "0")
+                writes.append((progCapabilityId, "0"))
 
             elif preset_mode == PRESET_PROG:
-                await self.coordinator.set_capability_value(progCapabilityId, "1")
+                writes.append((progCapabilityId, "1"))
 
             if progOverrideCapabilityId:
                 progOverrideTimeCapabilityId = self._capability.get(
@@ -500,6 +514,7 @@ class CozytouchClimate(ClimateEntity, CozytouchSensor):
                     "progOverrideTotalTimeCapabilityId", None
                 )
 
+                # Override is changed once prog mode and override time are set
                 if preset_mode == PRESET_OVERRIDE:
                     if (
                         progOverrideTimeCapabilityId
@@ -508,22 +523,24 @@ class CozytouchClimate(ClimateEntity, CozytouchSensor):
                         totalTime = self.coordinator.get_capability_value(
                             progOverrideTotalTimeCapabilityId
                         )
-                        await self.coordinator.set_capability_value(
-                            progOverrideTotalTimeCapabilityId, totalTime
-                        )
+                        writes.append((progOverrideTotalTimeCapabilityId, totalTime))
 
-                    await self.coordinator.set_capability_value(
-                        progOverrideCapabilityId, "1"
+                    writes.append((progOverrideCapabilityId, "1"))
+                    dependencies[progOverrideCapabilityId] = (
+                        progCapabilityId,
+                        progOverrideTotalTimeCapabilityId,
                     )
 
                 else:
                     if progOverrideTimeCapabilityId:
-                        await self.coordinator.set_capability_value(
-                            progOverrideTimeCapabilityId, "0"
-                        )
+                        writes.append((progOverrideTimeCapabilityId, "0"))
 
-                    await self.coordinator.set_capability_value(
-                        progOverrideCapabilityId, "0"
+                    writes.append((progOverrideCapabilityId, "0"))
+                    dependencies[progOverrideCapabilityId] = (
+                        progCapabilityId,
+                        progOverrideTimeCapabilityId,
                     )
+
+        await self.coordinator.set_capability_values(writes, dependencies)
         self._attr_preset_mode = preset_mode
         await self.coordinator.async_request_refresh()
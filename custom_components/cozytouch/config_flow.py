@@ -8,11 +8,18 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries, exceptions
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
-from .const import DOMAIN
+from .const import (
+    CONF_POLL_INTERVAL_MAX,
+    CONF_STALE_THRESHOLD,
+    DOMAIN,
+    POLL_INTERVAL,
+    POLL_INTERVAL_MAX,
+    STALE_THRESHOLD,
+)
 from .hub import Hub
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,6 +49,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     # changes.
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_PUSH
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow of a device."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
 
@@ -149,17 +164,24 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        options = {**self.config_entry.data, **self.config_entry.options}
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
                     vol.Required(
                         "create_unknown",
-                        default=self.config_entry.data.get("create_unknown"),
+                        default=options.get("create_unknown"),
                     ): bool,
+                    vol.Required("dump_json", default=options.get("dump_json")): bool,
                     vol.Required(
-                        "dump_json", default=self.config_entry.data.get("dump_json")
-                    ): bool,
+                        CONF_POLL_INTERVAL_MAX,
+                        default=options.get(CONF_POLL_INTERVAL_MAX, POLL_INTERVAL_MAX),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=POLL_INTERVAL)),
+                    vol.Required(
+                        CONF_STALE_THRESHOLD,
+                        default=options.get(CONF_STALE_THRESHOLD, STALE_THRESHOLD),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
                 }
             ),
         )
@@ -10,6 +10,20 @@ COZYTOUCH_CLIENT_ID = (
 )
 
 CONF_DUMPJSON = "dumpJSON"
+CONF_POLL_INTERVAL_MAX = "poll_interval_max"
+CONF_STALE_THRESHOLD = "stale_threshold"
+
+# Key of the account hubs in hass.data[DOMAIN]
+DATA_HUBS = "hubs"
+
+# Key of the HTTP session shared by the hubs in hass.data[DOMAIN]
+DATA_SESSION = "session"
+
+# Key of the request scheduler shared by the hubs in hass.data[DOMAIN]
+DATA_SCHEDULER = "scheduler"
+
+# Key of the localization cache shared by the hubs in hass.data[DOMAIN]
+DATA_COUNTRIES = "countries"
 
 
 class CozytouchCapabilityVariableType(IntEnum):
@@ -31,3 +45,39 @@ HEATING_MODE_OFF = "off"
 HEATING_MODE_MANUAL = "manual"
 HEATING_MODE_ECO_PLUS = "eco_plus"
 HEATING_MODE_PROG = "prog"
+
+# Polling schedule (in seconds)
+POLL_INTERVAL = 60
+POLL_INTERVAL_MAX = 300
+POLL_INTERVAL_BURST = 5
+POLL_BURST_DURATION = 30
+
+# Number of unchanged polls before doubling the polling interval
+POLL_IDLE_CYCLES = 5
+
+# Diagnostic capabilities only updated every POLL_SLOW_TIER_CYCLES polls
+# (model name, product number, version, wifi SSID, interface firmware, serial number)
+POLL_SLOW_TIER_CAPABILITIES = frozenset({88, 94, 98, 121, 219, 316, 335})
+POLL_SLOW_TIER_CYCLES = 10
+
+# Maximum number of polling requests per hour and per account
+POLL_REQUEST_BUDGET = 60
+
+# Writes not confirmed by a poll are rolled back after PENDING_WRITE_TIMEOUT
+# seconds, or after PENDING_WRITE_MAX_MISMATCHES polls showing another value
+PENDING_WRITE_TIMEOUT = 60
+PENDING_WRITE_MAX_MISMATCHES = 2
+
+# Devices polled one by one reload the account topology, and check whether
+# the setup provides their capabilities again, every TOPOLOGY_REFRESH_INTERVAL
+# seconds
+TOPOLOGY_REFRESH_INTERVAL = 3600
+
+# The topology is stored for the next start when it changes, and every
+# TOPOLOGY_SAVE_INTERVAL seconds to keep its values recent
+TOPOLOGY_STORAGE_VERSION = 1
+TOPOLOGY_SAVE_INTERVAL = 3600
+
+# Last known values are shown during outages, entities only become unavailable
+# once values are older than STALE_THRESHOLD (in seconds)
+STALE_THRESHOLD = 900
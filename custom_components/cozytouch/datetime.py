@@ -12,7 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, CozytouchCapabilityVariableType
-from .hub import Hub
+from .hub import CozytouchDevice
 from .sensor import CozytouchSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,7 +37,7 @@ async def async_setup_entry(
 
     # Init datetimes
     datetimes = []
-    capabilities = hub.get_capabilities_for_device()
+    capabilities = hub.get_capabilities_for_device(("away_mode_timestamps",))
     for capability in capabilities:
         if capability["type"] == "away_mode_timestamps":
             datetimes.append(
@@ -80,7 +80,7 @@ class CozytouchDateTime(DateTimeEntity, CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         name: str | None = None,
         icon: str | None = None,
         separator: str | None = None,
@@ -142,7 +142,7 @@ class CozytouchAwayModeDateTime(DateTimeEntity, CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         name: str | None = None,
         icon: str | None = None,
         separator: str | None = None,
@@ -0,0 +1,82 @@
+"""Atlantic Cozytouch capability change rate estimator."""
+
+from __future__ import annotations
+
+
+class ChangeRateEstimator:
+    """Learn how often each capability changes.
+
+    The interval between two observed changes of a capability is smoothed with
+    an exponential moving average. Intervals can only be observed with the
+    resolution of the polling, which is good enough to choose the next poll.
+    """
+
+    def __init__(self, alpha: float = 0.3) -> None:
+        """Init estimator."""
+        self._alpha = alpha
+        self._last_change: dict[tuple[int, int], float] = {}
+        self._interval: dict[tuple[int, int], float] = {}
+
+    def observe(self, changes: dict[int, set[int]], now: float) -> None:
+        """Record the capabilities which changed at a given time."""
+        for deviceId, capabilityIds in changes.items():
+            for capabilityId in capabilityIds:
+                key = (deviceId, capabilityId)
+                lastChange = self._last_change.get(key, None)
+                self._last_change[key] = now
+                if lastChange is None:
+                    continue
+
+                interval = now - lastChange
+                if key in self._interval:
+                    self._interval[key] += self._alpha * (
+                        interval - self._interval[key]
+                    )
+                else:
+                    self._interval[key] = interval
+
+    def _get_rate(self, key: tuple[int, int], now: float) -> float:
+        """Get estimated changes per second of a capability."""
+        interval = self._interval.get(key, None)
+        if interval is None:
+            return 0.0
+
+        # A capability which stopped changing slows down on its own
+        interval = max(interval, now - self._last_change[key], 1.0)
+        return 1.0 / interval
+
+    def get_rates(self, deviceId: int, now: float) -> dict[int, float]:
+        """Get estimated changes per hour of the capabilities of a device."""
+        return {
+            key[1]: round(self._get_rate(key, now) * 3600, 1)
+            for key in self._interval
+            if key[0] == deviceId
+        }
+
+    def get_poll_interval(
+        self,
+        deviceIds,
+        minInterval: float,
+        maxInterval: float,
+        now: float,
+    ) -> float | None:
+        """Get the poll interval minimizing staleness within the request budget.
+
+        Polling about once per expected change keeps every change visible
+        quickly without spending requests on polls which find nothing new.
+        Return None while nothing has been learned yet.
+        """
+        totalRate = 0.0
+        learned = False
+        for key in self._interval:
+            if key[0] in deviceIds:
+                learned = True
+                totalRate += self._get_rate(key, now)
+
+        if not learned:
+            return None
+
+        if totalRate <= 0:
+            return maxInterval
+
+        return min(max(1.0 / totalRate, minInterval), maxInterval)
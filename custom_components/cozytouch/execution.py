@@ -0,0 +1,171 @@
+"""Atlantic Cozytouch execution tracker."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from time import monotonic
+
+from homeassistant.core import HomeAssistant
+
+from .const import POLL_INTERVAL_BURST
+
+_LOGGER = logging.getLogger(__name__)
+
+EXECUTION_STATE_WAITING = 1
+EXECUTION_STATE_IN_PROGRESS = 2
+EXECUTION_STATE_COMPLETED = 3
+
+# First check of an execution, after the poll started by the write could
+# confirm it without reading the execution
+EXECUTION_CHECK_DELAY_FIRST = POLL_INTERVAL_BURST + 2.0
+
+# Delay between two later checks of an execution, doubled at each check
+EXECUTION_CHECK_DELAY_MIN = 1.0
+EXECUTION_CHECK_DELAY_MAX = 4.0
+
+# Give up waiting for an execution after this delay (in seconds)
+EXECUTION_TIMEOUT = 20.0
+
+# Fail an execution once its state could not be read this many times
+EXECUTION_MAX_ERRORS = 3
+
+
+class ExecutionTracker:
+    """Follow the pending executions of an account in a single loop.
+
+    Each write gets a future resolved with True once its execution is
+    completed, or False on error or timeout. Each execution is checked with
+    its own delay, growing while it is still running, and the executions due
+    at the same time are checked together. The first check waits for the
+    poll following the write, which usually resolves the execution without a
+    check by showing the written value.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        get_state: Callable[[int], Awaitable[int | None]],
+    ) -> None:
+        """Init tracker, get_state returns the state of an execution."""
+        self._hass = hass
+        self._get_state = get_state
+        self._pending: dict[int, dict] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of pending executions."""
+        return len(self._pending)
+
+    def track(self, executionId: int) -> asyncio.Future:
+        """Start following an execution."""
+        if executionId in self._pending:
+            return self._pending[executionId]["future"]
+
+        now = monotonic()
+        future = self._hass.loop.create_future()
+        self._pending[executionId] = {
+            "future": future,
+            "deadline": now + EXECUTION_TIMEOUT,
+            "check": now + EXECUTION_CHECK_DELAY_FIRST,
+            "delay": EXECUTION_CHECK_DELAY_MIN,
+            "errors": 0,
+        }
+
+        # The loop may be waiting for a later check
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = self._hass.async_create_background_task(
+                self._async_run(), "cozytouch_executions"
+            )
+
+        return future
+
+    def resolve(self, executionId: int, result: bool) -> None:
+        """Resolve an execution without checking it, if it is still pending."""
+        execution = self._pending.pop(executionId, None)
+        if execution is not None and not execution["future"].done():
+            execution["future"].set_result(result)
+
+    async def _async_run(self) -> None:
+        while self._pending:
+            now = monotonic()
+            check = min(execution["check"] for execution in self._pending.values())
+            if check > now:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), check - now)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            executionIds = [
+                executionId
+                for executionId, execution in self._pending.items()
+                if execution["check"] <= now
+            ]
+            states = await asyncio.gather(
+                *(self._get_state(executionId) for executionId in executionIds)
+            )
+
+            now = monotonic()
+            for executionId, state in zip(executionIds, states, strict=True):
+                execution = self._pending.get(executionId, None)
+                if execution is None:
+                    # Resolved by a poll during the check
+                    continue
+
+                result = self._get_result(executionId, execution, state, now)
+                if result is None:
+                    execution["check"] = now + execution["delay"]
+                    execution["delay"] = min(
+                        execution["delay"] * 2, EXECUTION_CHECK_DELAY_MAX
+                    )
+                else:
+                    self.resolve(executionId, result)
+
+    def _get_result(
+        self, executionId: int, execution: dict, state: int | None, now: float
+    ) -> bool | None:
+        """Get the result of a checked execution, None while it is pending."""
+        if state in (EXECUTION_STATE_WAITING, EXECUTION_STATE_IN_PROGRESS):
+            if now < execution["deadline"]:
+                return None
+            _LOGGER.warning("Execution %s timed out", executionId)
+            return False
+
+        if state == EXECUTION_STATE_COMPLETED:
+            _LOGGER.debug("Execution %s completed", executionId)
+            return True
+
+        if state is None:
+            # Network error or API down, checked again later
+            execution["errors"] += 1
+            if (
+                execution["errors"] < EXECUTION_MAX_ERRORS
+                and now < execution["deadline"]
+            ):
+                return None
+            _LOGGER.warning(
+                "Execution %s state not read after %d attempts",
+                executionId,
+                execution["errors"],
+            )
+            return False
+
+        _LOGGER.info("Execution %s error (state %s)", executionId, state)
+        return False
+
+    def cancel(self) -> None:
+        """Stop following executions, pending ones are failed."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        for execution in self._pending.values():
+            if not execution["future"].done():
+                execution["future"].set_result(False)
+        self._pending = {}
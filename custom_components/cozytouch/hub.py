@@ -3,22 +3,58 @@
 from __future__ import annotations
 
 import asyncio
-import copy
-from datetime import UTC, datetime, time as t, timedelta, timezone
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, time as t, timedelta, timezone
 import json
 import logging
+from time import monotonic
+from typing import Any
 
-from aiohttp import ClientError, ClientSession, ClientTimeout, ContentTypeError, FormData
+from aiohttp import ClientError, ClientResponse, ClientTimeout, ContentTypeError
 
-from homeassistant import exceptions
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant import config_entries, exceptions
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.util import dt as dt_util
-
-from .capability import get_capability_infos
-from .const import COZYTOUCH_ATLANTIC_API, COZYTOUCH_CLIENT_ID
+from homeassistant.util import dt as dt_util, slugify
+
+from .auth import LoginError, TokenManager, get_token_store
+from .breaker import CircuitBreaker, CircuitOpenError
+from .capability import get_capability_infos, get_device_capability_infos
+from .const import (
+    COZYTOUCH_ATLANTIC_API,
+    DATA_HUBS,
+    DOMAIN,
+    PENDING_WRITE_MAX_MISMATCHES,
+    PENDING_WRITE_TIMEOUT,
+    POLL_BURST_DURATION,
+    POLL_IDLE_CYCLES,
+    POLL_INTERVAL,
+    POLL_INTERVAL_BURST,
+    POLL_INTERVAL_MAX,
+    POLL_REQUEST_BUDGET,
+    POLL_SLOW_TIER_CAPABILITIES,
+    POLL_SLOW_TIER_CYCLES,
+    STALE_THRESHOLD,
+    TOPOLOGY_REFRESH_INTERVAL,
+    TOPOLOGY_SAVE_INTERVAL,
+    TOPOLOGY_STORAGE_VERSION,
+)
+from .estimator import ChangeRateEstimator
+from .execution import ExecutionTracker
+from .localization import async_get_country_cache
 from .model import get_model_infos
+from .scheduler import (
+    PRIORITY_POLL,
+    PRIORITY_REFRESH,
+    PRIORITY_USER,
+    async_get_scheduler,
+)
+from .session import async_get_session
+from .snapshot import CapabilitySnapshot
+from .topology import TopologyIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,13 +63,30 @@ _LOGGER = logging.getLogger(__name__)
 REQUEST_TIMEOUT = ClientTimeout(total=30)
 
 
+def get_topology_store(hass: HomeAssistant, username: str) -> Store:
+    """Get the store of the topology of an account."""
+    return Store(
+        hass,
+        TOPOLOGY_STORAGE_VERSION,
+        f"{DOMAIN}.topology.{slugify(username.lower())}",
+    )
+
+
+async def async_remove_account_data(hass: HomeAssistant, username: str) -> None:
+    """Remove the tokens and topology stored for an account."""
+    await get_token_store(hass, username).async_remove()
+    await get_topology_store(hass, username).async_remove()
+
+
 class Hub(DataUpdateCoordinator):
-    """Atlantic Cozytouch Hub."""
+    """Atlantic Cozytouch Hub.
+
+    One hub is shared by every config entry of the same account : it owns the
+    HTTP session, the access token and the polling schedule. Entities are bound
+    to a CozytouchDevice view of the hub for their own device.
+    """
 
     manufacturer = "Atlantic Group"
-    _localization = {}
-    _setup = {}
-    _zones = {}
 
     _timestamp_away_mode_last_change = None
     _timestamp_away_mode_start = None
@@ -44,40 +97,88 @@ class Hub(DataUpdateCoordinator):
         hass: HomeAssistant,
         username: str,
         password: str,
-        deviceId: int | None = None,
+        poll_interval_max: int = POLL_INTERVAL_MAX,
+        stale_threshold: int = STALE_THRESHOLD,
     ) -> None:
         """Init hub."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="Cozytouch_" + str(deviceId),
-            update_interval=timedelta(seconds=60),
-        )
-        self._session = ClientSession()
+        # The hub is shared by the config entries of the account, it must not
+        # be shut down with the entry being set up, close() stops it
+        currentEntry = config_entries.current_entry.set(None)
+        try:
+            super().__init__(
+                hass,
+                _LOGGER,
+                name="Cozytouch_" + username.lower(),
+                update_interval=timedelta(seconds=POLL_INTERVAL),
+            )
+        finally:
+            config_entries.current_entry.reset(currentEntry)
+        self.data = CapabilitySnapshot({}, frozenset())
+        self._session = async_get_session(hass)
+        self._scheduler = async_get_scheduler(hass)
+        self._breaker = CircuitBreaker()
         self._host = "none"
         self._hass = hass
         self._username = username
-        self._password = password
-        self._deviceId = deviceId
-        self._zoneId = -1
-        self._access_token = ""
         self._id = "cozytouch." + username.lower()
-        self._create_unknown = False
+        self._auth = TokenManager(
+            hass,
+            self._session,
+            username,
+            password,
+            self._breaker,
+            self._scheduler,
+            self._id,
+        )
         self._dump_json = False
         self._devices = []
+        self._setup = {}
+        self._zones = {}
+        self._topology = TopologyIndex()
+        # Infos of each device, computed once per topology
+        self._model_infos: dict[int, dict] = {}
+        self._device_infos: dict[int, DeviceInfo] = {}
+        # Entities to create for each device, shared by all platforms
+        self._capability_plans: dict[int, dict] = {}
+        self._localization = {}
+        self._localization_task: asyncio.Task | None = None
+        self._views: dict[int, CozytouchDevice] = {}
+        self._batched_poll = True
+        # Polled devices whose capabilities were missing from the last setup
+        self._setup_missing: set[int] = set()
+        # Monotonic time the devices were last read from the setup, None if never
+        self._topology_updated: float | None = None
+
+        # Topology of the last run, to create entities without waiting for the API
+        self._topology_store = get_topology_store(hass, username)
+        self._topology_cache_loaded = False
+        self._topology_saved: float | None = None
+        self._topology_signature = None
+        self._dispatched = None
+        self._dispatched_availability = (False, False, None)
+        self._changes: dict[int, set[int]] | None = None
+
+        # Adaptive polling
+        self._poll_interval_max = max(poll_interval_max, POLL_INTERVAL)
+        self._poll_generation = None
+        self._poll_idle_cycles = 0
+        self._poll_cycle = 0
+        self._burst_until: float = 0
+        self._slow_changes: dict[int, set[int]] = {}
+        self._change_rates = ChangeRateEstimator()
+        self._executions = ExecutionTracker(hass, self._async_get_execution_state)
+        self._connect_lock = asyncio.Lock()
+
+        # Written values shown before a poll confirms them, by (deviceId, capabilityId)
+        self._pending_writes: dict[tuple[int, int], dict] = {}
 
         self.online = False
-        self._token_expiry: float = 0  # Unix timestamp; 0 = unknown/expired
 
-        modelInfos = self.get_model_infos()
-        if "name" in modelInfos:
-            self.device_info = DeviceInfo(
-                entry_type=DeviceEntryType.SERVICE,
-                identifiers={("cozytouch", "cozytouch" + str(deviceId))},
-                manufacturer="Atlantic",
-                name=modelInfos["name"],
-            )
+        # Last known values are served until they are older than the threshold
+        self._stale_threshold = stale_threshold
+        self._last_updated_remote: datetime | None = None
 
+        self._timestamps_away_mode_device_id = None
         self._timestamps_away_mode_capability_id = None
 
         # Load json for test during dev
@@ -102,136 +203,298 @@ class Hub(DataUpdateCoordinator):
         await self.connect()
         return self.online
 
+    def get_device(self, deviceId: int) -> CozytouchDevice:
+        """Get (or create) the view of the hub for a device."""
+        if deviceId not in self._views:
+            self._views[deviceId] = CozytouchDevice(self, deviceId)
+
+        return self._views[deviceId]
+
+    def remove_device(self, deviceId: int) -> bool:
+        """Remove the view of a device, return True if the hub is no longer used."""
+        view = self._views.pop(deviceId, None)
+        if view is not None:
+            view.close()
+
+        return len(self._views) == 0
+
     async def connect(self) -> bool:
         """Connect to Cozytouch server."""
-        if self.online is False:
-            try:
-                async with self._session.post(
-                    COZYTOUCH_ATLANTIC_API + "/users/token",
-                    data=FormData(
-                        {
-                            "grant_type": "password",
-                            "scope": "openid",
-                            "username": "GA-PRIVATEPERSON/" + self._username,
-                            "password": self._password,
-                        }
-                    ),
-                    headers={
-                        "Authorization": f"Basic {COZYTOUCH_CLIENT_ID}",
-                        "Content-Type": "application/x-www-form-urlencoded",
-                    },
-                    timeout=REQUEST_TIMEOUT,
-                ) as response:
-                    token = await response.json()
+        # Config entries of the same account share the hub, only login once
+        async with self._connect_lock:
+            return await self._connect()
+
+    async def _connect(self) -> bool:
+        if self._topology_updated is None:
+            # Don't login before the circuit breaker lets requests through
+            if self._breaker.get_retry_delay() > 0:
+                self.online = False
+                return False
 
-                    if "error" in token and token["error"] == "invalid_grant":
-                        raise CannotConnect
+            # A stored or renewed token avoids a login
+            if await self._auth.async_get_token() is None:
+                self.online = False
+                return False
 
-                    if "token_type" not in token:
-                        raise CannotConnect
+            self.online = await self._async_update_setup()
+            if self.online:
+                self._last_updated_remote = dt_util.utcnow()
+                self._schedule_localization_update()
 
-                    if "access_token" not in token:
-                        raise CannotConnect
+        return self.online
 
-                    self._access_token = token["access_token"]
-                    # Track token expiry; fall back to 1 hour if not provided
-                    expires_in = token.get("expires_in", 3600)
-                    self._token_expiry = datetime.now(UTC).timestamp() + expires_in - 60
+    @property
+    def available(self) -> bool:
+        """Return True if values are fresh, or stale for less than the threshold."""
+        if self.online:
+            return True
 
-                headers = {
-                    "Authorization": f"Bearer {self._access_token}",
-                    "Content-Type": "application/json",
-                }
-                async with self._session.get(
-                    COZYTOUCH_ATLANTIC_API + "/magellan/cozytouch/setupviewv2",
-                    headers=headers,
-                    timeout=REQUEST_TIMEOUT,
-                ) as response:
-                    json_data = await response.json()
+        staleness = self.get_staleness()
+        return staleness is not None and staleness < self._stale_threshold
 
-                    # Store setup
-                    for key in (
-                        "absence",
-                        "address",
-                        "area",
-                        "currency",
-                        "id",
-                        "mainDHWEnergy",
-                        "mainHeatingEnergy",
-                        "name",
-                        "numberOfPersons",
-                        "numberOfRooms",
-                        "setupBuildingDate",
-                        "type",
-                    ):
-                        if key in json_data[0]:
-                            self._setup[key] = copy.deepcopy(json_data[0][key])
-
-                    # Update devices infos
-                    await asyncio.get_event_loop().run_in_executor(
-                        None, self.update_devices_from_json_data, json_data
-                    )
+    def get_staleness(self) -> float | None:
+        """Get seconds since values were last read, None if never read."""
+        if self._last_updated_remote is None:
+            return None
 
-                    # Store country to retrieve localization informations
-                    if "address" in json_data[0]:
-                        await self._update_localization(
-                            json_data[0]["address"].get("country", None)
-                        )
+        return (dt_util.utcnow() - self._last_updated_remote).total_seconds()
 
-                    # Store zones informations
-                    if "zones" in json_data[0]:
-                        copy.deepcopy(json_data[0]["zones"])
+    def get_staleness_attributes(self) -> dict:
+        """Get attributes of entities serving last known values, empty if fresh."""
+        if self.online:
+            return {}
+
+        return {
+            "stale": True,
+            "last_updated_remote": None
+            if self._last_updated_remote is None
+            else self._last_updated_remote.isoformat(),
+        }
+
+    async def async_load_topology(self) -> None:
+        """Load the devices of the last run, if the topology was not read yet."""
+        async with self._connect_lock:
+            if self._topology_cache_loaded or self._topology_updated is not None:
+                return
+            self._topology_cache_loaded = True
+
+            data = await self._topology_store.async_load()
+            if not isinstance(data, dict) or not isinstance(data.get("setup"), list):
+                return
+
+            _LOGGER.debug("%s: using cached topology", self.name)
+            self.update_devices_from_json_data(data["setup"])
+            if data.get("last_updated_remote", None) is not None:
+                self._last_updated_remote = dt_util.parse_datetime(
+                    data["last_updated_remote"]
+                )
 
-                self.online = True
+    def has_device(self, deviceId: int) -> bool:
+        """Return True if the device is known, from the API or the cache."""
+        return self._get_device(deviceId) is not None
 
-            except CannotConnect:
-                self.online = False
-            except (ClientError, asyncio.TimeoutError) as err:
-                _LOGGER.warning("connect: network error: %s", err)
-                self.online = False
+    def _save_topology(self) -> None:
+        """Store the topology when it changed, or its values from time to time."""
+        if self._get_account_hub() is not self:
+            # Temporary hub of the config flow, the store belongs to the account hub
+            return
 
-        return self.online
+        signature = [
+            (
+                dev["deviceId"],
+                dev["name"],
+                dev["gatewaySerialNumber"],
+                dev["modelId"],
+                dev["zoneId"],
+                dev["tags"],
+                [capability["capabilityId"] for capability in dev["capabilities"]],
+            )
+            for dev in self._devices
+        ]
+        signature.append(self._zones)
+        now = monotonic()
+        if (
+            signature == self._topology_signature
+            and self._topology_saved is not None
+            and now - self._topology_saved < TOPOLOGY_SAVE_INTERVAL
+        ):
+            return
 
-    async def close(self) -> None:
-        """Close session."""
-        await self._session.close()
+        self._topology_signature = signature
+        self._topology_saved = now
+        self._topology_store.async_delay_save(self._get_topology_data, 10)
 
-    def update_devices_from_json_data(self, json_data) -> None:
-        """Update the devices list."""
+    def _get_topology_data(self) -> dict:
+        """Get the topology to store, in the setup format of the API."""
+        devices = []
+        for dev in self._devices:
+            device = {
+                key: dev[key]
+                for key in (
+                    "deviceId",
+                    "name",
+                    "gatewaySerialNumber",
+                    "modelId",
+                    "productId",
+                    "zoneId",
+                    "tags",
+                )
+            }
+            device["capabilities"] = [
+                {
+                    "capabilityId": capability["capabilityId"],
+                    "value": capability["value"],
+                }
+                for capability in dev["capabilities"]
+            ]
+            devices.append(device)
+
+        return {
+            "last_updated_remote": None
+            if self._last_updated_remote is None
+            else self._last_updated_remote.isoformat(),
+            "setup": [{"zones": self._zones, "devices": devices}],
+        }
+
+    def _get_country(self) -> str | None:
+        """Get the country of the setup, used for localization."""
+        return self._setup.get("address", {}).get("country", None)
+
+    def _get_account_hub(self) -> Hub | None:
+        """Get the hub shared by the config entries of the account, if any."""
+        return (
+            self._hass.data.get(DOMAIN, {})
+            .get(DATA_HUBS, {})
+            .get(self._username.lower(), None)
+        )
 
-        if self._dump_json:
-            with open(
-                self._hass.config.config_dir + "/Cozytouch.json", "w", encoding="utf-8"
-            ) as outfile:
-                json_object = json.dumps(json_data, indent=4)
-                outfile.write(json_object)
+    async def close(self) -> None:
+        """Stop background tasks, the shared session is closed with Home Assistant."""
+        await self.async_shutdown()
+        self._executions.cancel()
+        self._auth.close()
+        if self._localization_task is not None:
+            self._localization_task.cancel()
+
+        # The requests queue of the account is shared with the hub of the
+        # config entries, a temporary hub of the config flow must keep it
+        if self._get_account_hub() in (None, self):
+            self._scheduler.remove_account(self._id)
+
+            # Write a delayed save now, the store is removed with the account
+            if self._topology_signature is not None:
+                await self._topology_store.async_save(self._get_topology_data())
+
+    @asynccontextmanager
+    async def _async_request(
+        self, method: str, path: str, priority: int = PRIORITY_POLL, **kwargs
+    ):
+        """Send an authenticated request to the API.
+
+        Requests wait for the scheduler, which serves user actions first. A
+        request rejected with 401 is sent once more with a new token, the
+        login being shared with other requests rejected at the same time.
+        While the circuit breaker is open, CircuitOpenError is raised, and
+        LoginError without a token.
+        """
+        if not self._breaker.allow_request():
+            raise CircuitOpenError("Circuit open, API considered down")
+
+        token = await self._auth.async_get_token()
+        if token is None:
+            raise LoginError("Login failed, request not sent")
+
+        response = await self._async_send(method, path, token, priority, **kwargs)
+        if response.status == 401:
+            newToken = await self._auth.async_renew(token)
+            if newToken is not None:
+                response.release()
+                response = await self._async_send(
+                    method, path, newToken, priority, **kwargs
+                )
 
-        # Get zones
-        if len(self._zones) == 0 and "zones" in json_data[0]:
-            self._zones = copy.deepcopy(json_data[0]["zones"])
+        try:
+            yield response
+        finally:
+            response.release()
+
+    async def _async_send(
+        self, method: str, path: str, token: str, priority: int, **kwargs
+    ) -> ClientResponse:
+        """Send a request when the scheduler allows it, feed the circuit breaker."""
+        await self._scheduler.async_acquire(self._id, priority)
+        try:
+            response = await self._session.request(
+                method,
+                COZYTOUCH_ATLANTIC_API + path,
+                headers=self._get_headers(token),
+                timeout=REQUEST_TIMEOUT,
+                **kwargs,
+            )
+        except (ClientError, asyncio.TimeoutError):
+            self._breaker.record_failure()
+            raise
+
+        self._breaker.record_response(response.status, response.headers)
+        return response
+
+    def get_circuit_breaker_diagnostics(self) -> dict:
+        """Get state of the circuit breaker of the account."""
+        return self._breaker.get_diagnostics()
+
+    def _get_headers(self, token: str) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+
+    def dump_json_data(self, json_data) -> None:
+        """Dump the setup JSON from API to the config directory."""
+        with open(
+            self._hass.config.config_dir + "/Cozytouch.json", "w", encoding="utf-8"
+        ) as outfile:
+            json_object = json.dumps(json_data, indent=4)
+            outfile.write(json_object)
+
+    def update_devices_from_json_data(
+        self, json_data, polledAt: float | None = None
+    ) -> set[int]:
+        """Update the devices list.
+
+        The freshly decoded JSON is owned by the hub, parts of it are kept
+        without copy and must not be modified afterwards.
+        Return IDs of polled devices whose capabilities are missing from the setup.
+        """
+        missing = set()
+
+        topologyChanged = False
+
+        # Get zones, they can be renamed in the app
+        if "zones" in json_data[0] and json_data[0]["zones"] != self._zones:
+            self._zones = json_data[0]["zones"]
+            self._topology.set_zones(self._zones)
+            topologyChanged = True
 
         # Start by removing old devices
-        for local_device in self._devices[:]:
-            bStillExists = False
-            for remote_device in json_data[0]["devices"]:
-                if remote_device["deviceId"] == local_device["deviceId"]:
-                    bStillExists = True
-                    break
-
-            if bStillExists is False:
-                self._devices.remove(local_device)
+        remoteIds = {
+            remote_device["deviceId"] for remote_device in json_data[0]["devices"]
+        }
+        for local_device in self._devices:
+            if local_device["deviceId"] not in remoteIds:
+                self._topology.remove_device(local_device)
+                topologyChanged = True
+
+        if topologyChanged:
+            self._devices = [
+                local_device
+                for local_device in self._devices
+                if local_device["deviceId"] in remoteIds
+            ]
 
         # Create new devices
-        deviceIndex = -1
         for remote_device in json_data[0]["devices"]:
-            deviceIndex = -1
-            for i, local_device in enumerate(self._devices):
-                if remote_device["deviceId"] == local_device["deviceId"]:
-                    deviceIndex = i
-                    self._zoneId = remote_device["zoneId"]
-                    break
-
-            if deviceIndex == -1:
+            device = self._topology.get_device(remote_device["deviceId"])
+            if device is None:
                 device = {
                     "deviceId": remote_device["deviceId"],
                     "name": remote_device["name"],
@@ -244,117 +507,484 @@ class Hub(DataUpdateCoordinator):
                     "tags": [],
                 }
                 if "tags" in remote_device:
-                    device["tags"] = copy.deepcopy(remote_device["tags"])
+                    device["tags"] = remote_device["tags"]
 
                 self._devices.append(device)
-                deviceIndex = len(self._devices) - 1
+                self._topology.add_device(device)
+                topologyChanged = True
+            else:
+                # Devices can be renamed, moved to another zone or re-paired
+                updates = {
+                    key: remote_device[key]
+                    for key in ("name", "gatewaySerialNumber", "zoneId", "tags")
+                    if key in remote_device and remote_device[key] != device[key]
+                }
+                if updates:
+                    self._topology.remove_device(device)
+                    device.update(updates)
+                    self._topology.add_device(device)
+                    topologyChanged = True
+
+            # Retrieve capabilities of all devices of the account
+            if isinstance(remote_device.get("capabilities", None), list):
+                device["capabilities"] = remote_device["capabilities"]
+            elif remote_device["deviceId"] in self._views:
+                missing.add(remote_device["deviceId"])
+
+        if topologyChanged:
+            self._model_infos.clear()
+            self._device_infos.clear()
+            self._capability_plans.clear()
+
+        self._update_snapshot(polledAt)
+        return missing
+
+    def _update_snapshot(self, polledAt: float | None = None) -> None:
+        """Publish the current capability values as coordinator data.
+
+        polledAt is the time the polled values were requested, pending writes
+        are reconciled with them.
+        """
+        if polledAt is not None:
+            self._reconcile_pending_writes(polledAt)
+
+        self.data = CapabilitySnapshot.from_devices(
+            self._devices,
+            self.data,
+            {key: pending["value"] for key, pending in self._pending_writes.items()},
+        )
 
-            # Only retrieve capabilites from current device
-            if self._deviceId == remote_device["deviceId"]:
-                self._devices[deviceIndex]["capabilities"] = copy.deepcopy(
-                    remote_device["capabilities"]
-                )
+    def _reconcile_pending_writes(self, polledAt: float) -> None:
+        """Confirm or roll back pending writes from polled values."""
+        now = monotonic()
+        for key, pending in list(self._pending_writes.items()):
+            capability = self._get_capability(key[0], key[1])
+            if capability is not None and capability["value"] == pending["value"]:
+                # The poll shows the written value, no need to check the execution
+                if pending["execution"] is not None:
+                    self._executions.resolve(pending["execution"], True)
+                del self._pending_writes[key]
+                continue
+
+            if pending["completed"] is None or polledAt < pending["completed"]:
+                # Poll requested before the device applied the write
+                if now - pending["accepted"] < PENDING_WRITE_TIMEOUT:
+                    continue
+            else:
+                pending["mismatches"] += 1
+                if pending["mismatches"] < PENDING_WRITE_MAX_MISMATCHES:
+                    continue
+
+            _LOGGER.warning(
+                "Write of capability %d of device %d not confirmed, rolling back",
+                key[1],
+                key[0],
+            )
+            del self._pending_writes[key]
 
-    def set_create_entities_for_unknown_entities(self, create_unknown: bool) -> None:
-        """Set option from config flow to create entities for unknown capabilities."""
-        self._create_unknown = create_unknown
+    def _set_pending_write(
+        self,
+        deviceId: int,
+        capabilityId: int,
+        value: str,
+        executionId: int | None = None,
+    ) -> None:
+        """Show a written value until a poll confirms it."""
+        self._pending_writes[(deviceId, capabilityId)] = {
+            "value": value,
+            "execution": executionId,
+            "accepted": monotonic(),
+            "completed": None,
+            "mismatches": 0,
+        }
+        self._update_snapshot()
+        self._async_publish()
+
+    def _drop_pending_write(self, deviceId: int, capabilityId: int, value: str) -> None:
+        """Roll back a pending write, unless a newer one replaced it."""
+        pending = self._pending_writes.get((deviceId, capabilityId), None)
+        if pending is None or pending["value"] != value:
+            return
 
-    def get_create_entities_for_unknown_entities(self) -> bool:
-        """Get option from config flow to create entities for unknown capabilities."""
-        return self._create_unknown
+        del self._pending_writes[(deviceId, capabilityId)]
+        self._update_snapshot()
+        self._async_publish()
+
+    def is_capability_pending(self, deviceId: int, capabilityId: int) -> bool:
+        """Return True if a written value is not confirmed by a poll yet."""
+        return (deviceId, capabilityId) in self._pending_writes
+
+    @callback
+    def _async_publish(self) -> None:
+        """Update entities with the current data, outside of a poll."""
+        self._update_changes(observe=False)
+        self.async_update_listeners()
+
+    def _get_device(self, deviceId: int):
+        return self._topology.get_device(deviceId)
 
     def set_dump_json(self, dump_json: bool) -> None:
         """Set option from config flow to dump JSON from API."""
         self._dump_json = dump_json
 
+    def set_poll_interval_max(self, poll_interval_max: int) -> None:
+        """Set option from options flow limiting the polling interval (in seconds)."""
+        self._poll_interval_max = max(poll_interval_max, POLL_INTERVAL)
+
+    def set_stale_threshold(self, stale_threshold: int) -> None:
+        """Set option from options flow keeping stale values shown (in seconds)."""
+        self._stale_threshold = stale_threshold
+
     async def _async_update_data(self):
-        _LOGGER.debug("_async_update_data %d", self._deviceId)
+        _LOGGER.debug("_async_update_data %s", self.name)
         if self._test_load:
-            return
+            return self.data
+
+        if self._topology_updated is not None:
+            # The topology is kept on errors, the next poll only retries them
+            polled = True
+
+            # One request for the whole account, completed by one request per
+            # device whose capabilities are missing from the setup. If the setup
+            # provides no capabilities, devices are polled one by one and the
+            # setup is only read again from time to time.
+            if (
+                self._batched_poll
+                or monotonic() - self._topology_updated >= TOPOLOGY_REFRESH_INTERVAL
+            ):
+                polled = await self._async_update_setup()
+
+            if polled:
+                for deviceId in self._get_device_poll_ids():
+                    if not await self._async_update_device(deviceId):
+                        polled = False
+                        break
+
+            self.online = polled
+            if polled:
+                self._last_updated_remote = dt_util.utcnow()
+
+            # Localization is not needed to poll, retry it from time to time
+            if (
+                self.online
+                and len(self._localization) == 0
+                and self._poll_cycle % POLL_SLOW_TIER_CYCLES == 0
+            ):
+                self._schedule_localization_update()
+
+            if (
+                self.online
+                and self._timestamp_away_mode_last_change is not None
+                and self._timestamps_away_mode_capability_id is not None
+                and self._timestamp_away_mode_start is not None
+                and self._timestamp_away_mode_end is not None
+            ):
+                now = datetime.now(tz=dt_util.DEFAULT_TIME_ZONE).timestamp()
+                if now - self._timestamp_away_mode_last_change > 20:
+                    await self.set_away_mode_timestamps(
+                        self._timestamps_away_mode_device_id,
+                        None,
+                        None,
+                        self._timestamps_away_mode_capability_id,
+                        self._timestamp_away_mode_start,
+                        self._timestamp_away_mode_end,
+                    )
 
-        # Proactively re-authenticate if the token is about to expire
-        if self.online and datetime.now(UTC).timestamp() >= self._token_expiry:
-            _LOGGER.info("Token expired or about to expire, re-authenticating")
-            self.online = False
+        else:
+            await self.connect()
 
-        if self.online:
-            try:
-                headers = {
-                    "Authorization": f"Bearer {self._access_token}",
-                    "Content-Type": "application/json",
-                }
-                async with self._session.get(
-                    COZYTOUCH_ATLANTIC_API
-                    + "/magellan/capabilities/?deviceId="
-                    + str(self._deviceId),
-                    headers=headers,
-                    timeout=REQUEST_TIMEOUT,
-                ) as response:
-                    # 401 means the token was rejected; force re-auth next poll
-                    if response.status == 401:
-                        _LOGGER.warning("Got 401, forcing re-authentication next poll")
-                        self.online = False
-                        return
+        self._poll_cycle += 1
+        self._update_changes()
+        self._update_poll_interval()
+        return self.data
 
-                    if response.status != 200:
-                        _LOGGER.warning(
-                            "Unexpected status %d from capabilities endpoint",
-                            response.status,
-                        )
-                        self.online = False
-                        return
-
-                    try:
-                        json_data = await response.json()
-                    except ContentTypeError:
-                        _LOGGER.warning("Non-JSON response from capabilities endpoint")
-                        self.online = False
-                        return
-
-                    if isinstance(json_data, list):
-                        for dev in self._devices:
-                            if dev["deviceId"] == self._deviceId:
-                                dev["capabilities"] = copy.deepcopy(json_data)
-                                break
-
-                        if (
-                            self._timestamp_away_mode_last_change is not None
-                            and self._timestamps_away_mode_capability_id is not None
-                            and self._timestamp_away_mode_start is not None
-                            and self._timestamp_away_mode_end is not None
-                        ):
-                            now = datetime.now(tz=dt_util.DEFAULT_TIME_ZONE).timestamp()
-                            if now - self._timestamp_away_mode_last_change > 20:
-                                await self.set_away_mode_timestamps(
-                                    None,
-                                    None,
-                                    self._timestamps_away_mode_capability_id,
-                                    self._timestamp_away_mode_start,
-                                    self._timestamp_away_mode_end,
-                                )
-                    else:
-                        _LOGGER.warning(
-                            "Capabilities response is not a list (got %s), forcing reconnect",
-                            type(json_data).__name__,
-                        )
-                        self.online = False
+    def _update_changes(self, observe: bool = True) -> None:
+        """Compute capabilities changed since the last update of the entities.
 
-            except asyncio.TimeoutError:
-                _LOGGER.warning(
-                    "Timeout fetching capabilities for device %d, forcing reconnect",
-                    self._deviceId,
+        Changes made locally by writes are not observed as change rates.
+        """
+        availability = (
+            self.online,
+            self.available,
+            self._breaker.get_diagnostics(),
+        )
+        if availability != self._dispatched_availability:
+            # Availability or staleness of every entity may change, and the
+            # circuit breaker is shown by an entity of every device
+            self._changes = None
+        else:
+            self._changes = self.data.changes_since(self._dispatched)
+
+        self._dispatched = self.data
+        self._dispatched_availability = availability
+
+        if self._changes is None:
+            self._slow_changes = {}
+            return
+
+        if observe:
+            self._change_rates.observe(self._changes, monotonic())
+
+        # Slow tier capabilities are only updated every few polls or after a write
+        slowTier = (
+            self._poll_cycle % POLL_SLOW_TIER_CYCLES == 0
+            or monotonic() < self._burst_until
+        )
+        for deviceId, capabilityIds in self._changes.items():
+            slowIds = capabilityIds & POLL_SLOW_TIER_CAPABILITIES
+            if slowIds:
+                capabilityIds -= slowIds
+                self._slow_changes.setdefault(deviceId, set()).update(slowIds)
+
+        if slowTier:
+            for deviceId, slowIds in self._slow_changes.items():
+                self._changes.setdefault(deviceId, set()).update(slowIds)
+            self._slow_changes = {}
+
+    def _update_poll_interval(self) -> None:
+        """Choose the delay before the next poll."""
+        if self.data.generation == self._poll_generation:
+            self._poll_idle_cycles += 1
+        else:
+            self._poll_idle_cycles = 0
+        self._poll_generation = self.data.generation
+
+        now = monotonic()
+        if not self.online:
+            # Don't poll before the circuit breaker lets requests through
+            interval = max(POLL_INTERVAL, round(self._breaker.get_retry_delay()))
+        elif now < self._burst_until:
+            # Confirm a recent write quickly
+            interval = POLL_INTERVAL_BURST
+        else:
+            # Follow the learned change rates, within the request budget
+            requestsPerPoll = max(
+                int(self._batched_poll) + len(self._get_device_poll_ids()), 1
+            )
+            interval = self._change_rates.get_poll_interval(
+                self._views,
+                3600 * requestsPerPoll / POLL_REQUEST_BUDGET,
+                self._poll_interval_max,
+                now,
+            )
+
+            if interval is None:
+                # Nothing learned yet, back off while nothing changes
+                interval = min(
+                    POLL_INTERVAL * 2 ** (self._poll_idle_cycles // POLL_IDLE_CYCLES),
+                    self._poll_interval_max,
                 )
-                self.online = False
-            except ClientError as err:
-                _LOGGER.warning(
-                    "Network error fetching capabilities for device %d: %s, forcing reconnect",
-                    self._deviceId,
-                    err,
+            interval = round(interval)
+
+        if self.update_interval != timedelta(seconds=interval):
+            _LOGGER.debug("%s: polling every %d s", self.name, interval)
+            self.update_interval = timedelta(seconds=interval)
+
+    def _get_polled_ids(self) -> list[int]:
+        """Get IDs of the devices configured in Home Assistant and in the setup."""
+        return [deviceId for deviceId in self._views if self.has_device(deviceId)]
+
+    def _get_device_poll_ids(self) -> list[int]:
+        """Get IDs of the devices to poll one by one."""
+        if self._batched_poll:
+            return [
+                deviceId for deviceId in self._views if deviceId in self._setup_missing
+            ]
+
+        return self._get_polled_ids()
+
+    def _get_poll_priority(self) -> int:
+        """Get the priority of a poll, polls confirming a write come first."""
+        if monotonic() < self._burst_until:
+            return PRIORITY_REFRESH
+
+        return PRIORITY_POLL
+
+    def get_request_diagnostics(self) -> dict:
+        """Get queue depth and wait times of the requests of the account."""
+        return self._scheduler.get_diagnostics(self._id)
+
+    def get_poll_interval(self) -> int:
+        """Get the current polling interval in seconds."""
+        return int(self.update_interval.total_seconds())
+
+    def get_change_rates(self, deviceId: int) -> dict[int, float]:
+        """Get learned changes per hour of the capabilities of a device."""
+        return self._change_rates.get_rates(deviceId, monotonic())
+
+    def start_poll_burst(self) -> None:
+        """Poll quickly for a while after a write."""
+        self._burst_until = monotonic() + POLL_BURST_DURATION
+        self._poll_idle_cycles = 0
+
+        # Bring the next poll forward, it confirms the pending writes
+        if self.update_interval != timedelta(seconds=POLL_INTERVAL_BURST):
+            self.update_interval = timedelta(seconds=POLL_INTERVAL_BURST)
+            self._schedule_refresh()
+
+    def get_changes(self, deviceId: int) -> set[int] | None:
+        """Get capabilities of a device changed by the last update, None for all."""
+        if self._changes is None:
+            return None
+
+        return self._changes.get(deviceId, set())
+
+    async def _async_update_setup(self) -> bool:
+        """Refresh capabilities of all devices from the account setup.
+
+        Return False if connection is lost.
+        """
+        polledAt = monotonic()
+        try:
+            async with self._async_request(
+                "GET", "/magellan/cozytouch/setupviewv2", self._get_poll_priority()
+            ) as response:
+                # 401 means a new token was rejected too; reconnect next poll
+                if response.status == 401:
+                    _LOGGER.warning("Got 401, forcing re-authentication next poll")
+                    self.online = False
+                    return False
+
+                if response.status != 200:
+                    _LOGGER.warning(
+                        "Unexpected status %d from setup endpoint",
+                        response.status,
+                    )
+                    self.online = False
+                    return False
+
+                try:
+                    json_data = await response.json()
+                except ContentTypeError:
+                    _LOGGER.warning("Non-JSON response from setup endpoint")
+                    self.online = False
+                    return False
+
+                if (
+                    not isinstance(json_data, list)
+                    or len(json_data) == 0
+                    or "devices" not in json_data[0]
+                ):
+                    _LOGGER.warning("Invalid response from setup endpoint")
+                    self.online = False
+                    return False
+
+                # Store setup
+                for key in (
+                    "absence",
+                    "address",
+                    "area",
+                    "currency",
+                    "id",
+                    "mainDHWEnergy",
+                    "mainHeatingEnergy",
+                    "name",
+                    "numberOfPersons",
+                    "numberOfRooms",
+                    "setupBuildingDate",
+                    "type",
+                ):
+                    if key in json_data[0]:
+                        self._setup[key] = json_data[0][key]
+
+                if self._dump_json and self._topology_updated is None:
+                    await asyncio.get_event_loop().run_in_executor(
+                        None, self.dump_json_data, json_data
+                    )
+
+                missing = self.update_devices_from_json_data(json_data, polledAt)
+                self._topology_updated = polledAt
+                self._save_topology()
+                self._update_batched_poll(missing)
+
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Timeout fetching setup, retrying next poll")
+            self.online = False
+            return False
+        except ClientError as err:
+            _LOGGER.warning("Network error fetching setup: %s, retrying next poll", err)
+            self.online = False
+            return False
+
+        return True
+
+    def _update_batched_poll(self, missing: set[int]) -> None:
+        """Choose how to poll from the capabilities missing from the setup."""
+        # Keep polling the whole account if the setup has any polled device
+        batched = len(missing) == 0 or len(missing) < len(self._get_polled_ids())
+        if batched != self._batched_poll:
+            if batched:
+                _LOGGER.info("Capabilities back in setup, polling the whole account")
+            else:
+                _LOGGER.info(
+                    "Capabilities missing from setup, polling devices one by one"
                 )
-                self.online = False
 
-        else:
-            await self.connect()
+        self._batched_poll = batched
+        self._setup_missing = missing
+
+    async def _async_update_device(self, deviceId: int) -> bool:
+        """Refresh capabilities of a device, return False if connection is lost."""
+        polledAt = monotonic()
+        try:
+            async with self._async_request(
+                "GET",
+                "/magellan/capabilities/?deviceId=" + str(deviceId),
+                self._get_poll_priority(),
+            ) as response:
+                # 401 means a new token was rejected too; reconnect next poll
+                if response.status == 401:
+                    _LOGGER.warning("Got 401, forcing re-authentication next poll")
+                    self.online = False
+                    return False
+
+                if response.status != 200:
+                    _LOGGER.warning(
+                        "Unexpected status %d from capabilities endpoint",
+                        response.status,
+                    )
+                    self.online = False
+                    return False
+
+                try:
+                    json_data = await response.json()
+                except ContentTypeError:
+                    _LOGGER.warning("Non-JSON response from capabilities endpoint")
+                    self.online = False
+                    return False
+
+                if isinstance(json_data, list):
+                    dev = self._get_device(deviceId)
+                    if dev is not None:
+                        # Decoded JSON is not shared, no need to copy it
+                        dev["capabilities"] = json_data
+
+                    self._update_snapshot(polledAt)
+                else:
+                    _LOGGER.warning(
+                        "Capabilities response is not a list (got %s), retrying next poll",
+                        type(json_data).__name__,
+                    )
+                    self.online = False
+                    return False
+
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "Timeout fetching capabilities for device %d, retrying next poll",
+                deviceId,
+            )
+            self.online = False
+            return False
+        except ClientError as err:
+            _LOGGER.warning(
+                "Network error fetching capabilities for device %d: %s, retrying next poll",
+                deviceId,
+                err,
+            )
+            self.online = False
+            return False
+
+        return True
 
     def devices(self):
         """Get devices list."""
@@ -370,96 +1000,128 @@ class Hub(DataUpdateCoordinator):
 
         return devs
 
-    def get_zone_name(self, zoneId: int | None = None) -> str:
+    def get_zone_name(self, zoneId: int) -> str:
         """Get zone infos."""
-        if not zoneId:
-            zoneId = self._zoneId
-
-        for zone in self._zones:
-            if "id" in zone and zone["id"] == zoneId:
-                return zone["name"]
+        name = self._topology.get_zone_name(zoneId)
+        if name is not None:
+            return name
 
         return str(zoneId)
 
-    def get_model_infos(self, deviceId: int | None = None) -> str:
+    def get_model_infos(self, deviceId: int) -> str:
         """Get model infos."""
-        if not deviceId:
-            deviceId = self._deviceId
+        if deviceId not in self._model_infos:
+            self._model_infos[deviceId] = self._get_model_infos(deviceId)
 
-        for dev in self._devices:
-            if dev["deviceId"] == deviceId:
-                zoneId = dev["zoneId"]
-
-                # Special case for sub-devices, use master zone Id
-                for masterDev in self._devices:
-                    if "tags" in masterDev:
-                        for tag in masterDev["tags"]:
-                            if (
-                                "label" in tag
-                                and tag["label"] == "iothubChildrenIds"
-                                and "value" in tag
-                                and tag["value"] == dev["name"]
-                            ):
-                                zoneId = masterDev["zoneId"]
-                                break
-
-                return get_model_infos(dev["modelId"], self.get_zone_name(zoneId))
-
-        return get_model_infos(-1)
-
-    def get_serial_number(self, deviceId: int | None = None) -> str:
-        """Get serial number."""
-        if not deviceId:
-            deviceId = self._deviceId
+        return self._model_infos[deviceId]
 
-        for dev in self._devices:
-            if dev["deviceId"] == deviceId:
-                return dev["gatewaySerialNumber"]
+    def _get_model_infos(self, deviceId: int):
+        dev = self._get_device(deviceId)
+        if dev is None:
+            return get_model_infos(-1)
 
-        return "Unknown"
+        zoneId = dev["zoneId"]
 
-    def get_capabilities_for_device(self, deviceId: int | None = None):
-        """Get capabilities for a device."""
+        # Special case for sub-devices, use master zone Id
+        masterDev = self._topology.get_master(dev["name"])
+        if masterDev is not None:
+            zoneId = masterDev["zoneId"]
 
-        if not deviceId:
-            deviceId = self._deviceId
+        return get_model_infos(dev["modelId"], self.get_zone_name(zoneId))
 
-        capabilities = []
-        for dev in self._devices:
-            if dev["deviceId"] == deviceId:
-                modelInfos = get_model_infos(dev["modelId"])
-                for capability in dev["capabilities"]:
-                    capability_infos = get_capability_infos(
-                        modelInfos,
-                        capability["capabilityId"],
-                        capability["value"],
-                    )
+    def get_device_info(self, deviceId: int) -> DeviceInfo:
+        """Get device infos shared by all entities of a device."""
+        if deviceId not in self._device_infos:
+            modelInfos = self.get_model_infos(deviceId)
+            self._device_infos[deviceId] = DeviceInfo(
+                manufacturer="Atlantic",
+                name=modelInfos["name"],
+                model=modelInfos["name"],
+                serial_number=self.get_serial_number(deviceId),
+            )
 
-                    if capability_infos is None and self._create_unknown:
-                        capability_infos = {
-                            "capabilityId": capability["capabilityId"],
-                            "name": "Capability_" + str(capability["capabilityId"]),
-                            "type": "string",
-                            "category": "diag",
-                        }
+        return self._device_infos[deviceId]
 
-                    if capability_infos is not None and len(capability_infos) > 0:
-                        capability_infos["deviceId"] = deviceId
+    def get_serial_number(self, deviceId: int) -> str:
+        """Get serial number."""
+        dev = self._get_device(deviceId)
+        if dev is not None:
+            return dev["gatewaySerialNumber"]
 
-                        isDuplicate = False
-                        if "capabilityDuplicate" in capability_infos:
-                            for cap in capabilities:
-                                if (
-                                    cap["capabilityId"]
-                                    == capability_infos["capabilityDuplicate"]
-                                ):
-                                    isDuplicate = True
-                                    break
+        return "Unknown"
 
-                        if not isDuplicate:
-                            capabilities.append(capability_infos)
+    def get_capabilities_for_device(
+        self,
+        deviceId: int,
+        createUnknown: bool = False,
+        types: tuple[str, ...] | None = None,
+    ):
+        """Get capabilities for a device, only those of some types if given."""
+        dev = self._get_device(deviceId)
+        if dev is None:
+            return []
+
+        # Plans are rebuilt when capabilities of the device change
+        capabilityIds = tuple(
+            capability["capabilityId"] for capability in dev["capabilities"]
+        )
+        plan = self._capability_plans.get(deviceId, None)
+        if (
+            plan is None
+            or plan["capabilityIds"] != capabilityIds
+            or plan["createUnknown"] != createUnknown
+        ):
+            plan = self._build_capability_plan(dev, capabilityIds, createUnknown)
+            self._capability_plans[deviceId] = plan
+
+        if types is None:
+            return plan["capabilities"]
+
+        return [
+            capability
+            for capabilityType in types
+            for capability in plan["types"].get(capabilityType, [])
+        ]
+
+    def _build_capability_plan(
+        self, dev: dict, capabilityIds: tuple[int, ...], createUnknown: bool
+    ) -> dict:
+        """Get infos of the capabilities of a device, by type."""
+        capabilities = []
+        types: dict[str, list] = {}
+        added = set()
+        modelInfos = get_model_infos(dev["modelId"])
+        for capability, capability_infos in zip(
+            dev["capabilities"],
+            get_device_capability_infos(modelInfos, dev["capabilities"]),
+            strict=True,
+        ):
+            if capability_infos is None and createUnknown:
+                capability_infos = {
+                    "capabilityId": capability["capabilityId"],
+                    "name": "Capability_" + str(capability["capabilityId"]),
+                    "type": "string",
+                    "category": "diag",
+                }
 
-        return capabilities
+            if capability_infos is None or len(capability_infos) == 0:
+                continue
+
+            if capability_infos.get("capabilityDuplicate", None) in added:
+                continue
+
+            # Infos are shared by the devices of the model, copied once per plan
+            capability_infos = {**capability_infos, "deviceId": dev["deviceId"]}
+            added.add(capability_infos["capabilityId"])
+            capabilities.append(capability_infos)
+            types.setdefault(capability_infos["type"], []).append(capability_infos)
+
+        return {
+            "capabilityIds": capabilityIds,
+            "createUnknown": createUnknown,
+            "capabilities": capabilities,
+            "types": types,
+        }
 
     def get_capability_infos(
         self, modelId: int, capabilityId: int, capabilityValue: str
@@ -468,112 +1130,144 @@ class Hub(DataUpdateCoordinator):
         return get_capability_infos(modelId, capabilityId, capabilityValue)
 
     def get_capability_value(
-        self, capabilityId: int, defaultIfNotExist: str | None = "0"
+        self, deviceId: int, capabilityId: int, defaultIfNotExist: str | None = "0"
     ):
         """Get value for a device capability."""
-        for dev in self._devices:
-            if dev["deviceId"] == self._deviceId:
-                for capability in dev["capabilities"]:
-                    if capabilityId == capability["capabilityId"]:
-                        return capability["value"]
+        return self.data.get_value(deviceId, capabilityId, defaultIfNotExist)
 
-                return defaultIfNotExist
+    def _get_capability(self, deviceId: int, capabilityId: int):
+        dev = self._get_device(deviceId)
+        if dev is not None:
+            for capability in dev["capabilities"]:
+                if capabilityId == capability["capabilityId"]:
+                    return capability
 
         return None
 
-    async def set_capability_value(self, capabilityId: int, value: str):
-        """Set value for a device capability."""
+    async def set_capability_value(
+        self, deviceId: int, capabilityId: int, value: str
+    ) -> bool:
+        """Set value for a device capability, return True once completed."""
         _LOGGER.debug(
-            "Set_capability_value for %d : %d = %s", self._deviceId, capabilityId, value
+            "Set_capability_value for %d : %d = %s", deviceId, capabilityId, value
         )
-        if self.online:
-            for dev in self._devices:
-                if dev["deviceId"] == self._deviceId:
-                    for capability in dev["capabilities"]:
-                        if capabilityId == capability["capabilityId"]:
-                            if self._test_load:
-                                capability["value"] = value
-                            else:
-                                try:
-                                    # Write capability value
-                                    async with self._session.post(
-                                        COZYTOUCH_ATLANTIC_API
-                                        + "/magellan/executions/writecapability",
-                                        json={
-                                            "capabilityId": capabilityId,
-                                            "deviceId": self._deviceId,
-                                            "value": value,
-                                        },
-                                        headers={
-                                            "Authorization": f"Bearer {self._access_token}",
-                                            "Content-Type": "application/json",
-                                        },
-                                        timeout=REQUEST_TIMEOUT,
-                                    ) as response:
-                                        if response.status == 201:
-                                            # Check completion
-                                            executionId = await response.json()
-                                            completed = False
-                                            nbRetry = 0
-                                            while not completed:
-                                                async with self._session.get(
-                                                    COZYTOUCH_ATLANTIC_API
-                                                    + "/magellan/executions/"
-                                                    + str(executionId),
-                                                    headers={
-                                                        "Authorization": f"Bearer {self._access_token}",
-                                                        "Content-Type": "application/json",
-                                                    },
-                                                    timeout=REQUEST_TIMEOUT,
-                                                ) as executionResponse:
-                                                    try:
-                                                        execution_data = (
-                                                            await executionResponse.json()
-                                                        )
-                                                        execution_state = (
-                                                            execution_data.get(
-                                                                "state", False
-                                                            )
-                                                        )
-                                                        if execution_state == 1:
-                                                            _LOGGER.info(
-                                                                "Execution_state waiting execution"
-                                                            )
-                                                        if execution_state == 2:
-                                                            _LOGGER.info(
-                                                                "Execution_state in progress"
-                                                            )
-                                                        elif execution_state == 3:
-                                                            _LOGGER.info(
-                                                                "Execution_state completed"
-                                                            )
-                                                            completed = True
-                                                            break
-                                                        else:
-                                                            _LOGGER.info(
-                                                                "Execution_state error"
-                                                            )
-                                                            break
-
-                                                    except ContentTypeError:
-                                                        self.online = False
-                                                        break
-
-                                                nbRetry += 1
-                                                if nbRetry > 5:
-                                                    break
-
-                                                await asyncio.sleep(1)
-
-                                            if completed:
-                                                capability["value"] = value
-                                except (ClientError, asyncio.TimeoutError) as err:
-                                    _LOGGER.warning(
-                                        "Network error writing capability %d: %s",
-                                        capabilityId,
-                                        err,
-                                    )
-                            break
+        if not self.online:
+            return False
+
+        capability = self._get_capability(deviceId, capabilityId)
+        if capability is None:
+            return False
+
+        if not self._test_load:
+            try:
+                # Write capability value
+                async with self._async_request(
+                    "POST",
+                    "/magellan/executions/writecapability",
+                    PRIORITY_USER,
+                    json={
+                        "capabilityId": capabilityId,
+                        "deviceId": deviceId,
+                        "value": value,
+                    },
+                ) as response:
+                    if response.status != 201:
+                        _LOGGER.warning(
+                            "Write capability %d: response %d",
+                            capabilityId,
+                            response.status,
+                        )
+                        return False
+
+                    executionId = await response.json()
+            except (ClientError, ContentTypeError, asyncio.TimeoutError) as err:
+                _LOGGER.warning(
+                    "Network error writing capability %d: %s",
+                    capabilityId,
+                    err,
+                )
+                return False
+
+            # Show the accepted value right away, polls confirm or roll it back
+            self.start_poll_burst()
+            self._set_pending_write(deviceId, capabilityId, value, executionId)
+
+            # Wait for completion, checked with other pending writes or
+            # confirmed by a poll
+            if not await self._executions.track(executionId):
+                self._drop_pending_write(deviceId, capabilityId, value)
+                return False
+
+            pending = self._pending_writes.get((deviceId, capabilityId), None)
+            if pending is not None and pending["value"] == value:
+                pending["completed"] = monotonic()
+        else:
+            capability["value"] = value
+            self._update_snapshot()
+
+        return True
+
+    async def set_capability_values(
+        self,
+        deviceId: int,
+        writes: list[tuple[int, str]],
+        dependencies: dict[int, tuple[int, ...]] | None = None,
+    ) -> dict[int, bool]:
+        """Set several capabilities of a device, return completion by capability.
+
+        Writes are given in order as (capabilityId, value) pairs and are sent
+        concurrently, except for a capability listed in dependencies which is
+        only written once the earlier writes it depends on are finished.
+        """
+        if dependencies is None:
+            dependencies = {}
+
+        async def _async_write(capabilityId: int, value: str, after) -> bool:
+            if after:
+                await asyncio.wait(after)
+            return await self.set_capability_value(deviceId, capabilityId, value)
+
+        tasks: dict[int, asyncio.Task] = {}
+        for capabilityId, value in writes:
+            after = [
+                tasks[dependency]
+                for dependency in dependencies.get(capabilityId, ())
+                if dependency in tasks
+            ]
+            tasks[capabilityId] = self._hass.async_create_task(
+                _async_write(capabilityId, value, after)
+            )
+
+        results = dict(
+            zip(tasks, await asyncio.gather(*tasks.values()), strict=True)
+        )
+        for capabilityId, completed in results.items():
+            if not completed:
+                _LOGGER.warning(
+                    "Write of capability %d of device %d failed", capabilityId, deviceId
+                )
+
+        return results
+
+    async def _async_get_execution_state(self, executionId: int) -> int | None:
+        """Get the state of an execution, None on error."""
+        try:
+            async with self._async_request(
+                "GET", "/magellan/executions/" + str(executionId), PRIORITY_USER
+            ) as response:
+                try:
+                    execution_data = await response.json()
+                except ContentTypeError:
+                    self.online = False
+                    return None
+
+                if isinstance(execution_data, dict):
+                    return execution_data.get("state", None)
+
+        except (ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.warning("Network error checking execution %s: %s", executionId, err)
+
+        return None
 
     def away_mode_init(self, timestampStart, timestampEnd):
         """Init away mode timestamps."""
@@ -582,11 +1276,15 @@ class Hub(DataUpdateCoordinator):
 
     async def set_away_mode_start(
         self,
+        deviceId: int,
         capabilityIdTimestamps: int,
         timestamp,
     ):
         """Set away mode start timestamp."""
         self._timestamp_away_mode_start = timestamp
+        self._timestamps_away_mode_device_id = deviceId
+        # Away mode timestamps are not capabilities, update all entities next time
+        self._dispatched = None
         self._timestamps_away_mode_capability_id = capabilityIdTimestamps
         self._timestamp_away_mode_last_change = datetime.now(
             tz=dt_util.DEFAULT_TIME_ZONE
@@ -598,11 +1296,15 @@ class Hub(DataUpdateCoordinator):
 
     async def set_away_mode_end(
         self,
+        deviceId: int,
         capabilityIdTimestamps: int,
         timestamp,
     ):
         """Set away mode end timestamp."""
         self._timestamp_away_mode_end = timestamp
+        self._timestamps_away_mode_device_id = deviceId
+        # Away mode timestamps are not capabilities, update all entities next time
+        self._dispatched = None
         self._timestamps_away_mode_capability_id = capabilityIdTimestamps
         self._timestamp_away_mode_last_change = datetime.now(
             tz=dt_util.DEFAULT_TIME_ZONE
@@ -614,6 +1316,7 @@ class Hub(DataUpdateCoordinator):
 
     async def set_away_mode_timestamps(
         self,
+        deviceId: int,
         capabilityIdMode,
         valueMode,
         capabilityIdTimestamps: int,
@@ -623,6 +1326,10 @@ class Hub(DataUpdateCoordinator):
         """Set away mode timestamps."""
 
         if self.online:
+            # Show the new mode while the setup and timestamps are written
+            if capabilityIdMode is not None and valueMode is not None:
+                self._set_pending_write(deviceId, capabilityIdMode, valueMode)
+
             # Update setup
             json_data = {}
             for key in (
@@ -638,7 +1345,7 @@ class Hub(DataUpdateCoordinator):
                 "type",
             ):
                 if key in self._setup:
-                    json_data[key] = copy.deepcopy(self._setup[key])
+                    json_data[key] = self._setup[key]
 
             json_data["absence"] = {}
             if timestampStart is not None and timestampEnd is not None:
@@ -647,71 +1354,302 @@ class Hub(DataUpdateCoordinator):
                 _timestamp_away_mode_start = timestampStart
                 _timestamp_away_mode_end = timestampEnd
 
-            async with self._session.put(
-                COZYTOUCH_ATLANTIC_API
-                + "/magellan/v2/setups/"
-                + str(self._setup["id"]),
-                json=json_data,
-                headers={
-                    "Authorization": f"Bearer {self._access_token}",
-                    "Content-Type": "application/json",
-                },
-                timeout=REQUEST_TIMEOUT,
-            ) as response:
-                if response.status in (200, 204):
-                    if timestampStart is not None and timestampEnd is not None:
-                        valueTimestamps = (
-                            "[" + str(timestampStart) + "," + str(timestampEnd) + "]"
-                        )
-                        await self.set_capability_value(
-                            capabilityIdTimestamps, valueTimestamps
-                        )
-                        _LOGGER.info(
-                            "Away mode enabled %d -> %d", timestampStart, timestampEnd
-                        )
-                    else:
-                        valueTimestamps = "[0,0]"
-                        await self.set_capability_value(
-                            capabilityIdTimestamps, valueTimestamps
+            try:
+                async with self._async_request(
+                    "PUT",
+                    "/magellan/v2/setups/" + str(self._setup["id"]),
+                    PRIORITY_USER,
+                    json=json_data,
+                ) as response:
+                    accepted = response.status in (200, 204)
+                    if not accepted:
+                        _LOGGER.error(
+                            "Set away mode : response %d (%s)",
+                            response.status,
+                            str(response.request_info),
                         )
-                        _LOGGER.info("Away mode disabled")
+            except (ClientError, asyncio.TimeoutError) as err:
+                # Also raised while the circuit breaker is open
+                _LOGGER.warning("Network error setting away mode: %s", err)
+                accepted = False
 
-                    if capabilityIdMode is not None and valueMode is not None:
-                        await self.set_capability_value(capabilityIdMode, valueMode)
+            if not accepted:
+                if capabilityIdMode is not None and valueMode is not None:
+                    self._drop_pending_write(deviceId, capabilityIdMode, valueMode)
+                return
 
-                    self._timestamp_away_mode_last_change = None
-                else:
-                    _LOGGER.error(
-                        "Set away mode : response %d (%s)",
-                        response.status,
-                        str(response.request_info),
-                    )
+            # The setup response is released before writing the capabilities
+            if timestampStart is not None and timestampEnd is not None:
+                valueTimestamps = (
+                    "[" + str(timestampStart) + "," + str(timestampEnd) + "]"
+                )
+                await self.set_capability_value(
+                    deviceId, capabilityIdTimestamps, valueTimestamps
+                )
+                _LOGGER.info("Away mode enabled %d -> %d", timestampStart, timestampEnd)
+            else:
+                valueTimestamps = "[0,0]"
+                await self.set_capability_value(
+                    deviceId, capabilityIdTimestamps, valueTimestamps
+                )
+                _LOGGER.info("Away mode disabled")
 
-    async def _update_localization(self, country: str):
-        if len(self._localization) == 0:
-            headers = {
-                "Authorization": f"Bearer {self._access_token}",
-                "Content-Type": "application/json",
-            }
-            try:
-                async with self._session.get(
-                    COZYTOUCH_ATLANTIC_API + "/magellan/refs/countries",
-                    headers=headers,
-                    timeout=REQUEST_TIMEOUT,
-                ) as response:
-                    try:
-                        json_data = await response.json()
-                        if isinstance(json_data, list):
-                            for localization in json_data:
-                                if localization.get("countryCode", "") == country:
-                                    self._localization = copy.deepcopy(localization)
-                                    break
-
-                    except ContentTypeError:
-                        self._localization = {}
-            except (ClientError, asyncio.TimeoutError) as err:
-                _LOGGER.warning("Could not fetch localization: %s", err)
-                self._localization = {}
+            if capabilityIdMode is not None and valueMode is not None:
+                await self.set_capability_value(deviceId, capabilityIdMode, valueMode)
+
+            self._timestamp_away_mode_last_change = None
+
+    def _schedule_localization_update(self) -> None:
+        """Update localization in the background, it is not needed to poll."""
+        if self._localization_task is None or self._localization_task.done():
+            self._localization_task = self._hass.async_create_background_task(
+                self._async_update_localization(), "cozytouch_localization"
+            )
+
+    async def _async_update_localization(self) -> None:
+        country = self._get_country()
+        if country is None:
+            return
+
+        localization = await async_get_country_cache(self._hass).async_get(
+            country, self._async_fetch_countries
+        )
+        self._localization = localization if localization is not None else {}
+
+    async def _async_fetch_countries(self) -> list | None:
+        """Download the localization of all countries, None on error."""
+        try:
+            async with self._async_request(
+                "GET", "/magellan/refs/countries"
+            ) as response:
+                json_data = await response.json()
+        except ContentTypeError:
+            return None
+        except (ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.warning("Could not fetch localization: %s", err)
+            return None
+
+        if not isinstance(json_data, list):
+            return None
+
+        return json_data
+
+    def get_localization(self) -> dict:
+        """Get localization of the country of the setup, empty if unknown."""
+        return self._localization
+
+
+class CozytouchDevice(DataUpdateCoordinator):
+    """View of the account hub for a single device.
+
+    It has no polling of its own : it is refreshed by the hub and notifies the
+    entities of its device.
+    """
+
+    def __init__(self, hub: Hub, deviceId: int) -> None:
+        """Init device view."""
+        super().__init__(
+            hub.hass,
+            _LOGGER,
+            name="Cozytouch_" + str(deviceId),
+        )
+        self._hub = hub
+        self._deviceId = deviceId
+        self._create_unknown = False
+        # Update callbacks with the capabilities they depend on (None for all)
+        self._capability_listeners: dict[
+            object, tuple[CALLBACK_TYPE, frozenset[int] | None]
+        ] = {}
+
+        # Keep the hub polling as long as the device is loaded
+        self._remove_hub_listener = hub.async_add_listener(self._handle_hub_update)
+
+    @property
+    def hub(self) -> Hub:
+        """Account hub of the device."""
+        return self._hub
+
+    @property
+    def device_id(self) -> int:
+        """ID of the device."""
+        return self._deviceId
+
+    @property
+    def online(self) -> bool:
+        """Cloud connection state of the account."""
+        return self._hub.online
+
+    @property
+    def available(self) -> bool:
+        """Return True if the device values can be shown, even if stale."""
+        return self._hub.available and self._hub.data.has_device(self._deviceId)
+
+    def get_staleness_attributes(self) -> dict:
+        """Get attributes of entities serving last known values, empty if fresh."""
+        return self._hub.get_staleness_attributes()
+
+    def close(self) -> None:
+        """Stop receiving updates from the hub."""
+        self._remove_hub_listener()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for updates, context is the set of capabilities listened to."""
+        removeListener = super().async_add_listener(update_callback, context)
+        key = object()
+        self._capability_listeners[key] = (update_callback, context)
+
+        @callback
+        def remove_listener() -> None:
+            self._capability_listeners.pop(key, None)
+            removeListener()
+
+        return remove_listener
+
+    @callback
+    def _handle_hub_update(self) -> None:
+        changes = self._hub.get_changes(self._deviceId)
+        if self.last_update_success != self._hub.last_update_success:
+            changes = None
+
+        self.last_update_success = self._hub.last_update_success
+        self.data = self._hub.data
+
+        if changes is None:
+            self.async_update_listeners()
+            return
+
+        # Only update entities depending on a changed capability
+        if changes:
+            for update_callback, context in list(self._capability_listeners.values()):
+                if context is None or not changes.isdisjoint(context):
+                    update_callback()
+
+    async def _async_update_data(self):
+        await self._hub.async_request_refresh()
+        return self._hub.data
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh of the whole account."""
+        await self._hub.async_request_refresh()
+
+    def get_diagnostics(self) -> dict:
+        """Get polling and request diagnostics of the device."""
+        requests = self._hub.get_request_diagnostics()
+        diagnostics = {
+            "poll_interval": self._hub.get_poll_interval(),
+            "capability_change_rates": self._hub.get_change_rates(self._deviceId),
+            "request_queue_depth": requests["queue_depth"],
+            "request_wait_time": requests["wait_time"],
+        }
+
+        staleness = self._hub.get_staleness()
+        if not self._hub.online and staleness is not None:
+            diagnostics["staleness"] = round(staleness)
+        diagnostics.update(self._hub.get_staleness_attributes())
+        return diagnostics
+
+    def get_circuit_breaker_diagnostics(self) -> dict:
+        """Get state of the circuit breaker of the account."""
+        return self._hub.get_circuit_breaker_diagnostics()
+
+    def set_create_entities_for_unknown_entities(self, create_unknown: bool) -> None:
+        """Set option from config flow to create entities for unknown capabilities."""
+        self._create_unknown = create_unknown
+
+    def get_create_entities_for_unknown_entities(self) -> bool:
+        """Get option from config flow to create entities for unknown capabilities."""
+        return self._create_unknown
+
+    def get_model_infos(self):
+        """Get model infos."""
+        return self._hub.get_model_infos(self._deviceId)
+
+    def get_serial_number(self) -> str:
+        """Get serial number."""
+        return self._hub.get_serial_number(self._deviceId)
+
+    def get_device_info(self) -> DeviceInfo:
+        """Get device infos shared by all entities of the device."""
+        return self._hub.get_device_info(self._deviceId)
+
+    def get_capabilities_for_device(self, types: tuple[str, ...] | None = None):
+        """Get capabilities for the device, only those of some types if given."""
+        return self._hub.get_capabilities_for_device(
+            self._deviceId, self._create_unknown, types
+        )
+
+    def get_capability_value(
+        self, capabilityId: int, defaultIfNotExist: str | None = "0"
+    ):
+        """Get value for a device capability."""
+        return self._hub.get_capability_value(
+            self._deviceId, capabilityId, defaultIfNotExist
+        )
+
+    def is_capability_pending(self, capabilityId: int) -> bool:
+        """Return True if a written value is not confirmed by a poll yet."""
+        return self._hub.is_capability_pending(self._deviceId, capabilityId)
+
+    async def set_capability_value(self, capabilityId: int, value: str) -> bool:
+        """Set value for a device capability, return True once completed."""
+        return await self._hub.set_capability_value(
+            self._deviceId, capabilityId, value
+        )
+
+    async def set_capability_values(
+        self,
+        writes: list[tuple[int, str]],
+        dependencies: dict[int, tuple[int, ...]] | None = None,
+    ) -> dict[int, bool]:
+        """Set several capabilities of the device, return completion by capability."""
+        return await self._hub.set_capability_values(
+            self._deviceId, writes, dependencies
+        )
+
+    def away_mode_init(self, timestampStart, timestampEnd):
+        """Init away mode timestamps."""
+        self._hub.away_mode_init(timestampStart, timestampEnd)
+
+    async def set_away_mode_start(self, capabilityIdTimestamps: int, timestamp):
+        """Set away mode start timestamp."""
+        await self._hub.set_away_mode_start(
+            self._deviceId, capabilityIdTimestamps, timestamp
+        )
+
+    def get_away_mode_start(self):
+        """Get away mode start timestamp."""
+        return self._hub.get_away_mode_start()
+
+    async def set_away_mode_end(self, capabilityIdTimestamps: int, timestamp):
+        """Set away mode end timestamp."""
+        await self._hub.set_away_mode_end(
+            self._deviceId, capabilityIdTimestamps, timestamp
+        )
+
+    def get_away_mode_end(self):
+        """Get away mode end timestamp."""
+        return self._hub.get_away_mode_end()
+
+    async def set_away_mode_timestamps(
+        self,
+        capabilityIdMode,
+        valueMode,
+        capabilityIdTimestamps: int,
+        timestampStart,
+        timestampEnd,
+    ):
+        """Set away mode timestamps."""
+        await self._hub.set_away_mode_timestamps(
+            self._deviceId,
+            capabilityIdMode,
+            valueMode,
+            capabilityIdTimestamps,
+            timestampStart,
+            timestampEnd,
+        )
 
 
 class CannotConnect(exceptions.HomeAssistantError):
@@ -0,0 +1,88 @@
+"""Atlantic Cozytouch localization cache."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_COUNTRIES, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+COUNTRIES_STORAGE_VERSION = 1
+
+# The country list rarely changes, download it again after this delay
+COUNTRIES_TTL = timedelta(days=7)
+
+
+class CountryCache:
+    """Localization of the countries, shared by all hubs and stored on disk.
+
+    The whole country list is downloaded by the first hub needing it once
+    the stored one is older than COUNTRIES_TTL, other hubs wait for it. If
+    the download fails the expired list is still used.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init cache."""
+        self._store = Store(hass, COUNTRIES_STORAGE_VERSION, f"{DOMAIN}.countries")
+        self._lock = asyncio.Lock()
+        self._loaded = False
+        self._countries: dict[str, dict] = {}
+        self._updated: datetime | None = None
+
+    async def async_get(
+        self, country: str, fetch: Callable[[], Awaitable[list | None]]
+    ) -> dict | None:
+        """Get localization of a country, fetch downloads the country list."""
+        async with self._lock:
+            if not self._loaded:
+                await self._async_load()
+
+            if (
+                self._updated is None
+                or dt_util.utcnow() - self._updated >= COUNTRIES_TTL
+            ):
+                countries = await fetch()
+                if countries is not None:
+                    self._countries = {
+                        localization["countryCode"]: localization
+                        for localization in countries
+                        if isinstance(localization, dict)
+                        and "countryCode" in localization
+                    }
+                    self._updated = dt_util.utcnow()
+                    _LOGGER.debug("Downloaded %d countries", len(self._countries))
+                    await self._store.async_save(
+                        {
+                            "updated": self._updated.isoformat(),
+                            "countries": self._countries,
+                        }
+                    )
+
+            return self._countries.get(country, None)
+
+    async def _async_load(self) -> None:
+        self._loaded = True
+        data = await self._store.async_load()
+        if not isinstance(data, dict) or not isinstance(data.get("countries"), dict):
+            return
+
+        self._countries = data["countries"]
+        self._updated = dt_util.parse_datetime(data.get("updated", ""))
+
+
+@callback
+def async_get_country_cache(hass: HomeAssistant) -> CountryCache:
+    """Get the localization cache shared by all hubs."""
+    domainData = hass.data.setdefault(DOMAIN, {})
+    if DATA_COUNTRIES not in domainData:
+        domainData[DATA_COUNTRIES] = CountryCache(hass)
+
+    return domainData[DATA_COUNTRIES]
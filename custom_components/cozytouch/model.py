@@ -17,7 +17,9 @@ Optional :
 
 """  # noqa: D205
 
+from collections.abc import Mapping
 from enum import StrEnum
+from types import MappingProxyType
 
 from homeassistant.components.climate import HVACMode
 from homeassistant.components.climate.const import (
@@ -54,414 +56,314 @@ class CozytouchDeviceType(StrEnum):
     HUB = "hub"
 
 
-def get_model_infos(modelId: int, zoneName: str | None = None):
-    """Return infos from model ID."""
-    modelInfos = {"modelId": modelId, "HVACModesCapabilityId": {7, 8}}
-
-    if modelId == 56:
-        modelInfos["name"] = "Naema 2 Micro 25"
-        modelInfos["type"] = CozytouchDeviceType.GAZ_BOILER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-    elif modelId == 61:
-        modelInfos["name"] = "Naia 2 Micro 25"
-        modelInfos["type"] = CozytouchDeviceType.GAZ_BOILER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-    elif modelId == 65:
-        modelInfos["name"] = "Naema 2 Duo 25"
-        modelInfos["type"] = CozytouchDeviceType.GAZ_BOILER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-    elif modelId == 76:
-        modelInfos["name"] = "Alfea Extensa Duo AI UE"
-        modelInfos["type"] = CozytouchDeviceType.HEAT_PUMP
-        modelInfos["currentTemperatureAvailableZ1"] = False
-        modelInfos["currentTemperatureAvailableZ2"] = True
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-        }
-
-        modelInfos["exhaustTemperatureAvailable"] = False
-
-    elif modelId == 211:
-        modelInfos["name"] = "Alfea Extensa Duo A.I. 3 R32"
-        modelInfos["type"] = CozytouchDeviceType.HEAT_PUMP
-        modelInfos["currentTemperatureAvailableZ1"] = True
-        modelInfos["currentTemperatureAvailableZ2"] = True
-
-        modelInfos["HVACModesCapabilityId"] = {1, 2}
-
-        modelInfos["HVACModes"] = {
+# Models whose name includes the zone they are in, with the name prefix
+ZONE_NAMED_MODELS: dict[int, str] = {}
+
+_MODEL_DEFAULTS = {"HVACModesCapabilityId": {7, 8}}
+
+_HVAC_MODES_OFF = {0: HVACMode.OFF}
+_HVAC_MODES_OFF_HEAT = {0: HVACMode.OFF, 4: HVACMode.HEAT}
+
+_HEATING_MODES_WATER_HEATER = {
+    0: HEATING_MODE_MANUAL,
+    3: HEATING_MODE_ECO_PLUS,
+    4: HEATING_MODE_PROG,
+}
+
+_MODELS_DEFINITIONS: dict[int, dict] = {
+    56: {
+        "name": "Naema 2 Micro 25",
+        "type": CozytouchDeviceType.GAZ_BOILER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    61: {
+        "name": "Naia 2 Micro 25",
+        "type": CozytouchDeviceType.GAZ_BOILER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    65: {
+        "name": "Naema 2 Duo 25",
+        "type": CozytouchDeviceType.GAZ_BOILER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    76: {
+        "name": "Alfea Extensa Duo AI UE",
+        "type": CozytouchDeviceType.HEAT_PUMP,
+        "currentTemperatureAvailableZ1": False,
+        "currentTemperatureAvailableZ2": True,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": {0: HEATING_MODE_MANUAL},
+        "exhaustTemperatureAvailable": False,
+    },
+    211: {
+        "name": "Alfea Extensa Duo A.I. 3 R32",
+        "type": CozytouchDeviceType.HEAT_PUMP,
+        "currentTemperatureAvailableZ1": True,
+        "currentTemperatureAvailableZ2": True,
+        "HVACModesCapabilityId": {1, 2},
+        "HVACModes": {
             0: HVACMode.OFF,
             1: HVACMode.HEAT,
             2: HVACMode.AUTO,
-        }
-
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-        }
-
-        modelInfos["exhaustTemperatureAvailable"] = False
-
-    elif modelId == 235:
-        modelInfos["name"] = "Thermostat Navilink Connect"
-        modelInfos["type"] = CozytouchDeviceType.THERMOSTAT
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-    elif modelId == 236:
-        modelInfos["name"] = "Sauter Phazy"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
-
-    elif modelId == 389:
-        modelInfos["name"] = "AQUEO ACI HYB VS 300L 3000M"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-        modelInfos["HeatingModes"] = {
+        },
+        "HeatingModes": {0: HEATING_MODE_MANUAL},
+        "exhaustTemperatureAvailable": False,
+    },
+    235: {
+        "name": "Thermostat Navilink Connect",
+        "type": CozytouchDeviceType.THERMOSTAT,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    236: {
+        "name": "Sauter Phazy",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    389: {
+        "name": "AQUEO ACI HYB VS 300L 3000M",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    390: {
+        "name": "AQUEO ACI HYB VM 150L 2200M",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    418: {
+        "name": "Atlantic Loria Duo 6006",
+        "type": CozytouchDeviceType.THERMOSTAT,
+        "exhaustTemperatureAvailable": True,
+        "currentTemperatureAvailableZ1": True,
+        "currentTemperatureAvailableZ2": False,
+        "overrideModeAvailable": True,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    556: {
+        "name": "Naviclim Hub",
+        "type": CozytouchDeviceType.HUB,
+        "HVACModes": _HVAC_MODES_OFF,
+    },
+    1457: {
+        "name": "HUB Cozytouch",
+        "type": CozytouchDeviceType.HUB,
+        "HVACModes": _HVAC_MODES_OFF,
+    },
+    1353: {
+        "name": "Calypso Split Interface",
+        "type": CozytouchDeviceType.HUB,
+        "HVACModes": _HVAC_MODES_OFF,
+    },
+    1369: {
+        "name": "Calypso Split",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    1371: {
+        "name": "Aeromax SPLIT 3",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    1381: {
+        "name": "KELUD 1750W BLC",
+        "type": CozytouchDeviceType.TOWEL_RACK,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    1382: {
+        "name": "KELUD 1750W Anthracite Standard",
+        "type": CozytouchDeviceType.TOWEL_RACK,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    1388: {
+        "name": "Doris étroit 1500W BLC",
+        "type": CozytouchDeviceType.TOWEL_RACK,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    1444: {
+        "name": "Naema 3 Micro 25",
+        "type": CozytouchDeviceType.GAZ_BOILER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    1543: {
+        "name": "Asama Connecté II Ventilo 1750W Blanc",
+        "type": CozytouchDeviceType.TOWEL_RACK,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    1546: {
+        "name": "Asama Connecté II Ventilo 1500W ANTH",
+        "type": CozytouchDeviceType.TOWEL_RACK,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    1547: {
+        "name": "Asama Connecté II Ventilo 1750W ANTH",
+        "type": CozytouchDeviceType.TOWEL_RACK,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    1551: {
+        "name": "Asama Connecté II Ventilo 1750W Noir",
+        "type": CozytouchDeviceType.TOWEL_RACK,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    1622: {
+        "name": "Thermor Riva 5",
+        "type": CozytouchDeviceType.TOWEL_RACK,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+    },
+    1641: {
+        "name": "Atlantic Explorer V5 (200L)",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    1642: {
+        "name": "Atlantic Explorer V5 (270L)",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    1644: {
+        "name": "Atlantic Explorer V5 (240L)",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    1645: {
+        "name": "Atlantic Explorer V5 (270L with coil)",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    1656: {
+        "name": "Aeromax 6",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    1657: {
+        "name": "Calypso 200L",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    1966: {
+        "name": "Thermor Malicio 3 120L",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": _HEATING_MODES_WATER_HEATER,
+    },
+    1957: {
+        "name": "LINEO CONNECTE MP 100L 2250W",
+        "type": CozytouchDeviceType.WATER_HEATER,
+        "HVACModes": _HVAC_MODES_OFF_HEAT,
+        "HeatingModes": {
             0: HEATING_MODE_MANUAL,
             3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
-
-    elif modelId == 390:
-        modelInfos["name"] = "AQUEO ACI HYB VM 150L 2200M"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
-
-    elif modelId == 418:
-        modelInfos["name"] = "Atlantic Loria Duo 6006"
-        modelInfos["type"] = CozytouchDeviceType.THERMOSTAT
-        modelInfos["exhaustTemperatureAvailable"] = True
-        modelInfos["currentTemperatureAvailableZ1"] = True
-        modelInfos["currentTemperatureAvailableZ2"] = False
-        modelInfos["overrideModeAvailable"] = True
-
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-    elif modelId == 556:
-        modelInfos["name"] = "Naviclim Hub"
-        modelInfos["type"] = CozytouchDeviceType.HUB
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-        }
-
-    elif modelId == 1457:
-        modelInfos["name"] = "HUB Cozytouch"
-        modelInfos["type"] = CozytouchDeviceType.HUB
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-        }
-        
-    elif (modelId >= 557 and modelId <= 561) or modelId == 1734:
-        name = "Air Conditioner "
-        if zoneName is not None:
-            modelInfos["name"] = name + "(" + zoneName + ")"
-        elif modelId <= 561:
-            modelInfos["name"] = name + "(#" + str(modelId - 556) + ")"
+        },
+    },
+}
+
+# Same model with another ID
+_MODELS_DEFINITIONS[1376] = _MODELS_DEFINITIONS[1369]
+_MODELS_DEFINITIONS[1372] = _MODELS_DEFINITIONS[1371]
+
+# Air conditioners, numbered by their modelId
+_AC_DEFINITION = {
+    "type": CozytouchDeviceType.AC,
+    "currentTemperatureAvailable": False,
+    "quietModeAvailable": True,
+    "fanModes": {
+        1: FAN_LOW,
+        2: FAN_MEDIUM,
+        3: FAN_HIGH,
+        5: FAN_AUTO,
+    },
+    "swingModes": {
+        1: SWING_MODE_UP,
+        2: SWING_MODE_MIDDLE_UP,
+        3: SWING_MODE_MIDDLE_DOWN,
+        4: SWING_MODE_DOWN,
+    },
+    "HVACModes": {
+        0: HVACMode.OFF,
+        1: HVACMode.AUTO,
+        3: HVACMode.COOL,
+        4: HVACMode.HEAT,
+        7: HVACMode.FAN_ONLY,
+        8: HVACMode.DRY,
+    },
+}
+
+for _modelId, _number in [*((i, i - 556) for i in range(557, 562)), (1734, 1)]:
+    _MODELS_DEFINITIONS[_modelId] = {
+        "name": f"Air Conditioner (#{_number})",
+        **_AC_DEFINITION,
+    }
+    ZONE_NAMED_MODELS[_modelId] = "Air Conditioner "
+
+for _modelId in range(562, 571):
+    _MODELS_DEFINITIONS[_modelId] = {
+        "name": f"Air Conditioner User Interface (#{_modelId - 561})",
+        "type": CozytouchDeviceType.AC_CONTROLLER,
+        "HVACModes": _HVAC_MODES_OFF,
+    }
+    ZONE_NAMED_MODELS[_modelId] = "Air Conditioner User Interface "
+
+
+def _freeze(infos: dict) -> Mapping:
+    """Get a read-only copy of model infos."""
+    frozen = {}
+    for key, value in infos.items():
+        if isinstance(value, dict):
+            frozen[key] = MappingProxyType(dict(value))
+        elif isinstance(value, set):
+            frozen[key] = frozenset(value)
         else:
-            modelInfos["name"] = name + "(#" + str(modelId - 1733) + ")"
-
-        modelInfos["type"] = CozytouchDeviceType.AC
-        modelInfos["currentTemperatureAvailable"] = False
-        modelInfos["quietModeAvailable"] = True
-
-        modelInfos["fanModes"] = {
-            1: FAN_LOW,
-            2: FAN_MEDIUM,
-            3: FAN_HIGH,
-            5: FAN_AUTO,
-        }
-
-        modelInfos["swingModes"] = {
-            1: SWING_MODE_UP,
-            2: SWING_MODE_MIDDLE_UP,
-            3: SWING_MODE_MIDDLE_DOWN,
-            4: SWING_MODE_DOWN,
-        }
-
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            1: HVACMode.AUTO,
-            3: HVACMode.COOL,
-            4: HVACMode.HEAT,
-            7: HVACMode.FAN_ONLY,
-            8: HVACMode.DRY,
-        }
-
-    elif modelId >= 562 and modelId <= 570:
-        name = "Air Conditioner User Interface "
-        if zoneName is not None:
-            modelInfos["name"] = name + "(" + zoneName + ")"
-        else:
-            modelInfos["name"] = name + "(#" + str(modelId - 561) + ")"
+            frozen[key] = value
 
-        modelInfos["type"] = CozytouchDeviceType.AC_CONTROLLER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-        }
+    return MappingProxyType(frozen)
 
-    elif modelId == 1353:
-        modelInfos["name"] = "Calypso Split Interface"
-        modelInfos["type"] = CozytouchDeviceType.HUB
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-        }
 
-    elif modelId in (1369, 1376):
-        modelInfos["name"] = "Calypso Split"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
+def _build_model_infos(modelId: int, definition: dict) -> Mapping:
+    return _freeze({"modelId": modelId, **_MODEL_DEFAULTS, **definition})
 
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
 
-    elif modelId in (1371, 1372):
-        modelInfos["name"] = "Aeromax SPLIT 3"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
+# Registry of read-only model infos, shared by all devices
+MODELS: dict[int, Mapping] = {
+    modelId: _build_model_infos(modelId, definition)
+    for modelId, definition in _MODELS_DEFINITIONS.items()
+}
 
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
+_unknown_models: dict[int, Mapping] = {}
+_zone_models: dict[tuple[int, str], Mapping] = {}
 
-    elif modelId == 1381:
-        modelInfos["name"] = "KELUD 1750W BLC"
-        modelInfos["type"] = CozytouchDeviceType.TOWEL_RACK
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
 
-    elif modelId == 1382:
-        modelInfos["name"] = "KELUD 1750W Anthracite Standard"
-        modelInfos["type"] = CozytouchDeviceType.TOWEL_RACK
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
+def get_model_infos(modelId: int, zoneName: str | None = None) -> Mapping:
+    """Return read-only infos from model ID."""
+    modelInfos = MODELS.get(modelId, None)
+    if modelInfos is None:
+        if modelId not in _unknown_models:
+            _unknown_models[modelId] = _build_model_infos(
+                modelId,
+                {
+                    "name": "Unknown product (" + str(modelId) + ")",
+                    "type": CozytouchDeviceType.UNKNOWN,
+                    "HVACModes": _HVAC_MODES_OFF_HEAT,
+                },
+            )
+        return _unknown_models[modelId]
 
-    elif modelId == 1388:
-        modelInfos["name"] = "Doris étroit 1500W BLC"
-        modelInfos["type"] = CozytouchDeviceType.TOWEL_RACK
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
+    if zoneName is None or modelId not in ZONE_NAMED_MODELS:
+        return modelInfos
 
-    elif modelId == 1444:
-        modelInfos["name"] = "Naema 3 Micro 25"
-        modelInfos["type"] = CozytouchDeviceType.GAZ_BOILER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-    elif modelId == 1543:
-        modelInfos["name"] = "Asama Connecté II Ventilo 1750W Blanc"
-        modelInfos["type"] = CozytouchDeviceType.TOWEL_RACK
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-    elif modelId == 1546:  # Asama Connecté II Ventilo 1500W
-        modelInfos["name"] = "Asama Connecté II Ventilo 1500W ANTH"
-        modelInfos["type"] = CozytouchDeviceType.TOWEL_RACK
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-    elif modelId == 1547:  # Asama Connecté II Ventilo 1750W
-        modelInfos["name"] = "Asama Connecté II Ventilo 1750W ANTH"
-        modelInfos["type"] = CozytouchDeviceType.TOWEL_RACK
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-    elif modelId == 1551:
-        modelInfos["name"] = "Asama Connecté II Ventilo 1750W Noir"
-        modelInfos["type"] = CozytouchDeviceType.TOWEL_RACK
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-    elif modelId == 1622:
-        modelInfos["name"] = "Thermor Riva 5"
-        modelInfos["type"] = CozytouchDeviceType.TOWEL_RACK
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-       
-    elif modelId == 1641:
-        modelInfos["name"] = "Atlantic Explorer V5 (200L)"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
-       
-    elif modelId == 1642:
-        modelInfos["name"] = "Atlantic Explorer V5 (270L)"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
-
-    elif modelId == 1644:
-        modelInfos["name"] = "Atlantic Explorer V5 (240L)"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
-
-    elif modelId == 1645:
-        modelInfos["name"] = "Atlantic Explorer V5 (270L with coil)"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
-   
-    elif modelId == 1656:
-        modelInfos["name"] = "Aeromax 6"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
-
-    elif modelId == 1657:
-        modelInfos["name"] = "Calypso 200L"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
-
-    elif modelId == 1966:
-        modelInfos["name"] = "Thermor Malicio 3 120L"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-            4: HEATING_MODE_PROG,
-        }
-       
-    elif modelId == 1957:
-        modelInfos["name"] = "LINEO CONNECTE MP 100L 2250W"
-        modelInfos["type"] = CozytouchDeviceType.WATER_HEATER
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
-
-        modelInfos["HeatingModes"] = {
-            0: HEATING_MODE_MANUAL,
-            3: HEATING_MODE_ECO_PLUS,
-        }
-    else:
-        modelInfos["name"] = "Unknown product (" + str(modelId) + ")"
-        modelInfos["type"] = CozytouchDeviceType.UNKNOWN
-        modelInfos["HVACModes"] = {
-            0: HVACMode.OFF,
-            4: HVACMode.HEAT,
-        }
+    # Only the name differs, other infos are shared with the registry entry
+    key = (modelId, zoneName)
+    if key not in _zone_models:
+        _zone_models[key] = MappingProxyType(
+            {**modelInfos, "name": ZONE_NAMED_MODELS[modelId] + "(" + zoneName + ")"}
+        )
 
-    return modelInfos
+    return _zone_models[key]
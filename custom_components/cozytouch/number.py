@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .hub import Hub
+from .hub import CozytouchDevice
 from .sensor import CozytouchSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,7 +35,14 @@ async def async_setup_entry(
 
     # Init number entities
     numbers = []
-    capabilities = hub.get_capabilities_for_device()
+    capabilities = hub.get_capabilities_for_device(
+        (
+            "temperature_adjustment_number",
+            "temperature_percent_adjustment_number",
+            "hours_adjustment_number",
+            "minutes_adjustment_number",
+        )
+    )
     for capability in capabilities:
         if capability["type"] == "temperature_adjustment_number":
             numbers.append(
@@ -84,7 +91,7 @@ class TemperatureAdjustmentNumber(NumberEntity, CozytouchSensor):
 
     def __init__(
         self,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         capability,
         config_title: str,
         config_uniq_id: str,
@@ -144,7 +151,9 @@ class TemperatureAdjustmentNumber(NumberEntity, CozytouchSensor):
 
         # Save value
         self._native_value = value
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed(
+            value, self._attr_native_min_value, self._attr_native_max_value
+        )
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
@@ -165,7 +174,7 @@ class TemperaturePercentAdjustmentNumber(NumberEntity, CozytouchSensor):
 
     def __init__(
         self,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         capability,
         config_title: str,
         config_uniq_id: str,
@@ -221,7 +230,7 @@ class TemperaturePercentAdjustmentNumber(NumberEntity, CozytouchSensor):
 
         # Save value
         self._native_value = value
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed(value)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
@@ -244,7 +253,7 @@ class HoursAdjustmentNumber(NumberEntity, CozytouchSensor):
 
     def __init__(
         self,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         capability,
         config_title: str,
         config_uniq_id: str,
@@ -292,7 +301,7 @@ class HoursAdjustmentNumber(NumberEntity, CozytouchSensor):
             value = self._attr_native_max_value
 
         self._native_value = value
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed(value)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
@@ -313,7 +322,7 @@ class MinutesAdjustmentNumber(NumberEntity, CozytouchSensor):
 
     def __init__(
         self,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         capability,
         config_title: str,
         config_uniq_id: str,
@@ -360,7 +369,7 @@ class MinutesAdjustmentNumber(NumberEntity, CozytouchSensor):
             value = self._attr_native_max_value
 
         self._native_value = value
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed(value)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
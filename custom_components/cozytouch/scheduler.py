@@ -0,0 +1,180 @@
+"""Atlantic Cozytouch request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from itertools import count
+from time import monotonic
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_SCHEDULER, DOMAIN
+
+# Priority classes, lower is served first
+PRIORITY_USER = 0
+PRIORITY_REFRESH = 1
+PRIORITY_POLL = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_USER: "user",
+    PRIORITY_REFRESH: "refresh",
+    PRIORITY_POLL: "poll",
+}
+
+# Sustained requests per second and burst size, per account and for all accounts
+REQUEST_RATE_ACCOUNT = 1.0
+REQUEST_BURST_ACCOUNT = 10
+REQUEST_RATE_GLOBAL = 4.0
+REQUEST_BURST_GLOBAL = 20
+
+# Smoothing of the reported wait times
+WAIT_TIME_ALPHA = 0.3
+
+
+class TokenBucket:
+    """Allow a sustained rate of requests with bursts."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Init bucket, full."""
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self._tokens + (now - self._updated) * self._rate, self._capacity
+        )
+        self._updated = now
+
+    def get_delay(self, now: float) -> float:
+        """Get seconds before a token is available, 0 if one is."""
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+
+        return (1 - self._tokens) / self._rate
+
+    def take(self) -> None:
+        """Use a token."""
+        self._tokens -= 1
+
+
+class RequestScheduler:
+    """Grant API requests of all accounts by priority, within rate limits.
+
+    Each account has its own token bucket, and all accounts share a global
+    one. Waiting requests are served by priority then in order, a request
+    blocked by the bucket of its account doesn't block other accounts.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init scheduler."""
+        self._hass = hass
+        self._global = TokenBucket(REQUEST_RATE_GLOBAL, REQUEST_BURST_GLOBAL)
+        self._accounts: dict[str, TokenBucket] = {}
+        self._waiting: list = []
+        self._sequence = count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._wait_times: dict[str, dict[int, float]] = {}
+
+    def _get_bucket(self, accountId: str) -> TokenBucket:
+        if accountId not in self._accounts:
+            self._accounts[accountId] = TokenBucket(
+                REQUEST_RATE_ACCOUNT, REQUEST_BURST_ACCOUNT
+            )
+
+        return self._accounts[accountId]
+
+    def _get_delay(self, accountId: str, now: float) -> float:
+        return max(
+            self._get_bucket(accountId).get_delay(now), self._global.get_delay(now)
+        )
+
+    def _grant(self, accountId: str, priority: int, waited: float) -> None:
+        self._get_bucket(accountId).take()
+        self._global.take()
+
+        waitTimes = self._wait_times.setdefault(accountId, {})
+        if priority in waitTimes:
+            waitTimes[priority] += WAIT_TIME_ALPHA * (waited - waitTimes[priority])
+        else:
+            waitTimes[priority] = waited
+
+    async def async_acquire(self, accountId: str, priority: int) -> None:
+        """Wait until a request of an account can be sent."""
+        now = monotonic()
+        if not self._waiting and self._get_delay(accountId, now) == 0:
+            self._grant(accountId, priority, 0.0)
+            return
+
+        future = self._hass.loop.create_future()
+        heapq.heappush(
+            self._waiting, (priority, next(self._sequence), accountId, future, now)
+        )
+        self._dispatch()
+
+        # A cancelled request is skipped by the next dispatch
+        await future
+
+    @callback
+    def _dispatch(self) -> None:
+        """Grant waiting requests which can be sent, wait for the others."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        now = monotonic()
+        blocked = []
+        retry = None
+        while self._waiting:
+            entry = heapq.heappop(self._waiting)
+            priority, _sequence, accountId, future, queued = entry
+            if future.done():
+                continue
+
+            delay = self._get_delay(accountId, now)
+            if delay == 0:
+                self._grant(accountId, priority, now - queued)
+                future.set_result(None)
+            else:
+                blocked.append(entry)
+                retry = delay if retry is None else min(retry, delay)
+
+        for entry in blocked:
+            heapq.heappush(self._waiting, entry)
+
+        if retry is not None:
+            self._timer = self._hass.loop.call_later(retry, self._dispatch)
+
+    def get_diagnostics(self, accountId: str) -> dict:
+        """Get queue depth and smoothed wait times (in seconds) of an account."""
+        return {
+            "queue_depth": sum(
+                1
+                for entry in self._waiting
+                if entry[2] == accountId and not entry[3].done()
+            ),
+            "wait_time": {
+                PRIORITY_NAMES[priority]: round(waitTime, 1)
+                for priority, waitTime in sorted(
+                    self._wait_times.get(accountId, {}).items()
+                )
+            },
+        }
+
+    def remove_account(self, accountId: str) -> None:
+        """Forget the rate limit and statistics of an account."""
+        self._accounts.pop(accountId, None)
+        self._wait_times.pop(accountId, None)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> RequestScheduler:
+    """Get the request scheduler shared by all hubs."""
+    domainData = hass.data.setdefault(DOMAIN, {})
+    if DATA_SCHEDULER not in domainData:
+        domainData[DATA_SCHEDULER] = RequestScheduler(hass)
+
+    return domainData[DATA_SCHEDULER]
@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .hub import Hub
+from .hub import CozytouchDevice
 from .sensor import CozytouchSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,7 +35,7 @@ async def async_setup_entry(
 
     # Init selects
     selects = []
-    capabilities = hub.get_capabilities_for_device()
+    capabilities = hub.get_capabilities_for_device(("select",))
     for capability in capabilities:
         if capability["type"] == "select":
             selects.append(
@@ -57,7 +57,7 @@ class CozytouchSelect(SelectEntity, CozytouchSensor):
 
     def __init__(
         self,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         capability,
         config_title: str,
         config_uniq_id: str,
@@ -28,8 +28,9 @@ from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .capability import get_capability_dependencies
 from .const import DOMAIN, CozytouchCapabilityVariableType
-from .hub import Hub
+from .hub import CozytouchDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,7 +56,7 @@ async def async_setup_entry(
 
     # Init sensors
     sensors = []
-    capabilities = hub.get_capabilities_for_device(config_entry.data["deviceId"])
+    capabilities = hub.get_capabilities_for_device()
     for capability in capabilities:
         if capability["type"] in ("string", "int"):
             # Use a CozytouchSensor for integers
@@ -285,7 +286,7 @@ class CozytouchSensor(SensorEntity, CoordinatorEntity):
 
     def __init__(
         self,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         capability,
         config_title: str,
         config_uniq_id: str,
@@ -296,12 +297,14 @@ class CozytouchSensor(SensorEntity, CoordinatorEntity):
         value_type: CozytouchCapabilityVariableType | None = None,
     ) -> None:
         """Initialize a sensor."""
-        super().__init__(coordinator)
+        # Only get updates from the hub when one of our capabilities changed
+        super().__init__(coordinator, get_capability_dependencies(capability))
 
         self._capability = capability
         self._config_title = config_title
         self._config_uniq_id = config_uniq_id
         self._last_value: str | None = None
+        self._last_written_state = None
         self._device_uniq_id = config_uniq_id
         self._attr_name = name
 
@@ -365,13 +368,9 @@ class CozytouchSensor(SensorEntity, CoordinatorEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device info."""
-        modelInfos = self.coordinator.get_model_infos()
         return DeviceInfo(
             identifiers={(DOMAIN, self._device_uniq_id)},
-            manufacturer="Atlantic",
-            name=modelInfos["name"],
-            model=modelInfos["name"],
-            serial_number=self.coordinator.get_serial_number(),
+            **self.coordinator.get_device_info(),
         )
 
     @property
@@ -379,6 +378,15 @@ class CozytouchSensor(SensorEntity, CoordinatorEntity):
         """Value of the sensor."""
         return self._last_value
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the hub and show the values it already has."""
+        await super().async_added_to_hass()
+
+        # The hub only notifies changes, values read before the entity was
+        # added would not be shown until they change
+        if self.coordinator.available:
+            self._handle_coordinator_update()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update the value of the sensor from the hub."""
@@ -386,7 +394,7 @@ class CozytouchSensor(SensorEntity, CoordinatorEntity):
         value = self.get_value()
         # _LOGGER.info("%s: update %s (%s)", self._config_title, self._attr_name, value)
 
-        # Handle entity availability
+        # Handle entity availability, last known values are kept during outages
         if value is None:
             if self._attr_available:
                 if not self.coordinator.online:
@@ -406,6 +414,26 @@ class CozytouchSensor(SensorEntity, CoordinatorEntity):
 
         # Save value
         self._last_value = value
+        self.async_write_ha_state_if_changed(value, self.state)
+
+    @property
+    def available(self) -> bool:
+        """Return True until last known values are too stale."""
+        return super().available and self.coordinator.available
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return staleness attributes while the values are not fresh."""
+        return self.coordinator.get_staleness_attributes()
+
+    @callback
+    def async_write_ha_state_if_changed(self, *state) -> None:
+        """Write the state to HA only if the derived state changed."""
+        state = (*state, self.available, tuple(self.extra_state_attributes.items()))
+        if self._last_written_state is not None and state == self._last_written_state:
+            return
+
+        self._last_written_state = state
         self.async_write_ha_state()
 
 
@@ -417,7 +445,7 @@ class CozytouchAwayModeTimestampSensor(CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         name: str | None = None,
         icon: str | None = None,
         separator: str | None = None,
@@ -477,7 +505,7 @@ class CozytouchBinarySensor(BinarySensorEntity, CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         name: str | None = None,
         icon: str | None = None,
     ) -> None:
@@ -510,7 +538,7 @@ class CozytouchAwayModeSensor(CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         name: str | None = None,
         icon: str | None = None,
     ) -> None:
@@ -547,7 +575,7 @@ class CozytouchUnitSensor(CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         device_class: SensorDeviceClass,
         native_unit_of_measurement,
         display_factor: float | None = 1.0,
@@ -606,7 +634,7 @@ class CozytouchTimeSensor(CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         name: str | None = None,
         icon: str | None = None,
     ) -> None:
@@ -656,7 +684,7 @@ class CozytouchTimezoneSensor(CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         name: str | None = None,
         icon: str | None = None,
     ) -> None:
@@ -695,7 +723,7 @@ class CozytouchProgSensor(CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         name: str | None = None,
         icon: str | None = None,
     ) -> None:
@@ -739,7 +767,7 @@ class CozytouchProgTimeSensor(CozytouchSensor):
         capability,
         config_title: str,
         config_uniq_id: str,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         name: str | None = None,
         icon: str | None = None,
     ) -> None:
@@ -0,0 +1,41 @@
+"""Atlantic Cozytouch HTTP session."""
+
+from __future__ import annotations
+
+from aiohttp import ClientSession, TCPConnector
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.ssl import client_context
+
+from .const import DATA_SESSION, DOMAIN
+
+# All hubs talk to the same host, a few connections are enough
+SESSION_LIMIT_PER_HOST = 4
+SESSION_KEEPALIVE_TIMEOUT = 60
+SESSION_DNS_CACHE_TTL = 600
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> ClientSession:
+    """Get the HTTP session shared by all hubs, closed with Home Assistant."""
+    domainData = hass.data.setdefault(DOMAIN, {})
+    session = domainData.get(DATA_SESSION, None)
+    if session is not None and not session.closed:
+        return session
+
+    session = ClientSession(
+        connector=TCPConnector(
+            ssl=client_context(),
+            limit_per_host=SESSION_LIMIT_PER_HOST,
+            keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+        )
+    )
+    domainData[DATA_SESSION] = session
+
+    async def _async_close(_event: Event) -> None:
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return session
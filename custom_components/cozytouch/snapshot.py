@@ -0,0 +1,110 @@
+"""Atlantic Cozytouch capability snapshot."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+
+_MISSING = object()
+
+
+class CapabilitySnapshot(Mapping):
+    """Immutable capability values of an account.
+
+    Values are keyed by (deviceId, capabilityId). The generation is only
+    incremented when a value changed, so comparing generations is enough to
+    know if anything changed since a previous snapshot.
+    """
+
+    __slots__ = ("_devices", "_generation", "_values")
+
+    def __init__(
+        self,
+        values: dict[tuple[int, int], str],
+        devices: frozenset[int],
+        generation: int = 0,
+    ) -> None:
+        """Init snapshot, values are owned by the snapshot."""
+        self._values = values
+        self._devices = devices
+        self._generation = generation
+
+    @classmethod
+    def from_devices(
+        cls,
+        devices: list,
+        previous: CapabilitySnapshot | None = None,
+        overrides: dict[tuple[int, int], str] | None = None,
+    ) -> CapabilitySnapshot:
+        """Build a snapshot from the devices list, reuse previous if unchanged.
+
+        Overrides replace the values of existing capabilities, they are used
+        for writes not yet confirmed by a poll.
+        """
+        values = {
+            (dev["deviceId"], capability["capabilityId"]): capability["value"]
+            for dev in devices
+            for capability in dev["capabilities"]
+        }
+        if overrides:
+            for key, value in overrides.items():
+                if key in values:
+                    values[key] = value
+        deviceIds = frozenset(dev["deviceId"] for dev in devices)
+
+        if previous is None:
+            return cls(values, deviceIds)
+
+        if values == previous._values and deviceIds == previous._devices:
+            return previous
+
+        return cls(values, deviceIds, previous._generation + 1)
+
+    @property
+    def generation(self) -> int:
+        """Generation of the snapshot."""
+        return self._generation
+
+    def __getitem__(self, key: tuple[int, int]) -> str:
+        """Get value for a (deviceId, capabilityId) key."""
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate over (deviceId, capabilityId) keys."""
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        """Number of capability values."""
+        return len(self._values)
+
+    def has_device(self, deviceId: int) -> bool:
+        """Return True if the device is part of the snapshot."""
+        return deviceId in self._devices
+
+    def get_value(
+        self, deviceId: int, capabilityId: int, defaultIfNotExist: str | None = "0"
+    ) -> str | None:
+        """Get value for a device capability, None if the device is unknown."""
+        if deviceId not in self._devices:
+            return None
+
+        return self._values.get((deviceId, capabilityId), defaultIfNotExist)
+
+    def changes_since(
+        self, previous: CapabilitySnapshot | None
+    ) -> dict[int, set[int]] | None:
+        """Return the changed capabilities by device, None if everything changed."""
+        if previous is None or previous._devices != self._devices:
+            return None
+
+        changes: dict[int, set[int]] = {}
+        if previous is self:
+            return changes
+
+        for key, value in self._values.items():
+            if previous._values.get(key, _MISSING) != value:
+                changes.setdefault(key[0], set()).add(key[1])
+
+        for key in previous._values.keys() - self._values.keys():
+            changes.setdefault(key[0], set()).add(key[1])
+
+        return changes
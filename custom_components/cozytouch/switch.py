@@ -11,7 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
-from .hub import Hub
+from .hub import CozytouchDevice
 from .sensor import CozytouchSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,7 +36,7 @@ async def async_setup_entry(
 
     # Init switches
     switches = []
-    capabilities = hub.get_capabilities_for_device()
+    capabilities = hub.get_capabilities_for_device(("switch", "away_mode_switch"))
     for capability in capabilities:
         if capability["type"] == "switch":
             switches.append(
@@ -67,7 +67,7 @@ class CozytouchSwitch(SwitchEntity, CozytouchSensor):
 
     def __init__(
         self,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         capability,
         config_title: str,
         config_uniq_id: str,
@@ -125,7 +125,7 @@ class CozytouchAwayModeSwitch(SwitchEntity, CozytouchSensor):
 
     def __init__(
         self,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         capability,
         config_title: str,
         config_uniq_id: str,
@@ -144,8 +144,6 @@ class CozytouchAwayModeSwitch(SwitchEntity, CozytouchSensor):
         self._state = False
         self._attr_device_class = SwitchDeviceClass.SWITCH
 
-        self._nb_ignore = 0
-
         self._value_off = capability.get("value_off", "0")
         self._value_on = capability.get("value_on", "1")
         self._value_pending = capability.get("value_pending", "2")
@@ -153,13 +151,8 @@ class CozytouchAwayModeSwitch(SwitchEntity, CozytouchSensor):
     @property
     def is_on(self) -> bool:
         """Return the state."""
-        if self._nb_ignore > 0:
-            self._nb_ignore = self._nb_ignore - 1
-        else:
-            value = self.coordinator.get_capability_value(
-                self._capability["capabilityId"]
-            )
-            self._state = value is not None and value != self._value_off
+        value = self.coordinator.get_capability_value(self._capability["capabilityId"])
+        self._state = value is not None and value != self._value_off
 
         return self._state
 
@@ -179,8 +172,6 @@ class CozytouchAwayModeSwitch(SwitchEntity, CozytouchSensor):
             timestampStart = datetime.now(tz=dt_util.DEFAULT_TIME_ZONE).timestamp() + 60
             timestampEnd = timestampStart + (2 * 24 * 60 * 60)
 
-        self._nb_ignore = 5
-        self._state = True
         await self.coordinator.set_away_mode_timestamps(
             self._capability["capabilityId"],
             self._value_on,
@@ -188,13 +179,10 @@ class CozytouchAwayModeSwitch(SwitchEntity, CozytouchSensor):
             int(timestampStart),
             int(timestampEnd),
         )
-        self._nb_ignore = 1
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self):
         """Turn Off method."""
-        self._nb_ignore = 5
-        self._state = False
         await self.coordinator.set_away_mode_timestamps(
             self._capability["capabilityId"],
             self._value_off,
@@ -202,7 +190,6 @@ class CozytouchAwayModeSwitch(SwitchEntity, CozytouchSensor):
             None,
             None,
         )
-        self._nb_ignore = 1
         await self.coordinator.async_request_refresh()
 
     async def async_toggle(self) -> None:
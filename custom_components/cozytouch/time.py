@@ -11,7 +11,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .hub import Hub
+from .hub import CozytouchDevice
 from .sensor import CozytouchSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,7 +36,7 @@ async def async_setup_entry(
 
     # Init times
     times = []
-    capabilities = hub.get_capabilities_for_device()
+    capabilities = hub.get_capabilities_for_device(("time_adjustment",))
     for capability in capabilities:
         if capability["type"] == "time_adjustment":
             times.append(
@@ -58,7 +58,7 @@ class CozytouchTime(TimeEntity, CozytouchSensor):
 
     def __init__(
         self,
-        coordinator: Hub,
+        coordinator: CozytouchDevice,
         capability,
         config_title: str,
         config_uniq_id: str,
@@ -0,0 +1,52 @@
+"""Atlantic Cozytouch account topology index."""
+
+from __future__ import annotations
+
+# Tag of a master device naming one of its sub-devices
+TAG_CHILDREN = "iothubChildrenIds"
+
+
+class TopologyIndex:
+    """Find devices, zones and master devices of an account without scanning.
+
+    Devices are indexed by deviceId, zones by zoneId, and master devices by
+    the name of their sub-devices. The index is updated as devices are added
+    or removed, the device dicts are shared with the hub.
+    """
+
+    def __init__(self) -> None:
+        """Init empty index."""
+        self._devices: dict[int, dict] = {}
+        self._zones: dict[int, str] = {}
+        self._masters: dict[str, dict] = {}
+
+    def set_zones(self, zones: list) -> None:
+        """Index zones of the account."""
+        self._zones = {zone["id"]: zone["name"] for zone in zones if "id" in zone}
+
+    def add_device(self, device: dict) -> None:
+        """Index a new device."""
+        self._devices[device["deviceId"]] = device
+        for tag in device["tags"]:
+            if tag.get("label", None) == TAG_CHILDREN and "value" in tag:
+                self._masters[tag["value"]] = device
+
+    def remove_device(self, device: dict) -> None:
+        """Remove a device from the index."""
+        self._devices.pop(device["deviceId"], None)
+        for tag in device["tags"]:
+            if tag.get("label", None) == TAG_CHILDREN and "value" in tag:
+                if self._masters.get(tag["value"], None) is device:
+                    del self._masters[tag["value"]]
+
+    def get_device(self, deviceId: int) -> dict | None:
+        """Get a device, None if unknown."""
+        return self._devices.get(deviceId, None)
+
+    def get_zone_name(self, zoneId: int) -> str | None:
+        """Get the name of a zone, None if unknown."""
+        return self._zones.get(zoneId, None)
+
+    def get_master(self, childName: str) -> dict | None:
+        """Get the master device of a sub-device, None if it has none."""
+        return self._masters.get(childName, None)
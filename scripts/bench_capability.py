@@ -0,0 +1,93 @@
+"""Benchmark mapping the capabilities of a device.
+
+Compares the capability table with the if/elif chain it replaced, kept in
+capability_chain.py, on a device with 300 capabilities. The table maps the
+device at once, with a cold then a warm cache, and one capability at a time.
+
+Needs Home Assistant installed, run from the repository root:
+
+    python scripts/bench_capability.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import timeit
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from custom_components.cozytouch import capability  # noqa: E402
+from custom_components.cozytouch.model import get_model_infos  # noqa: E402
+
+# Next to this script
+import capability_chain as old  # noqa: E402
+
+MODEL_ID = 56
+CAPABILITIES = 300
+RUNS = 50
+
+
+def make_capabilities() -> list[dict]:
+    """Get the capabilities of a device, known ones then unknown ones."""
+    capabilityIds = sorted({*capability.CLIMATE_CAPABILITIES, *capability.CAPABILITIES})
+    capabilityIds = capabilityIds[:CAPABILITIES]
+    capabilityId = 100000
+    while len(capabilityIds) < CAPABILITIES:
+        capabilityIds.append(capabilityId)
+        capabilityId += 1
+    return [
+        {"capabilityId": capabilityId, "value": "20"} for capabilityId in capabilityIds
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    modelInfos = get_model_infos(MODEL_ID)
+    capabilities = make_capabilities()
+
+    def map_old() -> None:
+        for device_capability in capabilities:
+            old.get_capability_infos(
+                modelInfos, device_capability["capabilityId"], device_capability["value"]
+            )
+
+    def map_new() -> None:
+        capability.get_device_capability_infos(modelInfos, capabilities)
+
+    def map_new_cold() -> None:
+        capability._capability_infos_cache.clear()
+        map_new()
+
+    def map_new_single() -> None:
+        for device_capability in capabilities:
+            capability.get_capability_infos(
+                modelInfos, device_capability["capabilityId"], device_capability["value"]
+            )
+
+    # Both must describe the capabilities the same way
+    for device_capability, infos in zip(
+        capabilities,
+        capability.get_device_capability_infos(modelInfos, capabilities),
+        strict=True,
+    ):
+        assert old.get_capability_infos(
+            modelInfos, device_capability["capabilityId"], device_capability["value"]
+        ) == (None if infos is None else dict(infos)), device_capability
+
+    print(f"Mapping {CAPABILITIES} capabilities of model {MODEL_ID}")
+    results = {}
+    for name, function in (
+        ("if/elif", map_old),
+        ("table", map_new_cold),
+        ("table, cached", map_new),
+        ("one by one", map_new_single),
+    ):
+        results[name] = min(timeit.repeat(function, number=1, repeat=RUNS))
+        speedup = results["if/elif"] / results[name]
+        print(f"{name:15}{results[name] * 1e6:>9.0f} us{speedup:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
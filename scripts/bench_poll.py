@@ -0,0 +1,126 @@
+"""Benchmark the allocations and CPU time of a poll.
+
+Compares the hub processing a polled setup with the deep copy of the
+payload done before (copy of the capabilities of each device) and without
+it. The payload has one device with 200 capabilities.
+
+Needs Home Assistant installed, run from the repository root:
+
+    python scripts/bench_poll.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.cozytouch.hub import Hub  # noqa: E402
+
+CAPABILITIES = 200
+POLLS = 2000
+
+
+def make_payload(offset: int) -> bytes:
+    """Get the JSON of a setup with one device, as sent by the API."""
+    return json.dumps(
+        [
+            {
+                "id": 1,
+                "zones": [{"id": 1, "name": "Zone"}],
+                "devices": [
+                    {
+                        "deviceId": 1,
+                        "name": "Device",
+                        "gatewaySerialNumber": "SN",
+                        "modelId": 56,
+                        "productId": 1,
+                        "zoneId": 1,
+                        "tags": [{"label": "tag", "value": "value"}],
+                        "capabilities": [
+                            {
+                                "capabilityId": capabilityId,
+                                "name": "capability",
+                                "value": str(capabilityId + offset),
+                                "timestamp": 1700000000 + offset,
+                            }
+                            for capabilityId in range(CAPABILITIES)
+                        ],
+                    }
+                ],
+            }
+        ]
+    ).encode()
+
+
+def poll_before(hub: Hub, payload: bytes) -> None:
+    """Poll as before, the capabilities were copied from the payload."""
+    json_data = json.loads(payload)
+    for device in json_data[0]["devices"]:
+        device["capabilities"] = copy.deepcopy(device["capabilities"])
+        device["tags"] = copy.deepcopy(device["tags"])
+    hub.update_devices_from_json_data(json_data)
+
+
+def poll_after(hub: Hub, payload: bytes) -> None:
+    """Poll as now, the hub owns the payload."""
+    hub.update_devices_from_json_data(json.loads(payload))
+
+
+def measure(hub: Hub, poll, payloads: list[bytes]) -> tuple[float, float, float]:
+    """Get the mean CPU time, allocated blocks and peak memory of a poll."""
+    for payload in payloads:
+        poll(hub, payload)
+
+    start = time.process_time()
+    for i in range(POLLS):
+        poll(hub, payloads[i % len(payloads)])
+    cpuTime = (time.process_time() - start) / POLLS
+
+    tracemalloc.start()
+    blocks = 0
+    peak = 0
+    for i in range(100):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        snapshot = tracemalloc.take_snapshot()
+        poll(hub, payloads[i % len(payloads)])
+        stats = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+        blocks += sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+        peak += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    return cpuTime, blocks / 100, peak / 100
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as configDir:
+        hass = HomeAssistant(configDir)
+        hub = Hub(hass, "benchmark", "benchmark")
+        # Values change on every poll, as the snapshot is reused otherwise
+        payloads = [make_payload(0), make_payload(1)]
+
+        print(f"Poll of a device with {CAPABILITIES} capabilities")
+        print(f"{'':8}{'CPU time':>12}{'new blocks':>12}{'peak memory':>14}")
+        for name, poll in (("before", poll_before), ("after", poll_after)):
+            cpuTime, blocks, peak = measure(hub, poll, payloads)
+            print(
+                f"{name:8}{cpuTime * 1e6:>9.0f} us{blocks:>12.0f}{peak / 1024:>11.0f} kB"
+            )
+
+        await hub.close()
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+"""Benchmark the account topology lookups.
+
+Compares the scans of the devices list done before with the topology index,
+resolving the device, master device and zone of every device of a synthetic
+account, and times a refresh of the hub from its setup. Accounts have up to
+500 devices, one in five being the master of the next one.
+
+Needs Home Assistant installed, run from the repository root:
+
+    python scripts/bench_topology.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.cozytouch.hub import Hub  # noqa: E402
+from custom_components.cozytouch.topology import (  # noqa: E402
+    TAG_CHILDREN,
+    TopologyIndex,
+)
+
+SIZES = (100, 250, 500)
+ZONES = 50
+RUNS = 5
+
+
+def make_setup(size: int) -> list:
+    """Get the setup of an account with size devices, as sent by the API."""
+    devices = []
+    for deviceId in range(size):
+        tags = []
+        if deviceId % 5 == 0:
+            tags.append({"label": TAG_CHILDREN, "value": f"Device {deviceId + 1}"})
+        devices.append(
+            {
+                "deviceId": deviceId,
+                "name": f"Device {deviceId}",
+                "gatewaySerialNumber": f"SN{deviceId}",
+                "modelId": 56,
+                "productId": 1,
+                "zoneId": deviceId % ZONES,
+                "tags": tags,
+                "capabilities": [
+                    {"capabilityId": capabilityId, "value": "0"}
+                    for capabilityId in (40, 117, 160, 161)
+                ],
+            }
+        )
+
+    zones = [{"id": zoneId, "name": f"Zone {zoneId}"} for zoneId in range(ZONES)]
+    return [{"id": 1, "zones": zones, "devices": devices}]
+
+
+def lookup_scan(setup: list) -> None:
+    """Resolve every device by scanning the lists, as done before."""
+    devices = setup[0]["devices"]
+    zones = setup[0]["zones"]
+    for remote_device in devices:
+        for dev in devices:
+            if dev["deviceId"] == remote_device["deviceId"]:
+                break
+
+        zoneId = dev["zoneId"]
+        for masterDev in devices:
+            for tag in masterDev["tags"]:
+                if tag.get("label") == TAG_CHILDREN and tag.get("value") == dev["name"]:
+                    zoneId = masterDev["zoneId"]
+                    break
+
+        for zone in zones:
+            if zone["id"] == zoneId:
+                break
+
+
+def lookup_index(setup: list) -> None:
+    """Resolve every device with the topology index, built from the setup."""
+    topology = TopologyIndex()
+    topology.set_zones(setup[0]["zones"])
+    for device in setup[0]["devices"]:
+        topology.add_device(device)
+
+    for remote_device in setup[0]["devices"]:
+        dev = topology.get_device(remote_device["deviceId"])
+        master = topology.get_master(dev["name"])
+        zoneId = dev["zoneId"] if master is None else master["zoneId"]
+        topology.get_zone_name(zoneId)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as configDir:
+        hass = HomeAssistant(configDir)
+
+        print(f"{'devices':>8}{'scan':>12}{'index':>12}{'hub refresh':>14}")
+        for size in SIZES:
+            setup = make_setup(size)
+            scan = min(timeit.repeat(lambda: lookup_scan(setup), number=1, repeat=RUNS))
+            index = min(
+                timeit.repeat(lambda: lookup_index(setup), number=1, repeat=RUNS)
+            )
+
+            # Every refresh after the first matches the polled devices to known ones
+            hub = Hub(hass, f"benchmark{size}", "benchmark")
+            hub.update_devices_from_json_data(make_setup(size))
+            polled = make_setup(size)
+            refresh = min(
+                timeit.repeat(
+                    lambda: hub.update_devices_from_json_data(polled),
+                    number=1,
+                    repeat=RUNS,
+                )
+            )
+            await hub.close()
+
+            print(
+                f"{size:>8}{scan * 1e3:>9.2f} ms{index * 1e3:>9.2f} ms"
+                f"{refresh * 1e3:>11.2f} ms"
+            )
+
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1 @@
+"""Tests for the Atlantic Cozytouch integration."""
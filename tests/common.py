@@ -0,0 +1,26 @@
+"""Helpers for Atlantic Cozytouch tests."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.cozytouch.const import DOMAIN
+
+USERNAME = "user@example.com"
+
+
+def create_entry(deviceId: int = 1) -> MockConfigEntry:
+    """Create the config entry of a device of the test account."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=f"Device {deviceId}",
+        unique_id=f"cozytouch_{deviceId}",
+        data={
+            "username": USERNAME,
+            "password": "password",
+            "deviceId": deviceId,
+            "name": f"Device {deviceId}",
+            "create_unknown": False,
+            "dump_json": False,
+        },
+    )
@@ -0,0 +1,152 @@
+"""Fixtures for Atlantic Cozytouch tests.
+
+Tests run with pytest-homeassistant-custom-component, against a local
+server answering like the Cozytouch API:
+
+    pip install -r requirements_test.txt
+    pytest
+"""
+
+from __future__ import annotations
+
+from time import monotonic
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from custom_components.cozytouch import auth, hub
+
+
+class StubApi:
+    """Local server answering like the Cozytouch API for two devices."""
+
+    def __init__(self) -> None:
+        """Init server, not started."""
+        # While down, every request is answered with 503
+        self.down = False
+        # Reject the grants of every login
+        self.reject_login = False
+        self.requests: list[str] = []
+        # Capability values by device ID
+        self.values = {
+            1: {40: "20", 117: "19.5"},
+            2: {40: "21", 117: "18.5"},
+        }
+        # Delay before the devices apply a written value, in seconds
+        self.apply_delay = 0.0
+        # Written (deviceId, capabilityId, value) and time applied, by execution ID
+        self.executions: dict[int, tuple[int, int, str, float]] = {}
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/users/token", self._token)
+        app.router.add_get("/magellan/cozytouch/setupviewv2", self._setup)
+        app.router.add_get("/magellan/capabilities/", self._capabilities)
+        app.router.add_get("/magellan/refs/countries", self._countries)
+        app.router.add_post(
+            "/magellan/executions/writecapability", self._write_capability
+        )
+        app.router.add_get("/magellan/executions/{executionId}", self._execution)
+        self.server = TestServer(app)
+
+    @property
+    def open_connections(self) -> int:
+        """Number of connections currently open to the server."""
+        return len(self.server.runner.server.connections)
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.Response:
+        self.requests.append(request.path)
+        if self.down:
+            return web.Response(status=503)
+        self._apply_writes()
+        return await handler(request)
+
+    def _apply_writes(self) -> None:
+        now = monotonic()
+        for deviceId, capabilityId, value, appliedAt in self.executions.values():
+            if appliedAt <= now:
+                self.values[deviceId][capabilityId] = value
+
+    async def _token(self, request: web.Request) -> web.Response:
+        if self.reject_login:
+            return web.json_response({"error": "invalid_grant"}, status=400)
+        return web.json_response(
+            {
+                "token_type": "bearer",
+                "access_token": "token",
+                "refresh_token": "refresh",
+                "expires_in": 3600,
+            }
+        )
+
+    def _get_capabilities(self, deviceId: int) -> list:
+        return [
+            {"capabilityId": capabilityId, "value": value}
+            for capabilityId, value in self.values[deviceId].items()
+        ]
+
+    async def _setup(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            [
+                {
+                    "id": 1,
+                    "address": {"country": "FR"},
+                    "zones": [{"id": 1, "name": "Zone"}],
+                    "devices": [
+                        {
+                            "deviceId": deviceId,
+                            "name": f"Device {deviceId}",
+                            "gatewaySerialNumber": f"SN{deviceId}",
+                            "modelId": 56,
+                            "productId": 1,
+                            "zoneId": 1,
+                            "tags": [],
+                            "capabilities": self._get_capabilities(deviceId),
+                        }
+                        for deviceId in self.values
+                    ],
+                }
+            ]
+        )
+
+    async def _capabilities(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            self._get_capabilities(int(request.query["deviceId"]))
+        )
+
+    async def _countries(self, request: web.Request) -> web.Response:
+        return web.json_response([])
+
+    async def _write_capability(self, request: web.Request) -> web.Response:
+        write = await request.json()
+        executionId = len(self.executions) + 1
+        self.executions[executionId] = (
+            write["deviceId"],
+            write["capabilityId"],
+            write["value"],
+            monotonic() + self.apply_delay,
+        )
+        return web.json_response(executionId, status=201)
+
+    async def _execution(self, request: web.Request) -> web.Response:
+        appliedAt = self.executions[int(request.match_info["executionId"])][3]
+        # In progress, then completed
+        return web.json_response({"state": 3 if appliedAt <= monotonic() else 2})
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from custom_components."""
+    yield
+
+
+@pytest.fixture
+async def stub_api(monkeypatch, socket_enabled):
+    """Start a local Cozytouch API and send the requests of the hubs to it."""
+    api = StubApi()
+    await api.server.start_server()
+    url = str(api.server.make_url("")).rstrip("/")
+    monkeypatch.setattr(hub, "COZYTOUCH_ATLANTIC_API", url)
+    monkeypatch.setattr(auth, "COZYTOUCH_ATLANTIC_API", url)
+    yield api
+    await api.server.close()
@@ -0,0 +1,32 @@
+"""Test the Atlantic Cozytouch binary sensors."""
+
+from __future__ import annotations
+
+from custom_components.cozytouch.breaker import BREAKER_FAILURE_THRESHOLD
+from custom_components.cozytouch.const import DATA_HUBS, DOMAIN
+
+from .common import USERNAME, create_entry
+
+
+async def test_circuit_breaker_opens_during_outage(hass, stub_api) -> None:
+    """The circuit breaker entity is on once failures open the circuit."""
+    entry = create_entry()
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    entityId = "binary_sensor.device_1_cozytouch_circuit_breaker"
+    assert hass.states.get(entityId).state == "off"
+
+    # The device stays available with its last values while the circuit opens
+    stub_api.down = True
+    theHub = hass.data[DOMAIN][DATA_HUBS][USERNAME]
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        await theHub.async_refresh()
+        await hass.async_block_till_done()
+
+    state = hass.states.get(entityId)
+    assert state.state == "on"
+    assert state.attributes["failures"] == BREAKER_FAILURE_THRESHOLD
+    assert state.attributes["retry_at"] is not None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,76 @@
+"""Test the Atlantic Cozytouch hub."""
+
+from __future__ import annotations
+
+from custom_components.cozytouch.breaker import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_OPEN,
+)
+from custom_components.cozytouch.const import DATA_HUBS, DOMAIN
+
+from .common import USERNAME, create_entry
+
+TOKEN_PATH = "/users/token"
+SETUP_PATH = "/magellan/cozytouch/setupviewv2"
+EXECUTION_PATH = "/magellan/executions/"
+WRITE_PATH = EXECUTION_PATH + "writecapability"
+
+
+async def test_rejected_login_sends_no_request(hass, stub_api) -> None:
+    """Polls without a token only login, and back off once logins keep failing."""
+    entry = create_entry()
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    # Password changed and token revoked
+    theHub = hass.data[DOMAIN][DATA_HUBS][USERNAME]
+    theHub._auth._access_token = None
+    stub_api.reject_login = True
+    stub_api.requests.clear()
+
+    await theHub.async_refresh()
+    # Refresh grant, then password grant
+    assert stub_api.requests == [TOKEN_PATH, TOKEN_PATH]
+    assert not theHub.online
+
+    stub_api.requests.clear()
+    for _ in range(BREAKER_FAILURE_THRESHOLD - 1):
+        await theHub.async_refresh()
+    assert stub_api.requests == [TOKEN_PATH] * (BREAKER_FAILURE_THRESHOLD - 1)
+    assert theHub.get_circuit_breaker_diagnostics()["state"] == BREAKER_OPEN
+
+    stub_api.requests.clear()
+    await theHub.async_refresh()
+    assert stub_api.requests == []
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_poll_confirms_concurrent_writes(hass, stub_api) -> None:
+    """A burst poll confirms a batch of writes before their executions are read."""
+    capabilityIds = range(900, 910)
+    stub_api.values[1].update({capabilityId: "0" for capabilityId in capabilityIds})
+    stub_api.apply_delay = 2.0
+    entry = create_entry()
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    theHub = hass.data[DOMAIN][DATA_HUBS][USERNAME]
+    stub_api.requests.clear()
+    results = await theHub.set_capability_values(
+        1, [(capabilityId, "1") for capabilityId in capabilityIds]
+    )
+    assert results == {capabilityId: True for capabilityId in capabilityIds}
+
+    writes = stub_api.requests.count(WRITE_PATH)
+    checks = sum(
+        path.startswith(EXECUTION_PATH) and path != WRITE_PATH
+        for path in stub_api.requests
+    )
+    assert (writes, checks) == (10, 0)
+    # Only burst polls after the writes
+    assert set(stub_api.requests[writes:]) == {SETUP_PATH}
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
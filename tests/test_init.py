@@ -0,0 +1,109 @@
+"""Test the setup of Atlantic Cozytouch config entries."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util, slugify
+
+from custom_components.cozytouch.const import (
+    CONF_POLL_INTERVAL_MAX,
+    CONF_STALE_THRESHOLD,
+    DATA_HUBS,
+    DOMAIN,
+    POLL_INTERVAL_MAX,
+)
+
+from .common import USERNAME, create_entry
+
+
+async def test_reload_keeps_polling_other_devices(hass, stub_api) -> None:
+    """Reloading the entry which created the account hub keeps polling the others."""
+    entries = [create_entry(1), create_entry(2)]
+    for entry in entries:
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_reload(entries[0].entry_id)
+    await hass.async_block_till_done()
+
+    stub_api.values[2][117] = "17.5"
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=POLL_INTERVAL_MAX + 1)
+    )
+    await hass.async_block_till_done()
+
+    registry = er.async_get(hass)
+    states = [
+        hass.states.get(registryEntry.entity_id).state
+        for registryEntry in er.async_entries_for_config_entry(
+            registry, entries[1].entry_id
+        )
+    ]
+    assert "17.5" in states
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_remove_last_entry_removes_stored_data(
+    hass, hass_storage, stub_api
+) -> None:
+    """Tokens and topology of an account are removed with its last device."""
+    entries = [create_entry(1), create_entry(2)]
+    for entry in entries:
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    # Write the delayed save of the topology
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+
+    storageKeys = (
+        f"{DOMAIN}.token.{slugify(USERNAME)}",
+        f"{DOMAIN}.topology.{slugify(USERNAME)}",
+    )
+    await hass.config_entries.async_remove(entries[0].entry_id)
+    await hass.async_block_till_done()
+    assert all(key in hass_storage for key in storageKeys)
+
+    await hass.config_entries.async_remove(entries[1].entry_id)
+    await hass.async_block_till_done()
+    assert not any(key in hass_storage for key in storageKeys)
+
+
+async def test_options_update_the_account_hub(hass, stub_api) -> None:
+    """Options of a device apply to the live hub, including turned off ones."""
+    entries = [create_entry(1), create_entry(2)]
+    for entry in entries:
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    theHub = hass.data[DOMAIN][DATA_HUBS][USERNAME]
+    entry = entries[0]
+
+    for dumpJson in (True, False):
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={
+                "create_unknown": False,
+                "dump_json": dumpJson,
+                CONF_POLL_INTERVAL_MAX: 900,
+                CONF_STALE_THRESHOLD: 60,
+            },
+        )
+        await hass.async_block_till_done()
+
+        assert hass.data[DOMAIN][DATA_HUBS][USERNAME] is theHub
+        assert theHub._dump_json is dumpJson
+        assert theHub._poll_interval_max == 900
+        assert theHub._stale_threshold == 60
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,45 @@
+"""Test reloading Atlantic Cozytouch config entries."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.cozytouch.const import DATA_SESSION, DOMAIN
+from custom_components.cozytouch.session import SESSION_LIMIT_PER_HOST
+
+RELOADS = 100
+
+
+async def test_reload_does_not_leak_connections(hass, stub_api) -> None:
+    """Connections stay flat while an entry is set up and unloaded repeatedly."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Device",
+        unique_id="cozytouch_1",
+        data={
+            "username": "user@example.com",
+            "password": "password",
+            "deviceId": 1,
+            "name": "Device",
+            "create_unknown": False,
+            "dump_json": False,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    session = None
+    openConnections = []
+    for _ in range(RELOADS):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        if session is None:
+            session = hass.data[DOMAIN][DATA_SESSION]
+        assert hass.data[DOMAIN][DATA_SESSION] is session
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+        openConnections.append(stub_api.open_connections)
+
+    assert not session.closed
+    assert max(openConnections) <= SESSION_LIMIT_PER_HOST
+    assert openConnections[-1] <= openConnections[0]